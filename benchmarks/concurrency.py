@@ -0,0 +1,53 @@
+"""
+Simulates a crawl against a server that throttles above its capacity, with fixed concurrency and with the AIMD
+limiter
+
+Run from the repository root: python -m benchmarks.concurrency
+"""
+import asyncio
+import statistics
+import time
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+from src.async_faceit_api.concurrency import AdaptiveLimiter
+from src.async_faceit_api.retry import RetryPolicy
+
+REQUESTS = 8000
+CAPACITY = 48
+LATENCY = 0.02
+
+
+async def run(name: str, concurrency: int, limiter: AdaptiveLimiter = None):
+    async with MockServer(latency=LATENCY, capacity=CAPACITY) as server:
+        async with FaceitAPI('key', base_url=server.base_url, retry_policy=RetryPolicy(max_attempts=5),
+                             concurrency_limiter=limiter) as api:
+            limits = []
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(i: int):
+                async with semaphore:
+                    await api.match(f'1-{i}')
+                    if limiter is not None:
+                        limits.append(limiter.limit)
+
+            start = time.perf_counter()
+            await asyncio.gather(*[fetch(i) for i in range(REQUESTS)])
+            elapsed = time.perf_counter() - start
+            retries = sum(api.retry_policy.retries.values())
+    limit = f'{statistics.mean(limits):>6.1f}' if limits else f'{"-":>6}'
+    print(f'{name:<12} {REQUESTS / elapsed:>8.0f} req/s   429 {server.throttled:>6}   retries {retries:>6}   '
+          f'mean limit {limit}')
+
+
+async def main():
+    print(f'server capacity {CAPACITY} requests at once')
+    for concurrency in (8, 32, 64, 256):
+        await run(f'fixed {concurrency}', concurrency)
+    limiter = AdaptiveLimiter(initial=8)
+    await run('adaptive', REQUESTS, limiter)
+    print(limiter)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,31 @@
+"""
+Compares creating the items of 100 item collections with ``cls(**data)`` and with the generated constructors
+
+Run from the repository root: python -m benchmarks.constructors
+"""
+import timeit
+
+from benchmarks import payloads
+from src.async_faceit_api.dataclasses import Match, Member, PlayerMatch, Ranking
+from src.async_faceit_api.registry import constructor
+
+ITEMS = 100
+
+
+def main():
+    collections = {
+        'player_history': (PlayerMatch, [payloads.player_match() for _ in range(ITEMS)]),
+        'hub_matches': (Match, [payloads.match() for _ in range(ITEMS)]),
+        'hub_members': (Member, [payloads.member() for _ in range(ITEMS)]),
+        'ranking': (Ranking, [payloads.rank(i) for i in range(ITEMS)]),
+    }
+    print(f'{"collection":<16} {"cls(**data)":>12} {"from_dict":>12} {"speedup":>8}')
+    for name, (cls, items) in collections.items():
+        from_dict = constructor(cls)
+        init = min(timeit.repeat(lambda: [cls(**x) for x in items], number=100, repeat=20)) / 100
+        generated = min(timeit.repeat(lambda: [from_dict(x) for x in items], number=100, repeat=20)) / 100
+        print(f'{name:<16} {init * 1e6:>10.1f}us {generated * 1e6:>10.1f}us {init / generated:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
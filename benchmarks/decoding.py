@@ -0,0 +1,30 @@
+"""
+Compares the available json decoders on payloads shaped like the FACEIT responses
+
+Run from the repository root: python -m benchmarks.decoding
+"""
+import json
+import timeit
+
+from benchmarks import payloads
+from src.async_faceit_api.decoder import DECODERS
+
+PAYLOADS = {
+    'player': payloads.player(),
+    'match': payloads.match(),
+    'match_stats': payloads.match_stats(maps=3),
+    'hub_stats': payloads.hub_stats(),
+    'player_history': {'items': [payloads.player_match() for _ in range(100)], 'start': 0, 'end': 100},
+}
+
+
+def main():
+    print(f'{"payload":<16} {"size":>8} ' + ' '.join(f'{name:>10}' for name in DECODERS))
+    for name, payload in PAYLOADS.items():
+        body = json.dumps(payload).encode()
+        times = [min(timeit.repeat(lambda: decode(body), number=20, repeat=10)) / 20 for decode in DECODERS.values()]
+        print(f'{name:<16} {len(body) / 1024:>6.1f}kB ' + ' '.join(f'{t * 1e6:>8.1f}us' for t in times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures the import time of the package with ``python -X importtime`` and guards it against regressions
+
+The client has to be importable without aiohttp, sqlite3, the email package, the json decoders and the generator of
+the model constructors, they are imported on first use, and without creating the ``Country`` enum. The script exits
+with status 1 if one of them is imported or if the package's own modules take longer than the budget.
+
+Run from the repository root: python -m benchmarks.importtime [--budget MILLISECONDS]
+"""
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+PACKAGE = 'src.async_faceit_api'
+RUNS = 7
+DEFERRED = ('aiohttp', 'sqlite3', 'email', 'orjson', 'msgspec')
+"""Modules that must not be imported by importing the client"""
+DEFERRED_MODULES = (f'{PACKAGE}.registry',)
+"""Modules of the package that must not be imported by importing the client"""
+
+CHECK = f'''
+import sys
+import {PACKAGE}.api
+enums = sys.modules['{PACKAGE}.enums']
+print('Country' in vars(enums))
+print(' '.join(sys.modules))
+'''
+
+
+def measure(code: str) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """Import in a fresh interpreter, returns the self and cumulative microseconds by module and the stdout lines"""
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                             check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times, process.stdout.splitlines()
+
+
+def best(code: str) -> Dict[str, Tuple[int, int]]:
+    # the fastest of several runs, the others are slowed down by the file system cache or other processes
+    runs = [measure(code)[0] for _ in range(RUNS)]
+    return min(runs, key=lambda times: sum(times[name][0] for name in times if name.startswith(PACKAGE)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget', type=float, default=15.0,
+                        help='milliseconds the modules of the package may take, excluding their dependencies')
+    args = parser.parse_args()
+    # measure with bytecode caches like an installed package, even if PYTHONDONTWRITEBYTECODE is set
+    compileall.compile_dir(os.path.join(*PACKAGE.split('.')), quiet=1)
+
+    failures = []
+    for code in (f'import {PACKAGE}', f'import {PACKAGE}.api', 'import aiohttp'):
+        times = best(code)
+        total = max(cumulative for _, cumulative in times.values())
+        own = sum(self_us for name, (self_us, _) in times.items() if name.startswith(PACKAGE))
+        print(f'{code:<32} {total / 1000:>8.1f}ms total {own / 1000:>8.1f}ms package')
+        if code == f'import {PACKAGE}.api':
+            for name, (self_us, cumulative) in sorted(times.items(), key=lambda x: -x[1][1])[:10]:
+                print(f'    {name:<40} {cumulative / 1000:>8.1f}ms')
+            if own / 1000 > args.budget:
+                failures.append(f'the package took {own / 1000:.1f}ms, the budget is {args.budget:.1f}ms')
+
+    _, (country, modules) = measure(CHECK)
+    imported = sorted({name for name in modules.split()
+                       if name.split('.')[0] in DEFERRED or name in DEFERRED_MODULES})
+    if imported:
+        failures.append(f'importing the client imported {", ".join(imported)}')
+    if country == 'True':
+        failures.append('importing the client created the Country enum')
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
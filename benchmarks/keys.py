@@ -0,0 +1,40 @@
+"""
+Measures how the throughput of a crawl scales with the number of api keys, on a server with a quota per key
+
+Run from the repository root: python -m benchmarks.keys
+"""
+import asyncio
+import time
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+from src.async_faceit_api.ratelimit import RateLimiter
+from src.async_faceit_api.retry import RetryPolicy
+
+QUOTA = 100
+SECONDS = 3
+
+
+async def main():
+    print(f'{"keys":>4} {"req/s":>8} {"429":>6}  requests per key')
+    for keys in (1, 2, 4, 8):
+        async with MockServer(latency=0.005, key_quota=QUOTA) as server:
+            tokens = [f'key-{i}' for i in range(keys)]
+            async with FaceitAPI(tokens, base_url=server.base_url, rate_limiter=RateLimiter(rate=QUOTA),
+                                 retry_policy=RetryPolicy()) as api:
+                requests = QUOTA * keys * SECONDS
+                semaphore = asyncio.Semaphore(64)
+
+                async def fetch(i: int):
+                    async with semaphore:
+                        return await api.match(f'1-{i}')
+
+                start = time.perf_counter()
+                await asyncio.gather(*[fetch(i) for i in range(requests)])
+                elapsed = time.perf_counter() - start
+                print(f'{keys:>4} {requests / elapsed:>8.0f} {server.throttled:>6}  '
+                      f'{sorted(key.requests for key in api.keys)}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""
+Compares building large responses eagerly against building them lazily and reading a few fields
+
+Run from the repository root: python -m benchmarks.lazy
+"""
+import timeit
+
+from benchmarks import payloads
+from src.async_faceit_api.dataclasses import Brackets, GameStats, MatchStats
+
+REPEAT = 20
+
+
+def touch_brackets(brackets: Brackets):
+    return brackets.name, brackets.matches[-1].results.winner
+
+
+def touch_hub_stats(stats: GameStats):
+    return stats.players[0].stats['Kills']
+
+
+def touch_match_stats(stats: MatchStats):
+    return stats.rounds[0].round_stats['Map'], stats.rounds[0].teams[0].team_stats['Final Score']
+
+
+def main():
+    print(f'{"payload":<14} {"eager":>10} {"lazy":>10} {"lazy+read":>10}')
+    for name, cls, payload, touch in (('brackets', Brackets, payloads.brackets(), touch_brackets),
+                                      ('hub_stats', GameStats, payloads.hub_stats(), touch_hub_stats),
+                                      ('match_stats', MatchStats, payloads.match_stats(maps=5), touch_match_stats)):
+        eager = min(timeit.repeat(lambda: cls(**payload), number=10, repeat=REPEAT)) / 10
+        lazy = min(timeit.repeat(lambda: cls.lazy(payload), number=10, repeat=REPEAT)) / 10
+        read = min(timeit.repeat(lambda: touch(cls.lazy(payload)), number=10, repeat=REPEAT)) / 10
+        print(f'{name:<14} {eager * 1e6:>8.1f}us {lazy * 1e6:>8.1f}us {read * 1e6:>8.1f}us')
+
+
+if __name__ == '__main__':
+    main()
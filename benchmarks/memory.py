@@ -0,0 +1,68 @@
+"""
+Compares the memory per object of the slotted models against models keeping their fields in a ``__dict__``
+
+Run from the repository root: python -m benchmarks.memory
+"""
+import gc
+import json
+import tracemalloc
+
+from benchmarks import payloads
+from src.async_faceit_api.dataclasses import FaceitApiResponse, Match, MatchStats, Player, PlayerMatch
+from src.async_faceit_api.identity import IdentityMap
+
+OBJECTS = 10_000
+
+
+class Legacy:
+    """A response keeping its fields in a ``__dict__``, like the models did before they had slots"""
+
+
+def legacy(value):
+    if isinstance(value, list):
+        return [legacy(x) for x in value]
+    if not isinstance(value, FaceitApiResponse):
+        return value
+    obj = Legacy()
+    obj._FaceitApiResponse__success = bool(value)
+    for cls in type(value).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name not in ('__success', '_extra', '_raw', '__weakref__'):
+                setattr(obj, name, legacy(getattr(value, name)))
+    for name, item in value.extra.items():
+        setattr(obj, name, item)
+    return obj
+
+
+def measure(build, sources: list) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(x) for x in sources]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / len(sources)
+
+
+def main():
+    print(f'{"model":<12} {"__dict__":>10} {"__slots__":>10} {"saved":>8}')
+    for cls, payload in ((Match, payloads.match), (PlayerMatch, payloads.player_match),
+                         (Player, payloads.player), (MatchStats, payloads.match_stats)):
+        sources = [payload() for _ in range(OBJECTS)]
+        slotted = measure(lambda x: cls(**x), sources)
+        objects = [cls(**x) for x in sources]
+        before = measure(legacy, objects)
+        print(f'{cls.__name__:<12} {before:>9.0f}B {slotted:>9.0f}B {1 - slotted / before:>7.0%}')
+
+    # the ids of a crawl repeat, e.g. the players of a team show up in all of its matches
+    roster = payloads.player_match()
+    bodies = [json.dumps({**payloads.player_match(), 'teams': roster['teams'],
+                          'playing_players': roster['playing_players']}).encode() for _ in range(OBJECTS)]
+    plain = measure(lambda body: PlayerMatch(**json.loads(body)), bodies)
+    interned = measure(lambda body: PlayerMatch(**IdentityMap.intern(json.loads(body))), bodies)
+    print(f'\n{"decoded":<12} {"plain":>10} {"interned":>10} {"saved":>8}')
+    print(f'{"PlayerMatch":<12} {plain:>9.0f}B {interned:>9.0f}B {1 - interned / plain:>7.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""
+Local aiohttp server answering like the FACEIT data api, used by the benchmarks
+"""
+import asyncio
+import time
+
+from aiohttp import web
+
+from benchmarks import payloads
+
+
+class MockServer:
+    def __init__(self, latency: float = 0.0, collection_size: int = 250, match_interval: int = 6 * 3600,
+                 key_quota: int = None, capacity: int = None, failures: int = 0, failure_status: int = 503,
+                 failure_retry_after: str = None):
+        """
+        :param latency: Seconds every response is delayed
+        :type latency: float, optional
+        :param key_quota: Requests per second and api key, further requests are answered with 429
+        :type key_quota: int, optional
+        :param capacity: Requests the server handles at once, further requests are answered with 429. The latency
+            grows with the load, up to twice the latency at full capacity
+        :type capacity: int, optional
+        :param failures: Number of first requests answered with ``failure_status`` and an empty json body
+        :type failures: int, optional
+        :param failure_status: Status code of the failed requests
+        :type failure_status: int, optional
+        :param failure_retry_after: ``Retry-After`` header of the failed requests
+        :type failure_retry_after: str, optional
+        :param collection_size: Number of items of every paginated collection
+        :type collection_size: int, optional
+        :param match_interval: Seconds between two matches in the history of a player
+        :type match_interval: int, optional
+        """
+        self.latency = latency
+        self.collection_size = collection_size
+        self.match_interval = match_interval
+        self.last_match_at = int(time.time()) - 3600
+        """Start of the newest match in the history, the history holds ``collection_size`` matches"""
+        self.requests = 0
+        self.not_modified = 0
+        """Conditional requests answered with 304 Not Modified"""
+        self.hub_version = 0
+        """Part of the ETag of the hubs, incrementing it modifies all hubs"""
+        self.key_quota = key_quota
+        self.capacity = capacity
+        self.failures = failures
+        self.failure_status = failure_status
+        self.failure_retry_after = failure_retry_after
+        self.throttled = 0
+        """Requests answered with 429 because their key exceeded its quota or the server its capacity"""
+        self.active = 0
+        """Requests being handled"""
+        self.requests_per_key = {}
+        self.__windows = {}
+        self.__hubs = {}
+        self.__runner: web.AppRunner = None
+        self.__port: int = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.__port}/data/v4'
+
+    async def __handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        key = request.headers.get('Authorization')
+        self.requests_per_key[key] = self.requests_per_key.get(key, 0) + 1
+        if self.requests <= self.failures:
+            headers = {} if self.failure_retry_after is None else {'Retry-After': self.failure_retry_after}
+            return web.Response(status=self.failure_status, content_type='application/json', headers=headers)
+        if self.capacity is not None and self.active >= self.capacity:
+            self.throttled += 1
+            return web.json_response({'errors': [{'message': 'too many requests'}]}, status=429,
+                                     headers={'Retry-After': '0.1'})
+        self.active += 1
+        try:
+            return await self.__limited(request, key)
+        finally:
+            self.active -= 1
+
+    async def __limited(self, request: web.Request, key: str) -> web.Response:
+        if self.key_quota is None:
+            return await self.__respond(request)
+        # a fixed window of one second per key
+        now = time.time()
+        window, used = self.__windows.get(key, (int(now), 0))
+        if window != int(now):
+            window, used = int(now), 0
+        if used >= self.key_quota:
+            self.throttled += 1
+            return web.json_response({'errors': [{'message': 'too many requests'}]}, status=429,
+                                     headers={'Retry-After': f'{window + 1 - now:.3f}',
+                                              'X-RateLimit-Remaining': '0'})
+        self.__windows[key] = window, used + 1
+        response = await self.__respond(request)
+        response.headers['X-RateLimit-Remaining'] = str(self.key_quota - used - 1)
+        return response
+
+    async def __respond(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency if self.capacity is None
+                                else self.latency * (1 + self.active / self.capacity))
+        path = request.match_info['path'].split('/')
+        offset = int(request.query.get('offset', 0))
+        limit = int(request.query.get('limit', 20))
+        positions = range(offset, min(offset + limit, self.collection_size))
+        if path[0] == 'hubs' and path[2:] == ['members']:
+            return web.json_response({'items': [payloads.member() for _ in positions],
+                                      'start': offset, 'end': offset + len(positions)})
+        if path[0] == 'rankings':
+            return web.json_response({'items': [payloads.rank(i + 1) for i in positions],
+                                      'start': offset, 'end': offset + len(positions)})
+        if path[0] == 'players' and path[2:] == ['history']:
+            return web.json_response(self.__history(request, offset, limit))
+        if path[0] == 'players' and len(path) == 2:
+            return web.json_response(payloads.player(path[1]))
+        if path[0] == 'matches' and len(path) == 2:
+            status = 'ONGOING' if path[1].startswith('ongoing') else 'FINISHED'
+            return web.json_response(payloads.match(path[1], status))
+        if path[0] == 'matches' and path[2:] == ['stats']:
+            return web.json_response(payloads.match_stats(path[1]))
+        if path[0] == 'hubs' and len(path) == 2:
+            return self.__hub(request, path[1])
+        return web.json_response({'errors': [{'message': 'not found'}]}, status=404)
+
+    def __hub(self, request: web.Request, hub_id: str) -> web.Response:
+        etag = f'"{hub_id}-{self.hub_version}"'
+        if request.headers.get('If-None-Match') == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={'ETag': etag})
+        if hub_id not in self.__hubs or self.__hubs[hub_id][0] != self.hub_version:
+            self.__hubs[hub_id] = self.hub_version, payloads.hub(hub_id)
+        return web.json_response(self.__hubs[hub_id][1], headers={'ETag': etag})
+
+    def __history(self, request: web.Request, offset: int, limit: int) -> dict:
+        to = int(request.query.get('to', time.time()))
+        from_ = int(request.query.get('from', to - 30 * 24 * 3600))
+        # match k started at last_match_at - k * match_interval, the newest match comes first
+        first = max(0, -((to - self.last_match_at) // self.match_interval))
+        last = min(self.collection_size - 1, (self.last_match_at - from_) // self.match_interval)
+        numbers = range(first + offset, min(first + offset + limit, last + 1))
+        items = [payloads.player_match(f'1-{self.collection_size - k}', self.last_match_at - k * self.match_interval)
+                 for k in numbers]
+        return {'items': items, 'start': offset, 'end': offset + len(items), 'from': from_, 'to': to}
+
+    async def __aenter__(self) -> 'MockServer':
+        app = web.Application()
+        app.router.add_get('/data/v4/{path:.*}', self.__handle)
+        self.__runner = web.AppRunner(app, access_log=None)
+        await self.__runner.setup()
+        await web.TCPSite(self.__runner, '127.0.0.1', 0).start()
+        self.__port = self.__runner.addresses[0][1]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.__runner.cleanup()
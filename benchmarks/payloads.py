@@ -0,0 +1,188 @@
+"""
+Synthetic payloads shaped like the responses of the FACEIT data api
+"""
+import random
+import uuid
+
+
+def _id() -> str:
+    return str(uuid.uuid4())
+
+
+def player(player_id: str = None) -> dict:
+    player_id = _id() if player_id is None else player_id
+    return {
+        'player_id': player_id,
+        'nickname': f'player_{player_id[:8]}',
+        'avatar': f'https://assets.faceit-cdn.net/avatars/{player_id}.jpg',
+        'country': random.choice(['de', 'gb', 'fr', 'se', 'pl']),
+        'cover_image': '',
+        'platforms': {'steam': 'STEAM_1:0:12345678'},
+        'games': {'csgo': {'region': 'EU', 'game_player_id': '76561198000000000', 'skill_level': 8,
+                           'faceit_elo': 1850, 'game_player_name': 'name', 'skill_level_label': '8',
+                           'game_profile_id': _id()}},
+        'settings': {'language': 'en'},
+        'friends_ids': [_id() for _ in range(20)],
+        'new_steam_id': 'STEAM_1:0:12345678',
+        'steam_id_64': '76561198000000000',
+        'steam_nickname': 'name',
+        'memberships': ['free'],
+        'faceit_url': 'https://www.faceit.com/{lang}/players/name',
+        'membership_type': '',
+        'cover_featured_image': '',
+        'infractions': {},
+    }
+
+
+_MAPS = ['de_mirage', 'de_inferno', 'de_nuke', 'de_overpass', 'de_ancient', 'de_anubis', 'de_vertigo']
+
+
+def _roster(size: int = 5) -> list:
+    return [{'player_id': _id(), 'nickname': f'player_{i}', 'avatar': '', 'membership': 'free',
+             'game_player_id': '76561198000000000', 'game_player_name': 'name', 'game_skill_level': 8,
+             'anticheat_required': True} for i in range(size)]
+
+
+def match(match_id: str = None, status: str = 'FINISHED') -> dict:
+    match_id = f'1-{_id()}' if match_id is None else match_id
+    started_at = random.randint(1_600_000_000, 1_700_000_000)
+    finished = status == 'FINISHED'
+    payload = {
+        'match_id': match_id,
+        'version': 1,
+        'game': 'csgo',
+        'region': 'EU',
+        'competition_id': _id(),
+        'competition_type': 'matchmaking',
+        'competition_name': '5v5 RANKED',
+        'organizer_id': 'faceit',
+        'teams': {faction: {'faction_id': _id(), 'leader': _id(), 'avatar': '', 'roster': _roster(),
+                            'substituted': False, 'name': f'team_{faction}', 'type': ''}
+                  for faction in ('faction1', 'faction2')},
+        'voting': {'map': {'pick': [random.choice(_MAPS)]}, 'voted_entity_types': ['map']},
+        'calculate_elo': True,
+        'configured_at': started_at - 120,
+        'started_at': started_at,
+        'best_of': 1,
+        'chat_room_id': f'match-{match_id}',
+        'demo_url': [f'https://demos.faceit.com/{match_id}.dem.gz'],
+        'status': status,
+        'faceit_url': f'https://www.faceit.com/{{lang}}/csgo/room/{match_id}',
+    }
+    if finished:
+        payload['finished_at'] = started_at + 2400
+        payload['results'] = {'winner': 'faction1', 'score': {'faction1': 1, 'faction2': 0}}
+    return payload
+
+
+def _player_stats() -> dict:
+    kills = random.randint(5, 35)
+    deaths = random.randint(5, 30)
+    rounds = random.randint(16, 30)
+    return {
+        'Kills': str(kills), 'Deaths': str(deaths), 'Assists': str(random.randint(0, 10)),
+        'Headshots': str(random.randint(0, kills)), 'Headshots %': str(random.randint(20, 80)),
+        'K/D Ratio': f'{kills / deaths:.2f}', 'K/R Ratio': f'{kills / rounds:.2f}',
+        'MVPs': str(random.randint(0, 6)), 'Triple Kills': str(random.randint(0, 3)),
+        'Quadro Kills': str(random.randint(0, 1)), 'Penta Kills': '0', 'Result': str(random.randint(0, 1)),
+    }
+
+
+def match_stats(match_id: str = None, maps: int = 1) -> dict:
+    match_id = f'1-{_id()}' if match_id is None else match_id
+    return {'rounds': [{
+        'best_of': str(maps),
+        'competition_id': None,
+        'game_id': 'csgo',
+        'game_mode': '5v5',
+        'match_id': match_id,
+        'match_round': str(i + 1),
+        'played': '1',
+        'round_stats': {'Map': random.choice(_MAPS), 'Region': 'EU', 'Rounds': '26', 'Score': '16 / 10',
+                        'Winner': 'team1'},
+        'teams': [{
+            'team_id': f'team{t}',
+            'premade': False,
+            'team_stats': {'Team': f'team_{t}', 'Team Win': str(int(t == 1)), 'Final Score': '16',
+                           'First Half Score': '9', 'Second Half Score': '7', 'Overtime score': '0',
+                           'Team Headshots': '5.2'},
+            'players': [{'player_id': _id(), 'nickname': f'player_{p}', 'player_stats': _player_stats()}
+                        for p in range(5)],
+        } for t in (1, 2)],
+    } for i in range(maps)]}
+
+
+def member(user_id: str = None) -> dict:
+    user_id = _id() if user_id is None else user_id
+    return {'user_id': user_id, 'nickname': f'player_{user_id[:8]}', 'avatar': '',
+            'roles': ['default'], 'faceit_url': 'https://www.faceit.com/{lang}/players/name'}
+
+
+def rank(position: int) -> dict:
+    player_id = _id()
+    return {'player_id': player_id, 'nickname': f'player_{player_id[:8]}', 'country': 'de',
+            'faceit_elo': 4000 - position, 'game_skill_level': 10, 'position': position}
+
+
+def player_match(match_id: str = None, started_at: int = None) -> dict:
+    match_id = f'1-{_id()}' if match_id is None else match_id
+    started_at = random.randint(1_600_000_000, 1_700_000_000) if started_at is None else started_at
+    teams = {faction: {'team_id': _id(), 'nickname': f'team_{faction}', 'avatar': '', 'type': '',
+                       'players': [{'player_id': p['player_id'], 'nickname': p['nickname'], 'avatar': '',
+                                    'skill_level': 8, 'game_player_id': p['game_player_id'],
+                                    'game_player_name': p['game_player_name'], 'faceit_url': ''}
+                                   for p in _roster()]}
+             for faction in ('faction1', 'faction2')}
+    return {
+        'match_id': match_id, 'game_id': 'csgo', 'region': 'EU', 'match_type': '', 'game_mode': '5v5',
+        'max_players': 10, 'teams_size': 5, 'teams': teams,
+        'playing_players': [p['player_id'] for team in teams.values() for p in team['players']],
+        'competition_id': _id(), 'competition_name': '5v5 RANKED', 'competition_type': 'matchmaking',
+        'organizer_id': 'faceit', 'status': 'finished', 'started_at': started_at,
+        'finished_at': started_at + 2400, 'results': {'winner': 'faction1', 'score': {'faction1': 1, 'faction2': 0}},
+        'faceit_url': f'https://www.faceit.com/{{lang}}/csgo/room/{match_id}',
+    }
+
+
+def brackets(teams: int = 512) -> dict:
+    rounds = teams.bit_length() - 1
+    matches = []
+    for r in range(1, rounds + 1):
+        for position in range(1, teams // 2 ** r + 1):
+            match_id = f'1-{_id()}'
+            matches.append({
+                'match_id': match_id, 'round': r, 'position': position, 'state': 'FINISHED',
+                'faceit_url': f'https://www.faceit.com/{{lang}}/csgo/room/{match_id}',
+                'results': {'winner': 'faction1', 'score': {'faction1': 2, 'faction2': 1}},
+                'teams': {faction: {'id': _id(), 'name': f'team_{faction}', 'type': 'team'}
+                          for faction in ('faction1', 'faction2')},
+            })
+    return {
+        'game': 'csgo', 'name': 'Bracket Cup', 'status': 'finished', 'matches': matches,
+        'rounds': [{'round': r, 'label': f'Round {r}', 'best_of': 3, 'matches': teams // 2 ** r,
+                    'start_time': 1_700_000_000 + r * 3600, 'starts_asap': False, 'substitution_time': 300,
+                    'substitutions_allowed': True} for r in range(1, rounds + 1)],
+    }
+
+
+def hub_stats(players: int = 500) -> dict:
+    return {'game_id': 'csgo', 'players': [{'player_id': _id(), 'nickname': f'player_{i}',
+                                            'stats': _player_stats()} for i in range(players)]}
+
+
+def hub(hub_id: str = None) -> dict:
+    hub_id = _id() if hub_id is None else hub_id
+    organizer_id = _id()
+    return {
+        'hub_id': hub_id, 'name': f'hub_{hub_id[:8]}', 'avatar': '', 'cover_image': '', 'background_image': '',
+        'description': ' '.join(random.choice(_MAPS) for _ in range(300)), 'game_id': 'csgo', 'region': 'EU',
+        'organizer_id': organizer_id, 'join_permission': 'public', 'min_skill_level': 1, 'max_skill_level': 10,
+        'players_joined': random.randint(100, 100_000), 'rule_id': _id(), 'chat_room_id': f'hub-{hub_id}',
+        'faceit_url': f'https://www.faceit.com/{{lang}}/hub/{hub_id}',
+        'game_data': {'game_id': 'csgo', 'long_label': 'Counter-Strike: Global Offensive', 'short_label': 'CS:GO',
+                      'order': 1, 'platforms': ['steam'], 'regions': ['EU', 'US', 'SEA', 'Oceania', 'SA'],
+                      'parent_game_id': '', 'assets': {}},
+        'organizer_data': {'organizer_id': organizer_id, 'name': 'Organizer', 'type': 'organizer', 'avatar': '',
+                           'cover': '', 'description': '', 'facebook': '', 'twitter': '', 'twitch': '',
+                           'youtube': '', 'website': '', 'followers_count': 1000, 'faceit_url': ''},
+    }
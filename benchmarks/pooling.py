@@ -0,0 +1,49 @@
+"""
+Compares requests/sec and p99 latency of the pooled session against one session per request
+
+Run from the repository root: python -m benchmarks.pooling
+"""
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+
+REQUESTS = 2000
+CONCURRENCY = 50
+
+
+async def unpooled(url: str):
+    async with aiohttp.request('GET', url, headers={'accept': 'application/json'}) as response:
+        return response.status, await response.json()
+
+
+async def run(name: str, fetch):
+    latencies = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def timed(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await fetch(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[timed(i) for i in range(REQUESTS)])
+    elapsed = time.perf_counter() - start
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(f'{name:<10} {REQUESTS / elapsed:>10.0f} req/s   p99 {p99 * 1000:>7.2f} ms')
+
+
+async def main():
+    async with MockServer() as server:
+        await run('unpooled', lambda i: unpooled(f'{server.base_url}/players/{i}'))
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            await run('pooled', lambda i: api.player_by_player_id(str(i)))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
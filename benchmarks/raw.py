@@ -0,0 +1,43 @@
+"""
+Compares the throughput of raw mode against building models, over the network and from a warm cache
+
+Run from the repository root: python -m benchmarks.raw
+"""
+import asyncio
+import time
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+from src.async_faceit_api.cache import ResponseCache
+from src.async_faceit_api.enums import Game
+
+REQUESTS = 2000
+KEYS = 50
+
+
+async def run(name: str, fetch):
+    semaphore = asyncio.Semaphore(50)
+
+    async def call(i: int):
+        async with semaphore:
+            return await fetch(i)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[call(i) for i in range(REQUESTS)])
+    print(f'{name:<28} {REQUESTS / (time.perf_counter() - start):>10.0f} calls/s')
+
+
+async def main():
+    async with MockServer() as server:
+        for raw in (False, True):
+            mode = 'raw' if raw else 'objects'
+            async with FaceitAPI('key', base_url=server.base_url, raw=raw) as api:
+                await run(f'match_stats {mode}', lambda i: api.match_stats(f'1-{i}'))
+            async with FaceitAPI('key', base_url=server.base_url, raw=raw, cache=ResponseCache()) as api:
+                await run(f'match_stats cached {mode}', lambda i: api.match_stats(f'1-{i % KEYS}'))
+                await run(f'player_history cached {mode}',
+                          lambda i: api.player_history(str(i % KEYS), Game.CS_GO, limit=100))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
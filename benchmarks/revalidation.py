@@ -0,0 +1,36 @@
+"""
+Compares re-downloading expired hubs against revalidating them with conditional requests
+
+Run from the repository root: python -m benchmarks.revalidation
+"""
+import asyncio
+import time
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+from src.async_faceit_api.cache import ResponseCache
+
+HUBS = 500
+ROUNDS = 5
+TTL = 0.05
+
+
+async def main():
+    print(f'{"mode":<14} {"requests":>9} {"304":>6} {"saved":>9} {"time":>9}')
+    for name, revalidated in (('download', ()), ('revalidate', ('hubs/*',))):
+        async with MockServer() as server:
+            cache = ResponseCache(max_entries=2 * HUBS, ttls={'hubs/*': TTL}, revalidated=revalidated)
+            async with FaceitAPI('key', base_url=server.base_url, cache=cache) as api:
+                await asyncio.gather(*[api.hub(str(i)) for i in range(HUBS)])
+                elapsed = 0.0
+                for _ in range(ROUNDS):
+                    await asyncio.sleep(TTL)
+                    start = time.perf_counter()
+                    await asyncio.gather(*[api.hub(str(i)) for i in range(HUBS)])
+                    elapsed += time.perf_counter() - start
+            print(f'{name:<14} {server.requests:>9} {server.not_modified:>6} '
+                  f'{cache.stats.bytes_saved / 1024 ** 2:>7.1f}MB {elapsed * 1000:>7.0f}ms')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
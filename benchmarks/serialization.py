@@ -0,0 +1,47 @@
+"""
+Measures round-tripping 10k player matches through pickle and to_dict/from_dict
+
+Run from the repository root: python -m benchmarks.serialization
+"""
+import gc
+import pickle
+import time
+
+from benchmarks import payloads
+from benchmarks.memory import legacy
+from src.async_faceit_api.dataclasses import PlayerMatch
+
+OBJECTS = 10_000
+REPEATS = 7
+
+
+def run(name: str, dumps, loads, value):
+    # the fastest of several runs, the others are slowed down by other processes
+    dump = load = float('inf')
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        data = dumps(value)
+        middle = time.perf_counter()
+        loads(data)
+        end = time.perf_counter()
+        gc.enable()
+        dump = min(dump, middle - start)
+        load = min(load, end - middle)
+    size = len(data) if isinstance(data, bytes) else 0
+    print(f'{name:<24} {dump * 1e3:>8.1f}ms {load * 1e3:>8.1f}ms '
+          f'{OBJECTS / (dump + load):>10.0f}/s {size / OBJECTS:>8.0f}B')
+
+
+def main():
+    matches = [PlayerMatch(**payloads.player_match()) for _ in range(OBJECTS)]
+    print(f'{"format":<24} {"dump":>10} {"load":>10} {"round trips":>12} {"size":>9}')
+    run('pickle __dict__', pickle.dumps, pickle.loads, [legacy(match) for match in matches])
+    run('pickle', pickle.dumps, pickle.loads, matches)
+    run('to_dict/from_dict', lambda x: [match.to_dict() for match in x],
+        lambda x: [PlayerMatch.from_dict(match) for match in x], matches)
+
+
+if __name__ == '__main__':
+    main()
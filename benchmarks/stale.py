@@ -0,0 +1,44 @@
+"""
+Compares the latency of cached reads with a plain ttl against stale-while-revalidate, on a server with latency
+
+Run from the repository root: python -m benchmarks.stale
+"""
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks.mock_server import MockServer
+from src.async_faceit_api import FaceitAPI
+from src.async_faceit_api.cache import ResponseCache
+
+PLAYERS = 50
+READS = 2000
+TTL = 0.2
+
+
+async def run(name: str, api: FaceitAPI):
+    latencies = []
+    for _ in range(READS):
+        # a chat command every millisecond, for a random player
+        start = time.perf_counter()
+        await api.player_by_player_id(str(random.randrange(PLAYERS)))
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.001)
+    p50, p99 = (statistics.quantiles(latencies, n=100)[i] for i in (49, 98))
+    stats = api.cache.stats
+    print(f'{name:<24} p50 {p50 * 1000:>7.2f} ms   p99 {p99 * 1000:>7.2f} ms   '
+          f'hits {stats.hits:>5}   stale {stats.stale_hits:>5}   misses {stats.misses:>5}')
+
+
+async def main():
+    async with MockServer(latency=0.05) as server:
+        async with FaceitAPI('key', base_url=server.base_url, cache=ResponseCache(ttls={'players/*': TTL})) as api:
+            await run('ttl', api)
+        async with FaceitAPI('key', base_url=server.base_url, cache=ResponseCache()) as api:
+            api.stale_while_revalidate('players/*', soft_ttl=TTL, hard_ttl=60)
+            await run('stale-while-revalidate', api)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
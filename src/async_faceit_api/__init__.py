@@ -1 +1,13 @@
-from .api import FaceitAPI
+__all__ = ['FaceitAPI']
+
+
+def __getattr__(name: str):
+    # FaceitAPI is imported on first use, so importing a submodule, e.g. the enums, does not import the client
+    if name == 'FaceitAPI':
+        from .api import FaceitAPI
+        return FaceitAPI
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
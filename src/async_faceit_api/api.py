@@ -1,45 +1,415 @@
+from __future__ import annotations
+
+import asyncio
 import datetime
-from typing import Tuple, Any
-from aiohttp import request
-from .enums import *
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import TYPE_CHECKING, Tuple, Any, Union, Mapping, AsyncIterator, Callable, Awaitable, Dict, List, \
+    Iterable, Iterator, Sequence
+from .enums import Expansion, Game, MatchType, Region
 from .dataclasses import *
+from .cache import ResponseCache, SQLiteMatchStore, is_final
+from .bulk import as_completed_bounded, gather_bounded
+from .decoder import JsonDecoder, default_decoder
+from .endpoints import canonical_url, endpoint_of
+from .history import CheckpointStore, Checkpoint, crawl_history
+from .concurrency import AdaptiveLimiter
+from .identity import IdentityMap
+from .keys import ApiKey, KeyPool
+from .pagination import MAX_PAGE_SIZE, fetch_pages, paginate
+from .pipeline import Pipeline
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from .enums import Country
+
+# the clients in raw mode for the current context, set with FaceitAPI.raw_mode
+_raw_mode: ContextVar[Mapping['FaceitAPI', bool]] = ContextVar('raw_mode', default={})
+
+
+class _Fetched:
+    """A response shared by the coalesced callers of a request"""
+    __slots__ = ('status', 'json', 'body', 'taken')
+
+    def __init__(self, status: int, json_response: Any, body: Union[bytes, None]):
+        self.status = status
+        self.json = json_response
+        self.body = body
+        self.taken = False
+
+    def take(self, decoder: JsonDecoder) -> Tuple[int, Any]:
+        # the first caller gets the decoded body, every further caller decodes its own copy, so a caller
+        # changing its response does not change the response of the others
+        if not self.taken:
+            self.taken = True
+            return self.status, self.json
+        if self.body is not None:
+            return self.status, decoder(self.body) if self.body else None
+        return self.status, dict(self.json) if isinstance(self.json, dict) else self.json
 
 
 class FaceitAPI:
     """
     See the faceit data-api docs for more information:
     https://developers.faceit.com/docs/tools/data-api
+
+    The api keeps one pooled :class:`aiohttp.ClientSession` for all requests. Close it with :meth:`close` or use
+    the api as an async context manager::
+
+        async with FaceitAPI(api_key) as api:
+            players = await api.search_players("username")
     """
 
     __BASE_URL: str = 'https://open.faceit.com/data/v4/{}'
 
-    def __init__(self, api_token: str):
-        self.__header = {
-            'accept': 'application/json',
-            'Authorization': f'Bearer {api_token}'
+    def __init__(self, api_token: Union[str, Sequence[str]], limit: int = 100, limit_per_host: int = 0,
+                 keepalive_timeout: float = 30, ttl_dns_cache: int = 300, base_url: str = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, coalesce_requests: bool = True,
+                 cache: ResponseCache = None, match_store: SQLiteMatchStore = None, lazy: bool = False,
+                 raw: bool = False, json_decoder: JsonDecoder = None, identity_map: IdentityMap = None,
+                 concurrency_limiter: AdaptiveLimiter = None):
+        """
+        :param api_token: The FACEIT api key or several keys, the requests are spread over them by a
+            :class:`.KeyPool`
+        :type api_token: Union[str, Sequence[str]]
+        :param limit: Total number of simultaneous connections of the pool. 0 means no limit
+        :type limit: int, optional
+        :param limit_per_host: Number of simultaneous connections to one host. 0 means no limit
+        :type limit_per_host: int, optional
+        :param keepalive_timeout: Seconds an idle connection is kept open for reuse
+        :type keepalive_timeout: float, optional
+        :param ttl_dns_cache: Seconds resolved DNS entries are cached. None caches forever
+        :type ttl_dns_cache: int, optional
+        :param base_url: Url of the data api, e.g. to run against a mock server
+        :type base_url: str, optional
+        :param rate_limiter: Limiter every request has to pass before it is sent. With several keys, every further
+            key gets a copy of it
+        :type rate_limiter: :class:`.RateLimiter`, optional
+        :param retry_policy: Policy to retry failed requests with
+        :type retry_policy: :class:`.RetryPolicy`, optional
+        :param coalesce_requests: Share one request between all callers of identical GET requests in flight
+        :type coalesce_requests: bool, optional
+        :param cache: Cache for the responses of GET requests
+        :type cache: :class:`.ResponseCache`, optional
+        :param match_store: Persistent store for the responses of finished matches and their stats
+        :type match_store: :class:`.SQLiteMatchStore`, optional
+        :param lazy: Build the fields of responses from the json when they are read for the first time
+        :type lazy: bool, optional
+        :param raw: Return the decoded json with the status code as :class:`.RawResponse` instead of models
+        :type raw: bool, optional
+        :param json_decoder: Decodes the json bodies, orjson or msgspec if installed, the json module else
+        :type json_decoder: Callable[[bytes], Any], optional
+        :param identity_map: Resolves responses with the same id to one object and interns repeated strings
+        :type identity_map: :class:`.IdentityMap`, optional
+        :param concurrency_limiter: Adapts the number of requests in flight to the latency and the 429 and 5xx
+            responses
+        :type concurrency_limiter: :class:`.AdaptiveLimiter`, optional
+        """
+        tokens = [api_token] if isinstance(api_token, str) else list(api_token)
+        self.__keys = KeyPool(ApiKey(token, None if rate_limiter is None else rate_limiter if i == 0
+                                     else rate_limiter.copy()) for i, token in enumerate(tokens))
+        self.__header = {'accept': 'application/json'}
+        if len(self.__keys) == 1:
+            # with one key the authorization is a default header of the session instead of one of every request
+            self.__header['Authorization'] = self.__keys[0].authorization
+        self.__base_url = FaceitAPI.__BASE_URL if base_url is None else base_url.rstrip('/') + '/{}'
+        self.__path_start = len(self.__base_url) - 2
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = retry_policy
+        self.__in_flight: Union[SingleFlight, None] = SingleFlight() if coalesce_requests else None
+        self.__cache = cache
+        self.__match_store = match_store
+        self.__lazy = lazy
+        self.__raw = raw
+        self.__json_decoder = default_decoder() if json_decoder is None else json_decoder
+        self.__identity_map = identity_map
+        self.__concurrency_limiter = concurrency_limiter
+        self.__connector_args = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+            'ttl_dns_cache': ttl_dns_cache
         }
+        self.__session: ClientSession = None
+        self.__refreshes: Dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> 'FaceitAPI':
+        self.__get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Cancel the background refreshes of stale responses and close the pooled session and all of its
+        connections"""
+        if self.__refreshes:
+            refreshes = list(self.__refreshes.values())
+            for task in refreshes:
+                task.cancel()
+            await asyncio.gather(*refreshes, return_exceptions=True)
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def __get_session(self) -> ClientSession:
+        # The session has to be created inside the running event loop, so it is created on first use.
+        # aiohttp is imported here as well, it makes up most of the import time of the package
+        if self.__session is None or self.__session.closed:
+            from aiohttp import ClientSession, TCPConnector
+            self.__session = ClientSession(connector=TCPConnector(**self.__connector_args),
+                                           headers=self.__header)
+        return self.__session
+
+    @property
+    def rate_limiter(self) -> Union[RateLimiter, None]:
+        """The limiter of the requests of the first key, None if requests are not limited"""
+        return self.__rate_limiter
+
+    @property
+    def keys(self) -> KeyPool:
+        """The api keys with their limiters and metrics"""
+        return self.__keys
+
+    @property
+    def retry_policy(self) -> Union[RetryPolicy, None]:
+        """The retry policy of the requests, its ``retries`` count the retries per endpoint family"""
+        return self.__retry_policy
+
+    @property
+    def in_flight(self) -> Union[SingleFlight, None]:
+        """The identical GET requests in flight, None if requests are not coalesced"""
+        return self.__in_flight
+
+    @property
+    def cache(self) -> Union[ResponseCache, None]:
+        """The cache of the responses, None if responses are not cached"""
+        return self.__cache
+
+    @property
+    def match_store(self) -> Union[SQLiteMatchStore, None]:
+        """The persistent store of finished matches, None if they are not stored"""
+        return self.__match_store
+
+    @property
+    def identity_map(self) -> Union[IdentityMap, None]:
+        """The map of the canonical responses per id, None if responses are not resolved to canonical objects"""
+        return self.__identity_map
+
+    @property
+    def concurrency_limiter(self) -> Union[AdaptiveLimiter, None]:
+        """The adaptive limit of the requests in flight, None if it is not limited"""
+        return self.__concurrency_limiter
+
+    def stale_while_revalidate(self, endpoint: str, soft_ttl: float, hard_ttl: float):
+        """Return cached responses of an endpoint family at once, also when they are stale
+
+        A response older than ``soft_ttl`` is still returned immediately while one request in the background
+        refreshes it. Only once it is older than ``hard_ttl`` the callers wait for a new response::
+
+            api.stale_while_revalidate('players', soft_ttl=30, hard_ttl=600)  # player_by_nickname
+            api.stale_while_revalidate('players/*/stats/*', soft_ttl=60, hard_ttl=3600)  # player_game_stats
+
+        :param endpoint: The endpoint family pattern, see :func:`.endpoint_of`. It takes precedence over the
+            patterns already set
+        :type endpoint: str
+        :param soft_ttl: Seconds the responses are returned without a refresh
+        :type soft_ttl: float
+        :param hard_ttl: Seconds the responses are returned at all
+        :type hard_ttl: float
+        :raises ValueError: If the api has no cache or the hard ttl is shorter than the soft ttl
+        """
+        if self.__cache is None:
+            raise ValueError('stale-while-revalidate requires a cache')
+        if hard_ttl < soft_ttl:
+            raise ValueError(f'The hard ttl {hard_ttl} is shorter than the soft ttl {soft_ttl}')
+        self.__cache.set_ttl(endpoint, soft_ttl, hard_ttl)
 
     async def __make_request(self, method: str, url: str) -> Tuple[int, Any]:
-        async with request(method, url, headers=self.__header) as response:
-            return response.status, await response.json()
+        endpoint = endpoint_of(url[self.__path_start:])
+        if method != 'GET':
+            return (await self.__fetch(method, url, endpoint)).take(self.__json_decoder)
+        key = canonical_url(url)
+        if self.__cache is not None and self.__cache.ttl(endpoint) > 0:
+            cached, stale = self.__cache.lookup(key)
+            if cached is not None:
+                if stale:
+                    self.__refresh(method, url, endpoint, key)
+                # the cache keeps the encoded body, so every caller gets its own decoded response
+                status, body = cached
+                return status, self.__decode(body)
+        if self.__match_store is not None and endpoint in SQLiteMatchStore.ENDPOINTS:
+            stored = await self.__match_store.get(key[self.__path_start:])
+            if stored is not None:
+                return 200, stored
+        if self.__in_flight is None:
+            fetched = await self.__fetch(method, url, endpoint, key)
+        else:
+            fetched = await self.__in_flight.do(key, lambda: self.__fetch(method, url, endpoint, key))
+        return fetched.take(self.__json_decoder)
+
+    def __decode(self, body: bytes) -> Any:
+        return self.__json_decoder(body) if body else None
+
+    def __refresh(self, method: str, url: str, endpoint: str, key: str):
+        # one refresh per stale response, the callers get the stale response meanwhile
+        if key in self.__refreshes:
+            return
+        if self.__in_flight is None:
+            refresh = self.__fetch(method, url, endpoint, key)
+        else:
+            refresh = self.__in_flight.do(key, lambda: self.__fetch(method, url, endpoint, key))
+        task = asyncio.ensure_future(refresh)
+        self.__refreshes[key] = task
+        self.__cache.stats.refreshes += 1
+        task.add_done_callback(lambda t: self.__refreshed(key, t))
+
+    def __refreshed(self, key: str, task: asyncio.Task):
+        del self.__refreshes[key]
+        # a failed refresh keeps the stale response until its hard ttl passed
+        if not task.cancelled() and task.exception() is not None:
+            self.__cache.stats.refresh_errors += 1
+
+    async def __fetch(self, method: str, url: str, endpoint: str, key: str = None) -> _Fetched:
+        from aiohttp import ClientError
+        # an expired response with an ETag or Last-Modified header is revalidated instead of downloaded again
+        validators = None if key is None or self.__cache is None else self.__cache.validators(key)
+        for attempt in count(1):
+            try:
+                status, headers, json_response, body = await self.__send(method, url, endpoint, validators)
+                if status == 304 and validators is not None:
+                    cached = self.__cache.not_modified(key, endpoint, headers)
+                    if cached is not None:
+                        return _Fetched(cached[0], self.__decode(cached[1]), cached[1])
+                    # the response was evicted while it was revalidated, so it is requested unconditionally
+                    validators = None
+                    continue
+                delay = None if self.__retry_policy is None else \
+                    self.__retry_policy.backoff(method, attempt, status=status, headers=headers)
+                if delay is None:
+                    if key is not None and 200 <= status < 300:
+                        await self.__store(key, endpoint, status, json_response, body, headers)
+                    return _Fetched(status, json_response, body)
+            except (ClientError, asyncio.TimeoutError) as e:
+                if self.__retry_policy is None:
+                    raise
+                delay = self.__retry_policy.backoff(method, attempt, exception=e)
+                if delay is None:
+                    raise
+            self.__retry_policy.retries[endpoint] += 1
+            await asyncio.sleep(delay)
+
+    async def __store(self, key: str, endpoint: str, status: int, json_response: Any, body: bytes,
+                      headers: Mapping[str, str]):
+        if self.__match_store is not None and endpoint in SQLiteMatchStore.ENDPOINTS \
+                and is_final(endpoint, json_response):
+            await self.__match_store.put(key[self.__path_start:], json_response)
+        elif self.__cache is not None:
+            self.__cache.put(key, endpoint, (status, body), len(body), headers)
+
+    async def __send(self, method: str, url: str, endpoint: str, headers: Mapping[str, str] = None) \
+            -> Tuple[int, Mapping[str, str], Any, Union[bytes, None]]:
+        key = await self.__keys.acquire()
+        try:
+            if key.rate_limiter is not None:
+                await key.rate_limiter.acquire(endpoint)
+            if len(self.__keys) > 1:
+                headers = {'Authorization': key.authorization} if headers is None \
+                    else {**headers, 'Authorization': key.authorization}
+            limiter = self.__concurrency_limiter
+            started = None if limiter is None else await limiter.acquire()
+            responded = False
+            try:
+                async with self.__get_session().request(method, url, headers=headers) as response:
+                    responded = True
+                    if limiter is not None:
+                        limiter.observe(started, time.monotonic() - started, response.status)
+                    key.update(endpoint, response.status, response.headers)
+                    body = await response.read()
+                    if 'json' in response.content_type:
+                        json_response = self.__decode(body)
+                    elif 200 <= response.status < 300:
+                        from aiohttp import ContentTypeError
+                        raise ContentTypeError(response.request_info, response.history, status=response.status,
+                                               message=f'Unexpected content type: {response.content_type}',
+                                               headers=response.headers)
+                    else:
+                        # error pages of proxies and load balancers are not json
+                        json_response = {'message': await response.text()}
+                        body = None
+                    return response.status, response.headers, json_response, body
+            except Exception:
+                # connection errors and timeouts count as overload like 5xx responses
+                if limiter is not None and not responded:
+                    limiter.observe(started, time.monotonic() - started)
+                raise
+            finally:
+                if limiter is not None:
+                    limiter.release()
+        finally:
+            self.__keys.release(key)
+
+    @contextmanager
+    def raw_mode(self, enabled: bool = True) -> Iterator['FaceitAPI']:
+        """Return :class:`.RawResponse` objects instead of models for the calls within the block
+
+        The mode applies to the current task and the tasks started within the block. Errors are still returned
+        as :class:`.FaceitApiError`. Pagination helpers like :meth:`paginate` always work with models::
+
+            with api.raw_mode():
+                response = await api.match(match_id)
+                store(response.data)
+
+        :param enabled: Whether raw mode is switched on or off within the block
+        :type enabled: bool, optional
+        :return: The api itself
+        :rtype: :class:`.FaceitAPI`
+        """
+        token = _raw_mode.set({**_raw_mode.get(), self: enabled})
+        try:
+            yield self
+        finally:
+            _raw_mode.reset(token)
 
+    def __is_raw(self) -> bool:
+        return _raw_mode.get().get(self, self.__raw)
 
     @staticmethod
-    async def __create_object(response: Tuple[int, Any], object_class=None) -> Any:
+    def __error(status: int, json_response: Any) -> FaceitApiError:
+        # proxies may answer with an empty body or json that is not an object
+        return FaceitApiError(**{**(json_response if isinstance(json_response, dict) else {}), 'status_code': status})
+
+    async def __create_object(self, response: Tuple[int, Any], object_class=None) -> Any:
         status, json_response = response
         if not 200 <= status < 300:
-            return FaceitApiError(**json_response, status_code=status)
-        if object_class is not None:
-            return object_class(**json_response)
-        return json_response
-
-    @staticmethod
-    async def __create_collection(response: Tuple[int, Any], object_class, collection_class=Collection) -> Any:
+            return self.__error(status, json_response)
+        if self.__is_raw():
+            return RawResponse(json_response, status)
+        if object_class is None:
+            return json_response
+        return self.__build(object_class, json_response)
+
+    async def __create_collection(self, response: Tuple[int, Any], object_class, collection_class=Collection) -> Any:
         status, json_response = response
         if not 200 <= status < 300:
-            return FaceitApiError(**json_response, status_code=status)
-        json_response["items"] = [object_class(**x) for x in json_response["items"]]
-        return collection_class(**json_response)
+            return self.__error(status, json_response)
+        if self.__is_raw():
+            return RawResponse(json_response, status)
+        items = [self.__build(object_class, x) for x in json_response["items"]]
+        return self.__build(collection_class, {**json_response, "items": items})
+
+    def __build(self, object_class, json_response: dict) -> Any:
+        if self.__identity_map is not None:
+            return self.__identity_map.get(object_class, json_response, self.__lazy)
+        if self.__lazy:
+            return object_class.lazy(json_response)
+        from .registry import from_dict
+        return from_dict(object_class, json_response)
 
     # region Championships
     async def championships(self, game: Game, type_: MatchType = MatchType.ALL, offset: int = 0,
@@ -57,10 +427,10 @@ class FaceitAPI:
         :return: Championships collection
         :rtype: :class:`.Collection[.Championship]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'championships?game={game.value}&type={type_.value}&offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Championship)
+        return await self.__create_collection(retval, Championship)
 
     async def championship(self, championship_id: str,
                            expanded: Expansion = Expansion.NONE) -> Championship:
@@ -73,11 +443,11 @@ class FaceitAPI:
         :return: Championship details
         :rtype: :class:.Championship`
         """
-        url = FaceitAPI.__BASE_URL.format(f'championships/{championship_id}')
+        url = self.__base_url.format(f'championships/{championship_id}')
         if expanded is not Expansion.NONE:
             url += f'?expanded={expanded.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Championship)
+        return await self.__create_object(retval, Championship)
 
     async def championship_matches(self, championship_id: str, type_: MatchType = MatchType.ALL,
                                    offset: int = 0, limit: int = 20) -> Collection[Match]:
@@ -94,10 +464,10 @@ class FaceitAPI:
         :return: Matches list
         :rtype: :class:`.Collection[.Match]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'championships/{championship_id}/matches?type={type_.value}&offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Match)
+        return await self.__create_collection(retval, Match)
 
     async def championship_results(self, championship_id: str, offset: int = 0,
                                    limit: int = 20) -> Collection[Result]:
@@ -112,10 +482,10 @@ class FaceitAPI:
         :return: Championship results
         :rtype: :class:`.Collection[.Result]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'championships/{championship_id}/results?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Result)
+        return await self.__create_collection(retval, Result)
 
     async def championship_subscriptions(self, championship_id: str, offset: int = 0,
                                          limit: int = 10) -> Collection[Subscription]:
@@ -130,10 +500,10 @@ class FaceitAPI:
         :return: Subscriptions list
         :rtype: :class:`.Collection[.Subscription]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'championships/{championship_id}/subscriptions?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Subscription)
+        return await self.__create_collection(retval, Subscription)
     # endregion
 
     # region Games
@@ -147,9 +517,9 @@ class FaceitAPI:
         :return: Games list
         :rtype: :class:`.Collection[.GameData]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'games?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'games?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, GameData)
+        return await self.__create_collection(retval, GameData)
 
     async def game_details(self, game: Game) -> GameData:
         """Retrieve game details
@@ -159,9 +529,9 @@ class FaceitAPI:
         :return: Game detail
         :rtype: :class:`.GameData`
         """
-        url = FaceitAPI.__BASE_URL.format(f'games/{game.value}')
+        url = self.__base_url.format(f'games/{game.value}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, GameData)
+        return await self.__create_object(retval, GameData)
 
     async def game_parent_details(self, game: Game) -> GameData:
         """Retrieve the details of the parent game, if the game is region-specific
@@ -171,9 +541,9 @@ class FaceitAPI:
         :return: Game detail
         :rtype: :class:`.GameData`
         """
-        url = FaceitAPI.__BASE_URL.format(f'games/{game.value}/parent')
+        url = self.__base_url.format(f'games/{game.value}/parent')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, GameData)
+        return await self.__create_object(retval, GameData)
     # endregion
 
     # region Hubs
@@ -187,11 +557,11 @@ class FaceitAPI:
         :return: Hub details
         :rtype: :class:`.Hub`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}')
+        url = self.__base_url.format(f'hubs/{hub_id}')
         if expanded is not Expansion.NONE:
             url += f'?expanded={expanded.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Hub)
+        return await self.__create_object(retval, Hub)
 
     async def hub_matches(self, hub_id: str, type_: MatchType = MatchType.ALL, offset: int = 0,
                           limit: int = 20) -> Collection[Match]:
@@ -208,9 +578,9 @@ class FaceitAPI:
         :return: Matches list
         :rtype: :class:`.Collection[.Match]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}/matches?type={type_.value}&offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'hubs/{hub_id}/matches?type={type_.value}&offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Match)
+        return await self.__create_collection(retval, Match)
 
     async def hub_members(self, hub_id: str, offset: int = 0, limit: int = 20) -> Collection[Member]:
         """Retrieve all members of a hub
@@ -224,9 +594,9 @@ class FaceitAPI:
         :return: Members list
         :rtype: :class:`.Collection[.Member]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}/members?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'hubs/{hub_id}/members?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Member)
+        return await self.__create_collection(retval, Member)
 
     async def hub_roles(self, hub_id: str, offset: int = 0, limit: int = 20) -> Collection[Role]:
         """Retrieve all roles members can have in a hub
@@ -240,9 +610,9 @@ class FaceitAPI:
         :return: Roles list
         :rtype: :class:`.Collection[.Role]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}/roles?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'hubs/{hub_id}/roles?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Role)
+        return await self.__create_collection(retval, Role)
 
     async def hub_rules(self, hub_id: str) -> Rule:
         """Retrieve rules of a hub
@@ -252,9 +622,9 @@ class FaceitAPI:
         :return: Rules details
         :rtype: :class:`.Rule`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}/rules')
+        url = self.__base_url.format(f'hubs/{hub_id}/rules')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Rule)
+        return await self.__create_object(retval, Rule)
 
     async def hub_stats(self, hub_id: str, offset: int = 0, limit: int = 20) -> GameStats:
         """Retrieve statistics of a hub
@@ -268,9 +638,9 @@ class FaceitAPI:
         :return: Hub stats
         :rtype: :class:`.GameStats`
         """
-        url = FaceitAPI.__BASE_URL.format(f'hubs/{hub_id}/stats?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'hubs/{hub_id}/stats?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, GameStats)
+        return await self.__create_object(retval, GameStats)
     # endregion
 
     # region Leaderboards
@@ -287,9 +657,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Leaderboard]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'leaderboards/championships/{championship_id}?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'leaderboards/championships/{championship_id}?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Leaderboard)
+        return await self.__create_collection(retval, Leaderboard)
 
     async def leaderboards_championship_groups(self, championship_id: str, group: int, offset: int = 0,
                                                limit: int = 20) -> ChampionshipRankingCollection[Ranking]:
@@ -306,10 +676,10 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.ChampionshipRankingCollection[.Ranking]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'leaderboards/championships/{championship_id}/groups/{group}?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Ranking, ChampionshipRankingCollection)
+        return await self.__create_collection(retval, Ranking, ChampionshipRankingCollection)
 
     async def leaderboards_hub(self, hub_id: str, offset: int = 0,
                                limit: int = 20) -> Collection[Leaderboard]:
@@ -324,9 +694,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Leaderboard]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'leaderboards/hubs/{hub_id}?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'leaderboards/hubs/{hub_id}?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Leaderboard)
+        return await self.__create_collection(retval, Leaderboard)
 
     async def leaderboards_hub_general(self, hub_id: str, offset: int = 0,
                                        limit: int = 20) -> ChampionshipRankingCollection[Ranking]:
@@ -341,9 +711,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.ChampionshipRankingCollection[.Ranking]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'leaderboards/hubs/{hub_id}/general?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'leaderboards/hubs/{hub_id}/general?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Ranking, ChampionshipRankingCollection)
+        return await self.__create_collection(retval, Ranking, ChampionshipRankingCollection)
 
     async def leaderboards_hub_season(self, hub_id: str, season: int, offset: int = 0,
                                       limit: int = 20) -> ChampionshipRankingCollection[Ranking]:
@@ -360,9 +730,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.ChampionshipRankingCollection[.Ranking]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'leaderboards/hubs/{hub_id}/seasons/{season}?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'leaderboards/hubs/{hub_id}/seasons/{season}?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Ranking, ChampionshipRankingCollection)
+        return await self.__create_collection(retval, Ranking, ChampionshipRankingCollection)
 
     async def leaderboard(self, leaderboard_id: str, offset: int = 0,
                           limit: int = 20) -> ChampionshipRankingCollection[Ranking]:
@@ -370,8 +740,6 @@ class FaceitAPI:
 
         :param leaderboard_id: The id of the leaderboard
         :type leaderboard_id: str
-        :param season: A season of the hub
-        :type season: int
         :param offset: The starting item position
         :type offset: int, optional
         :param limit: The number of items to return
@@ -379,9 +747,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.ChampionshipRankingCollection[.Ranking]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'leaderboards/{leaderboard_id}?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'leaderboards/{leaderboard_id}?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Ranking, ChampionshipRankingCollection)
+        return await self.__create_collection(retval, Ranking, ChampionshipRankingCollection)
     # endregion
 
     # region Matches
@@ -393,9 +761,9 @@ class FaceitAPI:
         :return: Match details
         :rtype: :class:`.Match`
         """
-        url = FaceitAPI.__BASE_URL.format(f'matches/{match_id}')
+        url = self.__base_url.format(f'matches/{match_id}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Match)
+        return await self.__create_object(retval, Match)
 
     async def match_stats(self, match_id: str) -> MatchStats:
         """Retrieve statistics of a match
@@ -405,9 +773,9 @@ class FaceitAPI:
         :return: Match details
         :rtype: :class:`.MatchStats`
         """
-        url = FaceitAPI.__BASE_URL.format(f'matches/{match_id}/stats')
+        url = self.__base_url.format(f'matches/{match_id}/stats')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, MatchStats)
+        return await self.__create_object(retval, MatchStats)
     # endregion
 
     # region Organizers
@@ -419,9 +787,9 @@ class FaceitAPI:
         :return: Organizer details
         :rtype: :class:`.OrganizerData`
         """
-        url = FaceitAPI.__BASE_URL.format(f'organizers?name={name}')
+        url = self.__base_url.format(f'organizers?name={name}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, OrganizerData)
+        return await self.__create_object(retval, OrganizerData)
 
     async def organizer_by_id(self, organizer_id: str) -> OrganizerData:
         """Retrieve organizer details
@@ -431,9 +799,9 @@ class FaceitAPI:
         :return: Organizer details
         :rtype: :class:`.OrganizerData`
         """
-        url = FaceitAPI.__BASE_URL.format(f'organizers/{organizer_id}')
+        url = self.__base_url.format(f'organizers/{organizer_id}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, OrganizerData)
+        return await self.__create_object(retval, OrganizerData)
 
     async def organizer_championships(self, organizer_id: str, offset: int = 0,
                                       limit: int = 20) -> Collection[Championship]:
@@ -448,9 +816,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Championship]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'organizers/{organizer_id}/championships?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'organizers/{organizer_id}/championships?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Championship)
+        return await self.__create_collection(retval, Championship)
 
     async def organizer_games(self, organizer_id: str) -> Collection[Hub]:
         """Retrieve all games an organizer is involved with
@@ -460,9 +828,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Hub]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'organizers/{organizer_id}/games')
+        url = self.__base_url.format(f'organizers/{organizer_id}/games')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Hub)
+        return await self.__create_collection(retval, Hub)
 
     async def organizer_hubs(self, organizer_id: str, offset: int = 0, limit: int = 20) -> Collection[Hub]:
         """Retrieve all hubs of an organizer
@@ -476,9 +844,9 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Hub]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'organizers/{organizer_id}/hubs?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'organizers/{organizer_id}/hubs?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Hub)
+        return await self.__create_collection(retval, Hub)
 
     async def organizer_tournaments(self, organizer_id: str, type_: MatchType = MatchType.UPCOMING,
                                     offset: int = 0, limit: int = 20) -> Collection[Tournament]:
@@ -495,10 +863,10 @@ class FaceitAPI:
         :return: Leaderboards list
         :rtype: :class:`.Collection[.Tournament]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'organizers/{organizer_id}/tournaments?type={type_.value}&offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Tournament)
+        return await self.__create_collection(retval, Tournament)
     # endregion
 
     # region Players
@@ -510,9 +878,9 @@ class FaceitAPI:
         :return: Player details
         :rtype: :class:`.Player`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players?nickname={nickname}')
+        url = self.__base_url.format(f'players?nickname={nickname}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Player)
+        return await self.__create_object(retval, Player)
 
     async def player_by_game_player_id(self, game: Game, game_player_id: str) -> Player:
         """Retrieve player details
@@ -524,9 +892,9 @@ class FaceitAPI:
         :return: Player details
         :rtype: :class:`.Player`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players?game={game.value}&game_player_id={game_player_id}')
+        url = self.__base_url.format(f'players?game={game.value}&game_player_id={game_player_id}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Player)
+        return await self.__create_object(retval, Player)
 
     async def player_by_player_id(self, player_id: str) -> Player:
         """Retrieve player details
@@ -536,9 +904,9 @@ class FaceitAPI:
         :return: Player details
         :rtype: :class:`.Player`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players/{player_id}')
+        url = self.__base_url.format(f'players/{player_id}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Player)
+        return await self.__create_object(retval, Player)
 
     async def player_history(self, player_id: str, game: Game, from_: Union[int, datetime.datetime] = None,
                              to: Union[int, datetime.datetime] = None, offset: int = 0,
@@ -560,7 +928,7 @@ class FaceitAPI:
         :return: Player matches list
         :rtype: :class:`.FromToCollection[.PlayerMatch]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'players/{player_id}/history?game={game.value}&offset={offset}&limit={limit}')
         if from_ is not None:
             if isinstance(from_, datetime.datetime):
@@ -570,10 +938,115 @@ class FaceitAPI:
             if isinstance(to, datetime.datetime):
                 to = int(to.timestamp())
             url += f'&to={to}'
-        retval = await self.__make_request('GET', url)
-        retval[1]["from_"] = retval[1]["from"]
-        del retval[1]["from"]
-        return await FaceitAPI.__create_collection(retval, PlayerMatch, FromToCollection)
+        status, json_response = await self.__make_request('GET', url)
+        if 200 <= status < 300 and isinstance(json_response, dict) and "from" in json_response \
+                and not self.__is_raw():
+            json_response = {"from_" if key == "from" else key: value for key, value in json_response.items()}
+        return await self.__create_collection((status, json_response), PlayerMatch, FromToCollection)
+
+    def player_full_history(self, player_id: str, game: Game, since: Union[int, datetime.datetime],
+                            until: Union[int, datetime.datetime] = None,
+                            concurrency: int = 4) -> AsyncIterator[PlayerMatch]:
+        """Iterate over all matches of a player in a time range, newest first
+
+        The range is split into time windows that are requested concurrently. The window size adapts to the
+        number of matches the player plays, so no deep offsets are needed. Every match is yielded once.
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
+        :param since: The timestamp in sec or datetime as lower bound
+        :type since: Union[int, datetime.datetime]
+        :param until: The timestamp in sec or datetime as higher bound. Current timestamp if not specified
+        :type until: Union[int, datetime.datetime], optional
+        :param concurrency: The maximum number of time windows requested at once
+        :type concurrency: int, optional
+        :raises ValueError: If the concurrency is less than 1
+        :raises FaceitApiException: If a page of the history can not be retrieved
+        :return: Iterator over the player matches
+        :rtype: AsyncIterator[:class:`.PlayerMatch`]
+        """
+        if isinstance(since, datetime.datetime):
+            since = int(since.timestamp())
+        if until is None:
+            until = int(datetime.datetime.now().timestamp())
+        elif isinstance(until, datetime.datetime):
+            until = int(until.timestamp())
+
+        async def fetch_window(start: int, end: int) -> List[PlayerMatch]:
+            return [match async for match in self.iter_player_history(player_id, game, start, end)]
+
+        return crawl_history(fetch_window, since, until, concurrency)
+
+    async def sync_player_history(self, player_id: str, game: Game, store: CheckpointStore,
+                                  since: Union[int, datetime.datetime] = None) -> List[PlayerMatch]:
+        """Retrieve the matches of a player that are newer than the checkpoint of the last synchronization
+
+        The checkpoint is the newest finished match returned so far, it is updated once the matches are retrieved.
+        Matches that were not finished yet are returned again by the next synchronization.
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
+        :param store: The store of the checkpoints
+        :type store: :class:`.CheckpointStore`
+        :param since: The timestamp in sec or datetime as lower bound of the first synchronization.
+            1 month ago if not specified
+        :type since: Union[int, datetime.datetime], optional
+        :raises FaceitApiException: If a page of the history can not be retrieved
+        :return: The new matches, newest first
+        :rtype: List[:class:`.PlayerMatch`]
+        """
+        checkpoint = await store.get(player_id, game.value)
+        if checkpoint is not None:
+            since = checkpoint.finished_at
+        matches = [match async for match in self.iter_player_history(player_id, game, since)
+                   if checkpoint is None or match.match_id != checkpoint.match_id]
+        finished = [match for match in matches if match.finished_at]
+        if finished:
+            newest = max(finished, key=lambda match: match.finished_at)
+            await store.set(player_id, game.value, Checkpoint(newest.finished_at, newest.match_id))
+        return matches
+
+    def player_history_pipeline(self, player_id: str, game: Game, from_: Union[int, datetime.datetime] = None,
+                                to: Union[int, datetime.datetime] = None, match_concurrency: int = 4,
+                                stats_concurrency: int = 4, buffer: int = 16) -> Pipeline:
+        """Stream the matches of a player together with their details and statistics
+
+        The history is paged while the details and statistics of the first matches are requested already. Bounded
+        queues between the stages keep the memory flat, no matter how long the history is. The pipeline yields
+        ``(player_match, match, match_stats)`` tuples in the order they are retrieved and can be extended with
+        further stages via :meth:`.Pipeline.map`.
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
+        :param from_: The timestamp in sec or datetime as lower bound of the query. 1 month ago if not specified
+        :type from_: Union[int, datetime.datetime], optional
+        :param to: The timestamp in sec or datetime as higher bound of the query. Current timestamp if not specified
+        :type to: Union[int, datetime.datetime], optional
+        :param match_concurrency: The number of match details requested at once
+        :type match_concurrency: int, optional
+        :param stats_concurrency: The number of match statistics requested at once
+        :type stats_concurrency: int, optional
+        :param buffer: The maximum number of items waiting between two stages
+        :type buffer: int, optional
+        :raises ValueError: If a concurrency is less than 1
+        :return: Pipeline of the player matches with their details and statistics
+        :rtype: :class:`.Pipeline`
+        """
+        async def with_match(player_match: PlayerMatch) -> Tuple[PlayerMatch, Match]:
+            return player_match, await self.match(player_match.match_id)
+
+        async def with_stats(item: Tuple[PlayerMatch, Match]) -> Tuple[PlayerMatch, Match, MatchStats]:
+            return item[0], item[1], await self.match_stats(item[0].match_id)
+
+        return Pipeline(self.iter_player_history(player_id, game, from_, to), buffer) \
+            .map(with_match, match_concurrency) \
+            .map(with_stats, stats_concurrency)
 
     async def player_hubs(self, player_id: str, offset: int = 0, limit: int = 20) -> Collection[Hub]:
         """Retrieve all hubs of a player
@@ -587,9 +1060,9 @@ class FaceitAPI:
         :return: Hubs list
         :rtype: :class:`.Collection[.Hub]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players/{player_id}/hubs?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'players/{player_id}/hubs?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Hub)
+        return await self.__create_collection(retval, Hub)
 
     async def player_game_stats(self, player_id: str, game: Game) -> PlayerGameStats:
         """Retrieve statistics of a player
@@ -601,9 +1074,9 @@ class FaceitAPI:
         :return: Player stats
         :rtype: :class:`.Collection[.Hub]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players/{player_id}/stats/{game.value}')
+        url = self.__base_url.format(f'players/{player_id}/stats/{game.value}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, PlayerGameStats)
+        return await self.__create_object(retval, PlayerGameStats)
 
     async def player_tournaments(self, player_id: str, offset: int = 0, limit: int = 20) -> Collection[Tournament]:
         """Retrieve all tournaments of a player
@@ -617,9 +1090,9 @@ class FaceitAPI:
         :return: Tournaments list
         :rtype: :class:`.Collection[.Tournament]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'players/{player_id}/tournaments?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'players/{player_id}/tournaments?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Tournament)
+        return await self.__create_collection(retval, Tournament)
     # endregion
 
     # region Rankings
@@ -627,8 +1100,8 @@ class FaceitAPI:
                       limit: int = 20) -> Collection[Rank]:
         """Retrieve global ranking of a game
 
-        :param player_id: The id of the player
-        :type player_id: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
         :param region: A region of a game
         :type region: :class:`.Region`
         :param country: A country code
@@ -637,15 +1110,15 @@ class FaceitAPI:
         :type offset: int, optional
         :param limit: The number of items to return
         :type limit: int, optional
-        :return: Tournaments list
+        :return: Ranking list
         :rtype: :class:`.Collection[.Rank]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'rankings/games/{game.value}/regions/{region.value}?offset={offset}&limit={limit}')
         if country is not None:
             url += f'&country={country.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Rank)
+        return await self.__create_collection(retval, Rank)
 
     async def ranking_of_player(self, game: Game, region: Region, player_id: str, country: Country = None,
                                 limit: int = 20) -> RankCollection[Rank]:
@@ -664,12 +1137,12 @@ class FaceitAPI:
         :return: Tournaments list
         :rtype: :class:`.RankCollection[.Rank]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'rankings/games/{game.value}/regions/{region.value}/players/{player_id}?limit={limit}')
         if country is not None:
             url += f'&country={country.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Rank, RankCollection)
+        return await self.__create_collection(retval, Rank, RankCollection)
     # endregion
 
     # region Search
@@ -693,14 +1166,14 @@ class FaceitAPI:
         :return: List of championship
         :rtype: :class:`.Collection[.ChampionshipSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'search/championships?name={name}&type={type_.value}&offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game}'
         if region is not None:
             url += f'&region={region.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, ChampionshipSearchResult)
+        return await self.__create_collection(retval, ChampionshipSearchResult)
 
     async def search_hubs(self, name: str, game: Game = None, region: Region = None, offset: int = 0,
                           limit: int = 20) -> Collection[ChampionshipSearchResult]:
@@ -719,13 +1192,13 @@ class FaceitAPI:
         :return: List of hub
         :rtype: :class:`.Collection[.ChampionshipSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'search/hubs?name={name}&offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'search/hubs?name={name}&offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game.value}'
         if region is not None:
             url += f'&region={region.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, ChampionshipSearchResult)
+        return await self.__create_collection(retval, ChampionshipSearchResult)
 
     async def search_organizers(self, name: str, offset: int = 0,
                                 limit: int = 20) -> Collection[OrganizerSearchResult]:
@@ -740,9 +1213,9 @@ class FaceitAPI:
         :return: List of organizers
         :rtype: :class:`.Collection[.OrganizerSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'search/organizers?name={name}&offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'search/organizers?name={name}&offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, OrganizerSearchResult)
+        return await self.__create_collection(retval, OrganizerSearchResult)
 
     async def search_players(self, nickname: str, game: Game = None, country: Country = None, offset: int = 0,
                              limit: int = 20) -> Collection[PlayerSearchResult]:
@@ -761,13 +1234,13 @@ class FaceitAPI:
         :return: List of players
         :rtype: :class:`.Collection[.PlayerSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'search/players?nickname={nickname}&offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'search/players?nickname={nickname}&offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game.value}'
         if country is not None:
             url += f'&country={country.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, PlayerSearchResult)
+        return await self.__create_collection(retval, PlayerSearchResult)
 
     async def search_teams(self, nickname: str, game: Game = None, offset: int = 0,
                            limit: int = 20) -> Collection[TeamSearchResult]:
@@ -784,16 +1257,16 @@ class FaceitAPI:
         :return: List of teams
         :rtype: :class:`.Collection[.TeamSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'search/teams?nickname={nickname}&offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'search/teams?nickname={nickname}&offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, TeamSearchResult)
+        return await self.__create_collection(retval, TeamSearchResult)
 
     async def search_tournaments(self, name: str, game: Game = None, region: Region = None,
                                  type_: MatchType = MatchType.ALL, offset: int = 0,
                                  limit: int = 20) -> Collection[TournamentSearchResult]:
-        """Search for teams
+        """Search for tournaments
 
         :param name: The name of a tournament on FACEIT
         :type name: str
@@ -810,14 +1283,14 @@ class FaceitAPI:
         :return: List of tournament
         :rtype: :class:`.Collection[.TournamentSearchResult]`
         """
-        url = FaceitAPI.__BASE_URL.format(
+        url = self.__base_url.format(
             f'search/tournaments?name={name}&type={type_.value}&offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game.value}'
         if region is not None:
             url += f'&region={region.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, TournamentSearchResult)
+        return await self.__create_collection(retval, TournamentSearchResult)
     # endregion
 
     # region Teams
@@ -829,9 +1302,9 @@ class FaceitAPI:
         :return: Team details
         :rtype: :class:`.Team`
         """
-        url = FaceitAPI.__BASE_URL.format(f'teams/{team_id}')
+        url = self.__base_url.format(f'teams/{team_id}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Team)
+        return await self.__create_object(retval, Team)
 
     async def team_game_stats(self, team_id: str, game: Game) -> TeamGameStats:
         """Retrieve statistics of a team
@@ -843,9 +1316,9 @@ class FaceitAPI:
         :return: Team stats
         :rtype: :class:`.TeamGameStats`
         """
-        url = FaceitAPI.__BASE_URL.format(f'teams/{team_id}/stats/{game.value}')
+        url = self.__base_url.format(f'teams/{team_id}/stats/{game.value}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Tournament)
+        return await self.__create_object(retval, Tournament)
 
     async def team_tournaments(self, team_id: str, offset: int = 0, limit: int = 20) -> Collection[Tournament]:
         """Retrieve tournaments of a team
@@ -859,9 +1332,9 @@ class FaceitAPI:
         :return: Tournaments list
         :rtype: :class:`.Collection[.Tournament]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'teams/{team_id}/tournaments?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'teams/{team_id}/tournaments?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Tournament)
+        return await self.__create_collection(retval, Tournament)
     # endregion
 
     # region Tournaments
@@ -880,13 +1353,13 @@ class FaceitAPI:
         :return: Tournaments list
         :rtype: :class:`.Collection[.Tournament]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'tournaments?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'tournaments?offset={offset}&limit={limit}')
         if game is not None:
             url += f'&game={game.value}'
         if region is not None:
             url += f'&region={region.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Tournament)
+        return await self.__create_collection(retval, Tournament)
 
     async def tournament(self, tournament_id: str, expanded: Expansion = Expansion.NONE) -> TournamentData:
         """Retrieve tournament details
@@ -898,11 +1371,11 @@ class FaceitAPI:
         :return: Tournament details
         :rtype: :class:`.TournamentData`
         """
-        url = FaceitAPI.__BASE_URL.format(f'tournaments/{tournament_id}')
+        url = self.__base_url.format(f'tournaments/{tournament_id}')
         if expanded is not Expansion.NONE:
             url += f'?expanded={expanded.value}'
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, TournamentData)
+        return await self.__create_object(retval, TournamentData)
 
     async def tournament_brackets(self, tournament_id: str) -> Brackets:
         """Retrieve brackets of a tournament
@@ -912,9 +1385,9 @@ class FaceitAPI:
         :return: Tournament details
         :rtype: :class:`.Brackets`
         """
-        url = FaceitAPI.__BASE_URL.format(f'tournaments/{tournament_id}/brackets')
+        url = self.__base_url.format(f'tournaments/{tournament_id}/brackets')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, Brackets)
+        return await self.__create_object(retval, Brackets)
 
     async def tournament_matches(self, tournament_id: str, offset: int = 0, limit: int = 20) -> Collection[Match]:
         """Retrieve all matches of a tournament
@@ -928,9 +1401,9 @@ class FaceitAPI:
         :return: Matches list
         :rtype: :class:`.Collection[.Match]`
         """
-        url = FaceitAPI.__BASE_URL.format(f'tournaments/{tournament_id}/matches?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'tournaments/{tournament_id}/matches?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_collection(retval, Match)
+        return await self.__create_collection(retval, Match)
 
     async def tournament_teams(self, tournament_id: str, offset: int = 0, limit: int = 20) -> TournamentTeams:
         """Retrieve all teams of a tournament
@@ -944,7 +1417,551 @@ class FaceitAPI:
         :return: Matches list
         :rtype: :class:`.TournamentTeams`
         """
-        url = FaceitAPI.__BASE_URL.format(f'tournaments/{tournament_id}/teams?offset={offset}&limit={limit}')
+        url = self.__base_url.format(f'tournaments/{tournament_id}/teams?offset={offset}&limit={limit}')
         retval = await self.__make_request('GET', url)
-        return await FaceitAPI.__create_object(retval, TournamentTeams)
+        return await self.__create_object(retval, TournamentTeams)
     # endregion
+
+    # region Bulk
+    async def matches_many(self, match_ids: Iterable[str], concurrency: int = 10,
+                           deadline: float = None) -> List[Union[Match, FaceitApiError]]:
+        """Retrieve many matches with bounded concurrency, see :meth:`match`
+
+        :param match_ids: The ids of the matches
+        :type match_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: The matches or an error per id, in the order of the ids
+        :rtype: List[Union[:class:`.Match`, :class:`.FaceitApiError`]]
+        """
+        return await gather_bounded(self.match, match_ids, concurrency, deadline)
+
+    def matches_as_completed(self, match_ids: Iterable[str], concurrency: int = 10, deadline: float = None) \
+            -> AsyncIterator[Tuple[str, Union[Match, FaceitApiError]]]:
+        """Like :meth:`matches_many`, but yields every id with its result as soon as it is retrieved
+
+        :param match_ids: The ids of the matches
+        :type match_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: Iterator over the ids and their matches or error, in the order they are retrieved
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`.Match`, :class:`.FaceitApiError`]]]
+        """
+        return as_completed_bounded(self.match, match_ids, concurrency, deadline)
+
+    async def match_stats_many(self, match_ids: Iterable[str], concurrency: int = 10,
+                               deadline: float = None) -> List[Union[MatchStats, FaceitApiError]]:
+        """Retrieve the statistics of many matches with bounded concurrency, see :meth:`match_stats`
+
+        :param match_ids: The ids of the matches
+        :type match_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: The statistics or an error per id, in the order of the ids
+        :rtype: List[Union[:class:`.MatchStats`, :class:`.FaceitApiError`]]
+        """
+        return await gather_bounded(self.match_stats, match_ids, concurrency, deadline)
+
+    def match_stats_as_completed(self, match_ids: Iterable[str], concurrency: int = 10, deadline: float = None) \
+            -> AsyncIterator[Tuple[str, Union[MatchStats, FaceitApiError]]]:
+        """Like :meth:`match_stats_many`, but yields every id with its result as soon as it is retrieved
+
+        :param match_ids: The ids of the matches
+        :type match_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: Iterator over the ids and their statistics or error, in the order they are retrieved
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`.MatchStats`, :class:`.FaceitApiError`]]]
+        """
+        return as_completed_bounded(self.match_stats, match_ids, concurrency, deadline)
+
+    async def players_many(self, player_ids: Iterable[str], concurrency: int = 10,
+                           deadline: float = None) -> List[Union[Player, FaceitApiError]]:
+        """Retrieve many players with bounded concurrency, see :meth:`player_by_player_id`
+
+        :param player_ids: The ids of the players
+        :type player_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: The players or an error per id, in the order of the ids
+        :rtype: List[Union[:class:`.Player`, :class:`.FaceitApiError`]]
+        """
+        return await gather_bounded(self.player_by_player_id, player_ids, concurrency, deadline)
+
+    def players_as_completed(self, player_ids: Iterable[str], concurrency: int = 10, deadline: float = None) \
+            -> AsyncIterator[Tuple[str, Union[Player, FaceitApiError]]]:
+        """Like :meth:`players_many`, but yields every id with its result as soon as it is retrieved
+
+        :param player_ids: The ids of the players
+        :type player_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: Iterator over the ids and their players or error, in the order they are retrieved
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`.Player`, :class:`.FaceitApiError`]]]
+        """
+        return as_completed_bounded(self.player_by_player_id, player_ids, concurrency, deadline)
+
+    async def teams_many(self, team_ids: Iterable[str], concurrency: int = 10,
+                         deadline: float = None) -> List[Union[Team, FaceitApiError]]:
+        """Retrieve many teams with bounded concurrency, see :meth:`team`
+
+        :param team_ids: The ids of the teams
+        :type team_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: The teams or an error per id, in the order of the ids
+        :rtype: List[Union[:class:`.Team`, :class:`.FaceitApiError`]]
+        """
+        return await gather_bounded(self.team, team_ids, concurrency, deadline)
+
+    def teams_as_completed(self, team_ids: Iterable[str], concurrency: int = 10, deadline: float = None) \
+            -> AsyncIterator[Tuple[str, Union[Team, FaceitApiError]]]:
+        """Like :meth:`teams_many`, but yields every id with its result as soon as it is retrieved
+
+        :param team_ids: The ids of the teams
+        :type team_ids: Iterable[str]
+        :param concurrency: The maximum number of requests at once
+        :type concurrency: int, optional
+        :param deadline: Seconds until all requests have to be finished, no deadline if not specified
+        :type deadline: float, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: Iterator over the ids and their teams or error, in the order they are retrieved
+        :rtype: AsyncIterator[Tuple[str, Union[:class:`.Team`, :class:`.FaceitApiError`]]]
+        """
+        return as_completed_bounded(self.team, team_ids, concurrency, deadline)
+    # endregion
+
+    # region Pagination
+    def paginate(self, method: Callable[..., Awaitable[Collection]], *args, page_size: int = None,
+                 **kwargs) -> AsyncIterator[Any]:
+        """Iterate over the items of all pages of a collection method
+
+        The pages are requested with the largest page size of the method. The next page is requested while the
+        current one is consumed and the iteration stops after the first page that is not full.
+
+        :param method: A collection method of the api, e.g. ``api.hub_members``
+        :type method: Callable[..., Awaitable[:class:`.Collection`]]
+        :param args: Positional arguments of the method, without offset and limit
+        :param page_size: The number of items per page, the largest the method accepts if not specified
+        :type page_size: int, optional
+        :param kwargs: Keyword arguments of the method, without offset and limit
+        :raises FaceitApiException: If a page can not be retrieved
+        :return: Iterator over the items of all pages
+        :rtype: AsyncIterator[Any]
+        """
+        if page_size is None:
+            page_size = MAX_PAGE_SIZE.get(method.__name__, 20)
+        return paginate(lambda offset, limit: self.__page(method, offset, limit, *args, **kwargs), page_size)
+
+    async def fetch_all_pages(self, method: Callable[..., Awaitable[Collection]], *args, concurrency: int = 4,
+                              max_items: int = None, page_size: int = None, **kwargs) -> List[Any]:
+        """Retrieve the items of all pages of a collection method with concurrent page requests
+
+        Suited for long offset paginated lists like :meth:`ranking`, :meth:`hub_members` or :meth:`leaderboard`.
+        The items are returned in order. Once a page is not full, no further pages are requested.
+
+        :param method: A collection method of the api, e.g. ``api.ranking``
+        :type method: Callable[..., Awaitable[:class:`.Collection`]]
+        :param args: Positional arguments of the method, without offset and limit
+        :param concurrency: The maximum number of pages requested at once
+        :type concurrency: int, optional
+        :param max_items: The maximum number of items to retrieve, all if not specified
+        :type max_items: int, optional
+        :param page_size: The number of items per page, the largest the method accepts if not specified
+        :type page_size: int, optional
+        :param kwargs: Keyword arguments of the method, without offset and limit
+        :raises ValueError: If the concurrency is less than 1
+        :raises FaceitApiException: If a page can not be retrieved
+        :return: The items of all pages
+        :rtype: List[Any]
+        """
+        if page_size is None:
+            page_size = MAX_PAGE_SIZE.get(method.__name__, 20)
+        return await fetch_pages(lambda offset, limit: self.__page(method, offset, limit, *args, **kwargs),
+                                 page_size, concurrency, max_items=max_items)
+
+    async def __page(self, method: Callable[..., Awaitable[Collection]], offset: int, limit: int, *args,
+                     **kwargs) -> Collection:
+        # the pages are read by the pagination helpers, so they are models in raw mode as well
+        with self.raw_mode(False):
+            return await method(*args, offset=offset, limit=limit, **kwargs)
+
+    def iter_championships(self, game: Game, type_: MatchType = MatchType.ALL) -> AsyncIterator[Championship]:
+        """Iterate over all championships of a game
+
+        :param game: The id of the game
+        :type game: :class:`.Game`
+        :param type_: Kind of matches to return. Can be all(default), upcoming, ongoing or past
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`championships`
+        :rtype: AsyncIterator[:class:`.Championship`]
+        """
+        return self.paginate(self.championships, game, type_)
+
+    def iter_championship_matches(self, championship_id: str, type_: MatchType = MatchType.ALL) -> AsyncIterator[Match]:
+        """Iterate over all matches of a championship
+
+        :param championship_id: The id of the championship
+        :type championship_id: str
+        :param type_: Kind of matches to return. Can be all(default), upcoming, ongoing or past
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`championship_matches`
+        :rtype: AsyncIterator[:class:`.Match`]
+        """
+        return self.paginate(self.championship_matches, championship_id, type_)
+
+    def iter_championship_results(self, championship_id: str) -> AsyncIterator[Result]:
+        """Iterate over all results of a championship
+
+        :param championship_id: The id of the championship
+        :type championship_id: str
+        :return: Iterator over the items of all pages, see :meth:`championship_results`
+        :rtype: AsyncIterator[:class:`.Result`]
+        """
+        return self.paginate(self.championship_results, championship_id)
+
+    def iter_championship_subscriptions(self, championship_id: str) -> AsyncIterator[Subscription]:
+        """Iterate over all subscriptions of a championship
+
+        :param championship_id: The id of the championship
+        :type championship_id: str
+        :return: Iterator over the items of all pages, see :meth:`championship_subscriptions`
+        :rtype: AsyncIterator[:class:`.Subscription`]
+        """
+        return self.paginate(self.championship_subscriptions, championship_id)
+
+    def iter_games(self) -> AsyncIterator[GameData]:
+        """Iterate over details of all games on FACEIT
+
+        :return: Iterator over the items of all pages, see :meth:`games`
+        :rtype: AsyncIterator[:class:`.GameData`]
+        """
+        return self.paginate(self.games)
+
+    def iter_hub_matches(self, hub_id: str, type_: MatchType = MatchType.ALL) -> AsyncIterator[Match]:
+        """Iterate over all matches of a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :param type_: Kind of matches to return. Can be all(default), upcoming, ongoing or past
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`hub_matches`
+        :rtype: AsyncIterator[:class:`.Match`]
+        """
+        return self.paginate(self.hub_matches, hub_id, type_)
+
+    def iter_hub_members(self, hub_id: str) -> AsyncIterator[Member]:
+        """Iterate over all members of a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :return: Iterator over the items of all pages, see :meth:`hub_members`
+        :rtype: AsyncIterator[:class:`.Member`]
+        """
+        return self.paginate(self.hub_members, hub_id)
+
+    def iter_hub_roles(self, hub_id: str) -> AsyncIterator[Role]:
+        """Iterate over all roles members can have in a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :return: Iterator over the items of all pages, see :meth:`hub_roles`
+        :rtype: AsyncIterator[:class:`.Role`]
+        """
+        return self.paginate(self.hub_roles, hub_id)
+
+    def iter_leaderboards_championship(self, championship_id: str) -> AsyncIterator[Leaderboard]:
+        """Iterate over all leaderboards of a championship
+
+        :param championship_id: The id of the championship
+        :type championship_id: str
+        :return: Iterator over the items of all pages, see :meth:`leaderboards_championship`
+        :rtype: AsyncIterator[:class:`.Leaderboard`]
+        """
+        return self.paginate(self.leaderboards_championship, championship_id)
+
+    def iter_leaderboards_championship_groups(self, championship_id: str, group: int) -> AsyncIterator[Ranking]:
+        """Iterate over group ranking of a championship
+
+        :param championship_id: The id of the championship
+        :type championship_id: str
+        :param group: A group of the championship
+        :type group: int
+        :return: Iterator over the items of all pages, see :meth:`leaderboards_championship_groups`
+        :rtype: AsyncIterator[:class:`.Ranking`]
+        """
+        return self.paginate(self.leaderboards_championship_groups, championship_id, group)
+
+    def iter_leaderboards_hub(self, hub_id: str) -> AsyncIterator[Leaderboard]:
+        """Iterate over all leaderboards of a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :return: Iterator over the items of all pages, see :meth:`leaderboards_hub`
+        :rtype: AsyncIterator[:class:`.Leaderboard`]
+        """
+        return self.paginate(self.leaderboards_hub, hub_id)
+
+    def iter_leaderboards_hub_general(self, hub_id: str) -> AsyncIterator[Ranking]:
+        """Iterate over all time ranking of a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :return: Iterator over the items of all pages, see :meth:`leaderboards_hub_general`
+        :rtype: AsyncIterator[:class:`.Ranking`]
+        """
+        return self.paginate(self.leaderboards_hub_general, hub_id)
+
+    def iter_leaderboards_hub_season(self, hub_id: str, season: int) -> AsyncIterator[Ranking]:
+        """Iterate over seasonal ranking of a hub
+
+        :param hub_id: The id of the hub
+        :type hub_id: str
+        :param season: A season of the hub
+        :type season: int
+        :return: Iterator over the items of all pages, see :meth:`leaderboards_hub_season`
+        :rtype: AsyncIterator[:class:`.Ranking`]
+        """
+        return self.paginate(self.leaderboards_hub_season, hub_id, season)
+
+    def iter_leaderboard(self, leaderboard_id: str) -> AsyncIterator[Ranking]:
+        """Iterate over all rankings of a leaderboard
+
+        :param leaderboard_id: The id of the leaderboard
+        :type leaderboard_id: str
+        :return: Iterator over the items of all pages, see :meth:`leaderboard`
+        :rtype: AsyncIterator[:class:`.Ranking`]
+        """
+        return self.paginate(self.leaderboard, leaderboard_id)
+
+    def iter_organizer_championships(self, organizer_id: str) -> AsyncIterator[Championship]:
+        """Iterate over all championships of an organizer
+
+        :param organizer_id: The id of the organizer
+        :type organizer_id: str
+        :return: Iterator over the items of all pages, see :meth:`organizer_championships`
+        :rtype: AsyncIterator[:class:`.Championship`]
+        """
+        return self.paginate(self.organizer_championships, organizer_id)
+
+    def iter_organizer_hubs(self, organizer_id: str) -> AsyncIterator[Hub]:
+        """Iterate over all hubs of an organizer
+
+        :param organizer_id: The id of the organizer
+        :type organizer_id: str
+        :return: Iterator over the items of all pages, see :meth:`organizer_hubs`
+        :rtype: AsyncIterator[:class:`.Hub`]
+        """
+        return self.paginate(self.organizer_hubs, organizer_id)
+
+    def iter_organizer_tournaments(self, organizer_id: str,
+                                   type_: MatchType = MatchType.UPCOMING) -> AsyncIterator[Tournament]:
+        """Iterate over all tournaments of an organizer
+
+        :param organizer_id: The id of the organizer
+        :type organizer_id: str
+        :param type_: Kind of tournament. Can be upcoming(default) or past
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`organizer_tournaments`
+        :rtype: AsyncIterator[:class:`.Tournament`]
+        """
+        return self.paginate(self.organizer_tournaments, organizer_id, type_)
+
+    def iter_player_history(self, player_id: str, game: Game, from_: Union[int, datetime.datetime] = None,
+                            to: Union[int, datetime.datetime] = None) -> AsyncIterator[PlayerMatch]:
+        """Iterate over all matches of a player
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
+        :param from_: The timestamp in sec or datetime as lower bound of the query. 1 month ago if not specified
+        :type from_: Union[int, datetime.datetime], optional
+        :param to: The timestamp in sec or datetime as higher bound of the query. Current timestamp if not specified
+        :type to: Union[int, datetime.datetime], optional
+        :return: Iterator over the items of all pages, see :meth:`player_history`
+        :rtype: AsyncIterator[:class:`.PlayerMatch`]
+        """
+        return self.paginate(self.player_history, player_id, game, from_, to)
+
+    def iter_player_hubs(self, player_id: str) -> AsyncIterator[Hub]:
+        """Iterate over all hubs of a player
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :return: Iterator over the items of all pages, see :meth:`player_hubs`
+        :rtype: AsyncIterator[:class:`.Hub`]
+        """
+        return self.paginate(self.player_hubs, player_id)
+
+    def iter_player_tournaments(self, player_id: str) -> AsyncIterator[Tournament]:
+        """Iterate over all tournaments of a player
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :return: Iterator over the items of all pages, see :meth:`player_tournaments`
+        :rtype: AsyncIterator[:class:`.Tournament`]
+        """
+        return self.paginate(self.player_tournaments, player_id)
+
+    def iter_ranking(self, game: Game, region: Region, country: Country = None) -> AsyncIterator[Rank]:
+        """Iterate over the global ranking of a game
+
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`
+        :param region: A region of a game
+        :type region: :class:`.Region`
+        :param country: A country code
+        :type country: :class:`.Country`, optional
+        :return: Iterator over the items of all pages, see :meth:`ranking`
+        :rtype: AsyncIterator[:class:`.Rank`]
+        """
+        return self.paginate(self.ranking, game, region, country)
+
+    def iter_search_championships(self, name: str, game: Game = None, region: Region = None,
+                                  type_: MatchType = MatchType.ALL) -> AsyncIterator[ChampionshipSearchResult]:
+        """Iterate over all search results for championships
+
+        :param name: The name of a championship on FACEIT
+        :type name: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :param region: A region of a game
+        :type region: :class:`.Region`, optional
+        :param type_: Kind of competitions to return
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`search_championships`
+        :rtype: AsyncIterator[:class:`.ChampionshipSearchResult`]
+        """
+        return self.paginate(self.search_championships, name, game, region, type_)
+
+    def iter_search_hubs(self, name: str, game: Game = None,
+                         region: Region = None) -> AsyncIterator[ChampionshipSearchResult]:
+        """Iterate over all search results for hubs
+
+        :param name: The name of a hub on FACEIT
+        :type name: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :param region: A region of a game
+        :type region: :class:`.Region`, optional
+        :return: Iterator over the items of all pages, see :meth:`search_hubs`
+        :rtype: AsyncIterator[:class:`.ChampionshipSearchResult`]
+        """
+        return self.paginate(self.search_hubs, name, game, region)
+
+    def iter_search_organizers(self, name: str) -> AsyncIterator[OrganizerSearchResult]:
+        """Iterate over all search results for organizers
+
+        :param name: The name of a organizer on FACEIT
+        :type name: str
+        :return: Iterator over the items of all pages, see :meth:`search_organizers`
+        :rtype: AsyncIterator[:class:`.OrganizerSearchResult`]
+        """
+        return self.paginate(self.search_organizers, name)
+
+    def iter_search_players(self, nickname: str, game: Game = None,
+                            country: Country = None) -> AsyncIterator[PlayerSearchResult]:
+        """Iterate over all search results for players
+
+        :param nickname: The nickname of a player on FACEIT
+        :type nickname: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :param country: A country code
+        :type country: :class:`.Country`, optional
+        :return: Iterator over the items of all pages, see :meth:`search_players`
+        :rtype: AsyncIterator[:class:`.PlayerSearchResult`]
+        """
+        return self.paginate(self.search_players, nickname, game, country)
+
+    def iter_search_teams(self, nickname: str, game: Game = None) -> AsyncIterator[TeamSearchResult]:
+        """Iterate over all search results for teams
+
+        :param nickname: The nickname of a team on FACEIT
+        :type nickname: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :return: Iterator over the items of all pages, see :meth:`search_teams`
+        :rtype: AsyncIterator[:class:`.TeamSearchResult`]
+        """
+        return self.paginate(self.search_teams, nickname, game)
+
+    def iter_search_tournaments(self, name: str, game: Game = None, region: Region = None,
+                                type_: MatchType = MatchType.ALL) -> AsyncIterator[TournamentSearchResult]:
+        """Iterate over all search results for tournaments
+
+        :param name: The name of a tournament on FACEIT
+        :type name: str
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :param region: A region of a game
+        :type region: :class:`.Region`, optional
+        :param type_: Kind of competitions to return
+        :type type_: :class:`.MatchType`, optional
+        :return: Iterator over the items of all pages, see :meth:`search_tournaments`
+        :rtype: AsyncIterator[:class:`.TournamentSearchResult`]
+        """
+        return self.paginate(self.search_tournaments, name, game, region, type_)
+
+    def iter_team_tournaments(self, team_id: str) -> AsyncIterator[Tournament]:
+        """Iterate over tournaments of a team
+
+        :param team_id: The id of the team
+        :type team_id: str
+        :return: Iterator over the items of all pages, see :meth:`team_tournaments`
+        :rtype: AsyncIterator[:class:`.Tournament`]
+        """
+        return self.paginate(self.team_tournaments, team_id)
+
+    def iter_tournaments(self, game: Game = None, region: Region = None) -> AsyncIterator[Tournament]:
+        """Iterate over tournaments v1 (no longer used)
+
+        :param game: A game on FACEIT
+        :type game: :class:`.Game`, optional
+        :param region: A region of a game
+        :type region: :class:`.Region`, optional
+        :return: Iterator over the items of all pages, see :meth:`tournaments`
+        :rtype: AsyncIterator[:class:`.Tournament`]
+        """
+        return self.paginate(self.tournaments, game, region)
+
+    def iter_tournament_matches(self, tournament_id: str) -> AsyncIterator[Match]:
+        """Iterate over all matches of a tournament
+
+        :param tournament_id: The id of the tournament
+        :type tournament_id: str
+        :return: Iterator over the items of all pages, see :meth:`tournament_matches`
+        :rtype: AsyncIterator[:class:`.Match`]
+        """
+        return self.paginate(self.tournament_matches, tournament_id)
+    # endregion
+
+
+def __getattr__(name: str):
+    # the enums used to be star imported into this module, Country is created on first use
+    if name == 'Country':
+        from .enums import Country
+        return Country
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
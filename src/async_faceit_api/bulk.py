@@ -0,0 +1,98 @@
+"""
+Bounded concurrent requests for many ids with results per id
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Tuple, Union
+
+from .dataclasses import FaceitApiError, FaceitApiException
+
+
+async def _run(function: Callable[[Any], Awaitable[Any]], ids: List[Any], concurrency: int,
+               deadline: Union[float, None]) -> AsyncIterator[Tuple[int, Any]]:
+    if concurrency < 1:
+        # no worker would ever be started and the callers would wait forever
+        raise ValueError(f'The concurrency has to be at least 1, got {concurrency}')
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = iter(enumerate(ids))
+
+    async def worker():
+        from aiohttp import ClientError
+        # all workers share one iterator, so every id is requested once
+        for index, id_ in pending:
+            try:
+                queue.put_nowait((index, await function(id_), None))
+            except FaceitApiException as e:
+                queue.put_nowait((index, e.error, None))
+            except (ClientError, asyncio.TimeoutError) as e:
+                queue.put_nowait((index, FaceitApiError(str(e) or type(e).__name__, 503), None))
+            except Exception as e:
+                queue.put_nowait((index, None, e))
+
+    loop = asyncio.get_running_loop()
+    end = None if deadline is None else loop.time() + deadline
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(ids)))]
+    finished = set()
+    try:
+        while len(finished) < len(ids):
+            try:
+                index, result, exception = await asyncio.wait_for(queue.get(), None if end is None
+                                                                  else max(end - loop.time(), 0))
+            except asyncio.TimeoutError:
+                break
+            if exception is not None:
+                raise exception
+            finished.add(index)
+            yield index, result
+    finally:
+        for task in workers:
+            task.cancel()
+    for index in range(len(ids)):
+        if index not in finished:
+            yield index, FaceitApiError('Deadline exceeded', 504)
+
+
+async def gather_bounded(function: Callable[[Any], Awaitable[Any]], ids: Iterable[Any], concurrency: int = 10,
+                         deadline: float = None) -> List[Any]:
+    """Call the function for every id with at most ``concurrency`` calls at once
+
+    Failed calls do not fail the others. Their :class:`.FaceitApiError` is put at the position of the id, network
+    errors become an error with status code 503 and ids not finished before the deadline one with 504.
+
+    :param function: The api method to call with every id, e.g. ``api.match_stats``
+    :type function: Callable[[Any], Awaitable[Any]]
+    :param ids: The ids to call the function with
+    :type ids: Iterable[Any]
+    :param concurrency: The maximum number of calls at once
+    :type concurrency: int, optional
+    :param deadline: Seconds until all calls have to be finished, no deadline if not specified
+    :type deadline: float, optional
+    :raises ValueError: If the concurrency is less than 1
+    :return: The results in the order of the ids
+    :rtype: List[Any]
+    """
+    ids = list(ids)
+    results: List[Any] = [None] * len(ids)
+    async for index, result in _run(function, ids, concurrency, deadline):
+        results[index] = result
+    return results
+
+
+async def as_completed_bounded(function: Callable[[Any], Awaitable[Any]], ids: Iterable[Any],
+                               concurrency: int = 10, deadline: float = None) -> AsyncIterator[Tuple[Any, Any]]:
+    """Like :func:`gather_bounded`, but yields every id with its result as soon as it is finished
+
+    :param function: The api method to call with every id, e.g. ``api.match_stats``
+    :type function: Callable[[Any], Awaitable[Any]]
+    :param ids: The ids to call the function with
+    :type ids: Iterable[Any]
+    :param concurrency: The maximum number of calls at once
+    :type concurrency: int, optional
+    :param deadline: Seconds until all calls have to be finished, no deadline if not specified
+    :type deadline: float, optional
+    :raises ValueError: If the concurrency is less than 1
+    :return: Iterator over the ids and their results in the order they finish
+    :rtype: AsyncIterator[Tuple[Any, Any]]
+    """
+    ids = list(ids)
+    async for index, result in _run(function, ids, concurrency, deadline):
+        yield ids[index], result
@@ -0,0 +1,446 @@
+"""
+In-memory caching of the responses received by :class:`.FaceitAPI`
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterable, Mapping, Tuple, Union
+
+_MINUTE = 60
+_HOUR = 60 * _MINUTE
+_DAY = 24 * _HOUR
+
+DEFAULT_TTLS: Dict[str, float] = {
+    'games': _DAY,
+    'games/*': _DAY,
+    'organizers/*/*': 10 * _MINUTE,
+    'organizers': _DAY,
+    'organizers/*': _DAY,
+    'matches/*/stats': 30,
+    'matches/*': 10,
+    'hubs/*/matches': 5,
+    'hubs/*/*': _MINUTE,
+    'hubs/*': _HOUR,
+    'championships/*/*': _MINUTE,
+    'championships/*': _HOUR,
+    'players/*/history': _MINUTE,
+    'players': 5 * _MINUTE,
+    'players/*': 5 * _MINUTE,
+    'teams/*': _HOUR,
+}
+"""Seconds responses are cached per endpoint family, the first matching pattern applies"""
+
+DEFAULT_REVALIDATED: Tuple[str, ...] = ('games/*', 'organizers/*', 'hubs/*', 'championships/*', 'teams/*')
+"""Endpoint families of slowly changing resources that are revalidated once their ttl passed"""
+
+
+class CacheStats:
+    __slots__ = ('hits', 'misses', 'evictions', 'expirations', 'revalidations', 'not_modified', 'bytes_saved',
+                 'stale_hits', 'refreshes', 'refresh_errors')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        """Entries removed to stay within the entry and byte limits"""
+        self.expirations = 0
+        """Entries removed because their ttl passed"""
+        self.revalidations = 0
+        """Conditional requests sent for expired entries"""
+        self.not_modified = 0
+        """Conditional requests answered with 304 Not Modified"""
+        self.bytes_saved = 0
+        """Size of the bodies that were not downloaded again thanks to 304 Not Modified"""
+        self.stale_hits = 0
+        """Responses past their ttl returned while they were refreshed in the background"""
+        self.refreshes = 0
+        """Background refreshes of stale responses"""
+        self.refresh_errors = 0
+        """Background refreshes that raised an exception"""
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def not_modified_ratio(self) -> float:
+        return self.not_modified / self.revalidations if self.revalidations else 0.0
+
+    def __repr__(self) -> str:
+        return (f'CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, '
+                f'expirations={self.expirations}, revalidations={self.revalidations}, '
+                f'not_modified={self.not_modified}, bytes_saved={self.bytes_saved}, stale_hits={self.stale_hits}, '
+                f'refreshes={self.refreshes}, refresh_errors={self.refresh_errors})')
+
+
+class _Entry:
+    __slots__ = ('expires', 'stale_until', 'size', 'response', 'etag', 'last_modified')
+
+    def __init__(self, expires: float, stale_until: float, size: int, response: Tuple[int, Any], etag: str = None,
+                 last_modified: str = None):
+        self.expires = expires
+        self.stale_until = stale_until
+        self.size = size
+        self.response = response
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+class ResponseCache:
+    """
+    Least recently used cache of responses with a time to live per endpoint family.
+
+    The cache is bounded by the number of entries and by the size of the response bodies. Endpoint families
+    without a ttl are not cached. :class:`.FaceitAPI` caches the encoded bodies and decodes them for every caller,
+    so a caller changing its response does not change the cached one::
+
+        api = FaceitAPI(api_key, cache=ResponseCache(max_entries=10_000, ttls={'players/*': 60}))
+
+    Expired responses of revalidated endpoint families are kept if they came with an ``ETag`` or ``Last-Modified``
+    header. They are requested again with ``If-None-Match`` and ``If-Modified-Since``, a ``304 Not Modified``
+    renews the cached response without downloading it again.
+
+    Endpoint families with a hard ttl are served stale: past their ttl, :meth:`lookup` still returns a response
+    until its hard ttl passed and :class:`.FaceitAPI` refreshes it in the background.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024,
+                 ttls: Mapping[str, float] = None, default_ttl: float = 0,
+                 revalidated: Iterable[str] = DEFAULT_REVALIDATED, hard_ttls: Mapping[str, float] = None):
+        """
+        :param max_entries: Maximum number of cached responses
+        :type max_entries: int, optional
+        :param max_bytes: Maximum summed size of the cached response bodies
+        :type max_bytes: int, optional
+        :param ttls: Seconds to cache the responses per endpoint family pattern, :data:`DEFAULT_TTLS` if not specified
+        :type ttls: Mapping[str, float], optional
+        :param default_ttl: Seconds to cache responses of endpoint families without a pattern, 0 disables caching
+        :type default_ttl: float, optional
+        :param revalidated: Patterns of the endpoint families revalidated with conditional requests, empty disables
+            conditional requests
+        :type revalidated: Iterable[str], optional
+        :param hard_ttls: Seconds responses may be returned stale per endpoint family pattern, counted like the ttl
+            from when they were cached. Families without a pattern are not returned past their ttl
+        :type hard_ttls: Mapping[str, float], optional
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.revalidated = tuple(revalidated)
+        self.hard_ttls = dict({} if hard_ttls is None else hard_ttls)
+        self.stats = CacheStats()
+        self.__entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self.__bytes = 0
+        self.__resolved: Dict[str, float] = {}
+        self.__resolved_hard: Dict[str, float] = {}
+        self.__resolved_revalidated: Dict[str, bool] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def size(self) -> int:
+        """Summed size of the cached response bodies in bytes"""
+        return self.__bytes
+
+    def ttl(self, endpoint: str) -> float:
+        """Get the seconds responses of an endpoint family are cached
+
+        :param endpoint: The endpoint family, see :func:`.endpoint_of`
+        :type endpoint: str
+        :return: The time to live, 0 if the responses are not cached
+        :rtype: float
+        """
+        try:
+            return self.__resolved[endpoint]
+        except KeyError:
+            ttl = next((t for p, t in self.ttls.items() if fnmatchcase(endpoint, p)), self.default_ttl)
+            self.__resolved[endpoint] = ttl
+            return ttl
+
+    def hard_ttl(self, endpoint: str) -> float:
+        """Get the seconds responses of an endpoint family may be returned stale by :meth:`lookup`
+
+        :param endpoint: The endpoint family, see :func:`.endpoint_of`
+        :type endpoint: str
+        :return: The hard time to live, the ttl if responses are not returned stale
+        :rtype: float
+        """
+        try:
+            return self.__resolved_hard[endpoint]
+        except KeyError:
+            ttl = self.ttl(endpoint)
+            hard_ttl = max(next((t for p, t in self.hard_ttls.items() if fnmatchcase(endpoint, p)), ttl), ttl)
+            self.__resolved_hard[endpoint] = hard_ttl
+            return hard_ttl
+
+    def set_ttl(self, pattern: str, ttl: float, hard_ttl: float = None):
+        """Set the ttl and hard ttl of an endpoint family pattern, it takes precedence over the other patterns
+
+        Responses that are already cached keep their times to live.
+
+        :param pattern: The endpoint family pattern, e.g. ``players/*/stats/*``
+        :type pattern: str
+        :param ttl: Seconds to cache the responses, 0 disables caching
+        :type ttl: float
+        :param hard_ttl: Seconds the responses may be returned stale, None if they are not returned past their ttl
+        :type hard_ttl: float, optional
+        """
+        self.ttls = {pattern: ttl, **{p: t for p, t in self.ttls.items() if p != pattern}}
+        others = {p: t for p, t in self.hard_ttls.items() if p != pattern}
+        self.hard_ttls = others if hard_ttl is None else {pattern: hard_ttl, **others}
+        self.__resolved.clear()
+        self.__resolved_hard.clear()
+
+    def is_revalidated(self, endpoint: str) -> bool:
+        """Check whether expired responses of an endpoint family are revalidated with conditional requests
+
+        :param endpoint: The endpoint family, see :func:`.endpoint_of`
+        :type endpoint: str
+        :return: True if the family matches one of the revalidated patterns
+        :rtype: bool
+        """
+        try:
+            return self.__resolved_revalidated[endpoint]
+        except KeyError:
+            revalidated = any(fnmatchcase(endpoint, p) for p in self.revalidated)
+            self.__resolved_revalidated[endpoint] = revalidated
+            return revalidated
+
+    def get(self, key: str) -> Union[Tuple[int, Any], None]:
+        """Get a cached response within its ttl
+
+        :param key: The canonical url of the request
+        :type key: str
+        :return: Status code and body or None if not cached
+        :rtype: Union[Tuple[int, Any], None]
+        """
+        return self.__lookup(key, False)[0]
+
+    def lookup(self, key: str) -> Tuple[Union[Tuple[int, Any], None], bool]:
+        """Get a cached response within its ttl or stale within its hard ttl
+
+        :param key: The canonical url of the request
+        :type key: str
+        :return: Status code and body or None if not cached, and whether the response is stale and should
+            be refreshed
+        :rtype: Tuple[Union[Tuple[int, Any], None], bool]
+        """
+        return self.__lookup(key, True)
+
+    def __lookup(self, key: str, stale: bool) -> Tuple[Union[Tuple[int, Any], None], bool]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None, False
+        now = time.monotonic()
+        if entry.expires <= now:
+            if now < entry.stale_until:
+                if stale:
+                    self.__entries.move_to_end(key)
+                    self.stats.stale_hits += 1
+                    return entry.response, True
+            # expired responses with validators are kept until they are revalidated or evicted
+            elif entry.etag is None and entry.last_modified is None:
+                self.__remove(key)
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return None, False
+        self.__entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.response, False
+
+    def validators(self, key: str) -> Union[Dict[str, str], None]:
+        """Get the headers of a conditional request revalidating an expired response
+
+        :param key: The canonical url of the request
+        :type key: str
+        :return: ``If-None-Match`` and ``If-Modified-Since`` headers or None if there is no response to revalidate
+        :rtype: Union[Dict[str, str], None]
+        """
+        entry = self.__entries.get(key)
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return None
+        headers = {}
+        if entry.etag is not None:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified is not None:
+            headers['If-Modified-Since'] = entry.last_modified
+        self.stats.revalidations += 1
+        return headers
+
+    def not_modified(self, key: str, endpoint: str, headers: Mapping[str, str] = None) \
+            -> Union[Tuple[int, Any], None]:
+        """Renew an expired response for another ttl after the server answered 304 Not Modified
+
+        :param key: The canonical url of the request
+        :type key: str
+        :param endpoint: The endpoint family of the request
+        :type endpoint: str
+        :param headers: The headers of the 304 response, they may update the validators
+        :type headers: Mapping[str, str], optional
+        :return: Status code and body of the cached response or None if it was evicted meanwhile
+        :rtype: Union[Tuple[int, Any], None]
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        entry.expires = now + self.ttl(endpoint)
+        entry.stale_until = now + self.hard_ttl(endpoint)
+        if headers is not None:
+            entry.etag = headers.get('ETag', entry.etag)
+            entry.last_modified = headers.get('Last-Modified', entry.last_modified)
+        self.__entries.move_to_end(key)
+        self.stats.not_modified += 1
+        self.stats.bytes_saved += entry.size
+        return entry.response
+
+    def put(self, key: str, endpoint: str, response: Tuple[int, Any], size: int,
+            headers: Mapping[str, str] = None):
+        """Cache a response for the ttl of its endpoint family
+
+        :param key: The canonical url of the request
+        :type key: str
+        :param endpoint: The endpoint family of the request
+        :type endpoint: str
+        :param response: Status code and body
+        :type response: Tuple[int, Any]
+        :param size: Size of the response body in bytes
+        :type size: int
+        :param headers: The headers of the response, its ``ETag`` and ``Last-Modified`` are kept for revalidation
+        :type headers: Mapping[str, str], optional
+        """
+        ttl = self.ttl(endpoint)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self.__entries:
+            self.__remove(key)
+        now = time.monotonic()
+        if headers is not None and self.is_revalidated(endpoint):
+            self.__entries[key] = _Entry(now + ttl, now + self.hard_ttl(endpoint), size, response,
+                                         headers.get('ETag'), headers.get('Last-Modified'))
+        else:
+            self.__entries[key] = _Entry(now + ttl, now + self.hard_ttl(endpoint), size, response)
+        self.__bytes += size
+        while len(self.__entries) > self.max_entries or self.__bytes > self.max_bytes:
+            self.__remove(next(iter(self.__entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str):
+        """Remove a cached response"""
+        if key in self.__entries:
+            self.__remove(key)
+
+    def clear(self):
+        """Remove all cached responses"""
+        self.__entries.clear()
+        self.__bytes = 0
+
+    def __remove(self, key: str):
+        self.__bytes -= self.__entries.pop(key).size
+
+
+def is_final(endpoint: str, json_response: Any) -> bool:
+    """Check whether a response of a match can never change anymore
+
+    A match is final once it is finished or cancelled. Match stats are final once a team won the majority of
+    the maps of the series.
+
+    :param endpoint: The endpoint family of the request
+    :type endpoint: str
+    :param json_response: The decoded body of a successful response
+    :type json_response: Any
+    :return: True if the response is final
+    :rtype: bool
+    """
+    if endpoint == 'matches/*':
+        return json_response.get('status') in ('FINISHED', 'CANCELLED') or bool(json_response.get('finished_at'))
+    if endpoint == 'matches/*/stats':
+        rounds = json_response.get('rounds')
+        if not rounds:
+            return False
+        try:
+            best_of = int(rounds[0].get('best_of', 1))
+        except (TypeError, ValueError):
+            return False
+        winners = Counter(round_.get('round_stats', {}).get('Winner') for round_ in rounds)
+        winners.pop(None, None)
+        return bool(winners) and winners.most_common(1)[0][1] > best_of // 2
+    return False
+
+
+class SQLiteMatchStore:
+    """
+    Persistent store for the final responses of :meth:`.FaceitAPI.match` and :meth:`.FaceitAPI.match_stats`.
+
+    Finished matches never change, so their responses are kept forever in a local SQLite file and served without
+    a request, also across restarts. Matches that are not final are left to the :class:`.ResponseCache`::
+
+        api = FaceitAPI(api_key, match_store=SQLiteMatchStore('matches.sqlite'))
+    """
+
+    ENDPOINTS = frozenset({'matches/*', 'matches/*/stats'})
+    """Endpoint families kept in the store"""
+
+    def __init__(self, path: str = 'faceit_matches.sqlite'):
+        """
+        :param path: Path of the SQLite file, ``:memory:`` keeps the store in memory
+        :type path: str, optional
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        import sqlite3
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body TEXT NOT NULL)')
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __get(self, key: str) -> Union[str, None]:
+        with self.__lock:
+            row = self.__connection.execute('SELECT body FROM responses WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def __put(self, key: str, body: str):
+        with self.__lock, self.__connection:
+            self.__connection.execute('INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)', (key, body))
+
+    async def get(self, key: str) -> Union[Any, None]:
+        """Get a stored response
+
+        :param key: The path of the request relative to the api root
+        :type key: str
+        :return: The decoded body or None if not stored
+        :rtype: Union[Any, None]
+        """
+        body = await asyncio.to_thread(self.__get, key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(body)
+
+    async def put(self, key: str, json_response: Any):
+        """Store a final response
+
+        :param key: The path of the request relative to the api root
+        :type key: str
+        :param json_response: The decoded body
+        :type json_response: Any
+        """
+        await asyncio.to_thread(self.__put, key, json.dumps(json_response, separators=(',', ':')))
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self.__lock:
+            self.__connection.close()
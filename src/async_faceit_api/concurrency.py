@@ -0,0 +1,133 @@
+"""
+Adaptive limit of the requests :class:`.FaceitAPI` has in flight
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Union
+
+
+class AdaptiveLimiter:
+    """
+    Limits the requests in flight with additive increase and multiplicative decrease (AIMD).
+
+    Every healthy response raises the limit by ``increase / limit``, so about by ``increase`` per round trip of
+    all requests in flight. A 429 or 5xx response, a request failing without response or a latency above
+    ``latency_tolerance`` times the usual latency cuts the limit to ``decrease`` times its value. Responses of
+    requests started before the last cut do not cut it again::
+
+        limiter = AdaptiveLimiter(initial=8, max_limit=128)
+        api = FaceitAPI(api_key, concurrency_limiter=limiter)
+        await api.match_stats_many(match_ids, concurrency=1000)
+        print(limiter.limit)
+    """
+
+    def __init__(self, initial: int = 8, min_limit: int = 1, max_limit: int = 256, increase: float = 1.0,
+                 decrease: float = 0.75, latency_tolerance: float = 2.0, smoothing: float = 0.1):
+        """
+        :param initial: The limit to start with
+        :type initial: int, optional
+        :param min_limit: The limit is never cut below this
+        :type min_limit: int, optional
+        :param max_limit: The limit is never raised above this
+        :type max_limit: int, optional
+        :param increase: Raise of the limit per round trip while the responses are healthy
+        :type increase: float, optional
+        :param decrease: Factor the limit is cut by when the server is overloaded
+        :type decrease: float, optional
+        :param latency_tolerance: Latencies above this multiple of the usual latency count as overload
+        :type latency_tolerance: float, optional
+        :param smoothing: Weight of a new latency in the moving average of the usual latency
+        :type smoothing: float, optional
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.latency: Union[float, None] = None
+        """Moving average of the latency of the healthy responses in seconds"""
+        self.decreases = 0
+        """Number of times the limit was cut"""
+        self.throttled = 0
+        """Responses with status 429 or 5xx and requests failing without response"""
+        self.spikes = 0
+        """Responses with a latency above the tolerance"""
+        self.__limit = float(min(max(initial, min_limit), max_limit))
+        self.__in_flight = 0
+        self.__decreased_at = 0.0
+        self.__waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight"""
+        return int(self.__limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests in flight"""
+        return self.__in_flight
+
+    def __repr__(self) -> str:
+        return (f'AdaptiveLimiter(limit={self.limit}, in_flight={self.__in_flight}, decreases={self.decreases}, '
+                f'throttled={self.throttled}, spikes={self.spikes})')
+
+    def __wake(self):
+        while self.__waiters and self.__in_flight < self.limit:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                self.__in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> float:
+        """Wait until a request may be sent, it is in flight until :meth:`release`
+
+        :return: The monotonic time the request started, to be passed to :meth:`observe`
+        :rtype: float
+        """
+        if self.__in_flight < self.limit and not self.__waiters:
+            self.__in_flight += 1
+            return time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over just before the cancellation
+                self.__in_flight -= 1
+                self.__wake()
+            raise
+        return time.monotonic()
+
+    def release(self):
+        """Mark a request as finished"""
+        self.__in_flight -= 1
+        self.__wake()
+
+    def observe(self, started: float, latency: float, status: int = None):
+        """Adapt the limit to the outcome of a request
+
+        :param started: The time returned by :meth:`acquire`
+        :type started: float
+        :param latency: Seconds until the response arrived or the request failed
+        :type latency: float
+        :param status: The status code of the response, None if the request failed without response
+        :type status: int, optional
+        """
+        if status is None or status == 429 or status >= 500:
+            self.throttled += 1
+        elif self.latency is not None and latency > self.latency_tolerance * self.latency:
+            self.spikes += 1
+            # the usual latency follows lasting changes, also if they are above the tolerance
+            self.latency += self.smoothing * (latency - self.latency)
+        else:
+            self.latency = latency if self.latency is None else self.latency + self.smoothing * (latency - self.latency)
+            self.__limit = min(self.__limit + self.increase / self.__limit, float(self.max_limit))
+            self.__wake()
+            return
+        if started >= self.__decreased_at:
+            self.__limit = max(self.__limit * self.decrease, float(self.min_limit))
+            self.__decreased_at = time.monotonic()
+            self.decreases += 1
@@ -1,24 +1,237 @@
-from typing import List, Union, TypeVar, Generic
+from contextvars import ContextVar
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union, TypeVar, Generic
+
+_NO_EXTRA: Mapping[str, Any] = MappingProxyType({})
+# set while a lazy response is materialised, so its nested responses are created lazily as well
+_lazy: ContextVar[bool] = ContextVar('lazy', default=False)
+
+R = TypeVar("R", bound='FaceitApiResponse')
+
+_slots: Dict[type, Tuple[str, ...]] = {}
+_getters: Dict[type, Callable[[Any], tuple]] = {}
+_setters: Dict[type, Callable[[Any, tuple], None]] = {}
+_lazy_types: Dict[type, type] = {}
+_models: Dict[type, type] = {}
+
+
+def _slots_of(cls: type) -> Tuple[str, ...]:
+    """The slots holding the state of a model, in a fixed order"""
+    names = _slots.get(cls)
+    if names is None:
+        names = _slots[cls] = tuple(
+            f'_{owner.__name__}{name}' if name.startswith('__') else name
+            for owner in reversed(cls.__mro__) for name in owner.__dict__.get('__slots__', ())
+            if name not in ('__weakref__', '_raw'))
+    return names
+
+
+def _getter_of(cls: type) -> Callable[[Any], tuple]:
+    """Function returning the values of the slots of a model as a tuple"""
+    getter = _getters.get(cls)
+    if getter is None:
+        # every model has at least the slots of FaceitApiResponse, so attrgetter returns a tuple, the attributes of
+        # subclasses without __slots__ are appended as their __dict__
+        getter = _getters[cls] = attrgetter(*_slots_of(cls), *(('__dict__',) if cls.__dictoffset__ else ()))
+    return getter
+
+
+def _setter_of(cls: type) -> Callable[[Any, tuple], None]:
+    """Function setting the slots of a model from the values returned by :func:`_getter_of`, generated on first use"""
+    setter = _setters.get(cls)
+    if setter is None:
+        # unpacking into the attributes avoids a setattr call per slot
+        targets = ''.join(f'_self.{name}, ' for name in _slots_of(cls))
+        if cls.__dictoffset__:
+            # a copy must not share the __dict__ with the original
+            source = f'{targets}_dict, = _values\n    _self.__dict__.update(_dict)'
+        else:
+            source = f'{targets}= _values'
+        namespace = {}
+        exec(compile(f'def setter(_self, _values):\n    {source}\n    _self._raw = None',
+                     f'<setter {cls.__name__}>', 'exec'), namespace)
+        setter = _setters[cls] = namespace['setter']
+    return setter
+
+
+def _lazy_setattr(self, name: str, value: Any):
+    # without building the response first, its first read would overwrite the value with the one from the json
+    self._load(self._raw, True)
+    object.__setattr__(self, name, value)
+
+
+def _lazy_reduce_ex(self, protocol: int):
+    return _models[type(self)].lazy, (self._raw,)
+
+
+def _lazy_type_of(cls: type) -> type:
+    """Subclass of a model for its lazy responses, they become instances of the model when they are built"""
+    lazy_type = _lazy_types.get(cls)
+    if lazy_type is None:
+        # only lazy responses pay for the __setattr__, the name keeps repr and error messages unchanged
+        lazy_type = _lazy_types[cls] = type(cls.__name__, (cls,), {
+            '__slots__': (), '__module__': cls.__module__, '__qualname__': cls.__qualname__,
+            '__setattr__': _lazy_setattr, '__reduce_ex__': _lazy_reduce_ex})
+        _models[lazy_type] = cls
+    return lazy_type
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, FaceitApiResponse):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_json(x) for x in value]
+    return value
 
 
 class FaceitApiResponse:
+    """
+    Base of all responses. The models keep their fields in ``__slots__``; fields the model does not know are
+    kept in :attr:`extra` and can still be read as attributes.
+
+    Responses created with :meth:`lazy` only keep the decoded json until a field is read or set for the first
+    time. Then the fields are set like in an eagerly created response, but nested responses are lazy again.
+    """
+    __slots__ = ('__success', '_extra', '_raw')
+
     def __init__(self, success: bool = True, **kwargs):
         self.__success = success
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self._extra = kwargs or None
+        self._raw = None
+
+    @classmethod
+    def lazy(cls: type[R], data: dict) -> R:
+        """Create a response that is built from the decoded json on the first access of a field
+
+        :param data: The decoded json of the response
+        :type data: dict
+        :return: The lazy response
+        :rtype: :class:`.FaceitApiResponse`
+        """
+        response = cls.__new__(cls)
+        response.__success = True
+        response._raw = data
+        response.__class__ = _lazy_type_of(cls)
+        return response
+
+    def _load(self, data: dict, lazy: bool = False):
+        """Set the fields from the decoded json again, e.g. to refresh a response while keeping its identity
+
+        :param data: The decoded json of the response
+        :type data: dict
+        :param lazy: Create the nested responses lazily
+        :type lazy: bool, optional
+        """
+        model = _models.get(type(self))
+        if model is not None:
+            object.__setattr__(self, '__class__', model)
+        token = _lazy.set(lazy)
+        try:
+            type(self).__init__(self, **data)
+        finally:
+            _lazy.reset(token)
 
     def __bool__(self):
         return self.__success
 
+    def __getattr__(self, name: str) -> Any:
+        if name in ('_extra', '_raw'):
+            raise AttributeError(name)
+        if self._raw is not None:
+            self._load(self._raw, True)
+            return getattr(self, name)
+        if self._extra is not None and name in self._extra:
+            return self._extra[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        """The fields of the response that are not known to the model"""
+        if self._raw is not None:
+            self._load(self._raw, True)
+        return _NO_EXTRA if self._extra is None else self._extra
+
+    def __getstate__(self) -> tuple:
+        # the values of the slots without their names, a lazy response is pickled as its json
+        return _getter_of(type(self))(self)
+
+    def __setstate__(self, state: tuple):
+        _setter_of(type(self))(self, state)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The fields of the response as json, with the fields the model does not know
+
+        :return: The json of the response, as accepted by :meth:`from_dict`
+        :rtype: Dict[str, Any]
+        """
+        if self._raw is not None:
+            return dict(self._raw)
+        data = {name: _to_json(getattr(self, name)) for name in _slots_of(type(self)) if name[0] != '_'}
+        if self._extra is not None:
+            data.update(self._extra)
+        return data
+
+    @classmethod
+    def from_dict(cls: type[R], data: Dict[str, Any]) -> R:
+        """Create the response from its json, see :func:`.registry.from_dict`
+
+        The items of collections are generic, they are created as they are given, e.g. as dicts, unless their model
+        is passed to :meth:`.Collection.from_dict`.
+
+        :param data: The json of the response, e.g. from :meth:`to_dict`
+        :type data: Dict[str, Any]
+        :return: The response
+        :rtype: :class:`.FaceitApiResponse`
+        """
+        from .registry import from_dict
+        return from_dict(cls, data)
+
+
+def _one(cls: type[R], data: Union[dict, None]) -> Union[R, None]:
+    if data is None:
+        return None
+    return cls.lazy(data) if _lazy.get() else cls(**data)
+
+
+def _many(cls: type[R], items: List[dict]) -> List[R]:
+    if _lazy.get():
+        return [cls.lazy(x) for x in items]
+    return [cls(**x) for x in items]
+
 
 class FaceitApiError(FaceitApiResponse):
+    __slots__ = ('message', 'status_code')
+
     def __init__(self, message: str = 'Bad Request', status_code: int = 400, **kwargs):
         super().__init__(False, **kwargs)
         self.message = message
         self.status_code = status_code
 
 
+class RawResponse(FaceitApiResponse):
+    """The decoded json of a successful response with its status code, returned in raw mode"""
+    __slots__ = ('data', 'status_code')
+
+    def __init__(self, data: Any = None, status_code: int = 200, **kwargs):
+        super().__init__(**kwargs)
+        self.data = data
+        self.status_code = status_code
+
+
+class FaceitApiException(Exception):
+    """Raised where an error can not be returned, e.g. while iterating over the pages of a collection"""
+    def __init__(self, error: FaceitApiError):
+        super().__init__(f'{error.status_code}: {error.message}')
+        self.error = error
+
+
 class Assets(FaceitApiResponse):
+    __slots__ = (
+        'cover', 'featured_img_l', 'featured_img_m', 'featured_img_s', 'flag_img_icon', 'flag_img_l', 'flag_img_m',
+        'flag_img_s', 'landing_page',
+    )
+
     def __init__(self,
                  cover: str = None,
                  featured_img_l: str = None,
@@ -43,6 +256,11 @@ class Assets(FaceitApiResponse):
 
 
 class GameData(FaceitApiResponse):
+    __slots__ = (
+        'assets', 'game_id', 'long_label', 'order', 'parent_game_id', 'platforms', 'regions', 'short_label',
+        '__weakref__',
+    )
+
     def __init__(self,
                  assets: dict,
                  game_id: str = None,
@@ -54,7 +272,7 @@ class GameData(FaceitApiResponse):
                  short_label: str = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.assets: Assets = Assets(**assets)
+        self.assets: Assets = _one(Assets, assets)
         self.game_id = game_id
         self.long_label = long_label
         self.order = order
@@ -65,6 +283,11 @@ class GameData(FaceitApiResponse):
 
 
 class JoinChecks(FaceitApiResponse):
+    __slots__ = (
+        'allowed_team_types', 'blacklist_geo_countries', 'join_policy', 'max_skill_level', 'membership_type',
+        'min_skill_level', 'whitelist_geo_countries', 'whitelist_geo_countries_min_players',
+    )
+
     def __init__(self,
                  allowed_team_types: List[str] = None,
                  blacklist_geo_countries: List[str] = None,
@@ -87,6 +310,11 @@ class JoinChecks(FaceitApiResponse):
 
 
 class OrganizerData(FaceitApiResponse):
+    __slots__ = (
+        'avatar', 'cover', 'description', 'facebook', 'faceit_url', 'followers_count', 'name', 'organizer_id',
+        'twitch', 'twitter', 'type', 'vk', 'website', 'youtube', '__weakref__',
+    )
+
     def __init__(self,
                  avatar: str = None,
                  cover: str = None,
@@ -121,6 +349,8 @@ class OrganizerData(FaceitApiResponse):
 
 
 class Prize(FaceitApiResponse):
+    __slots__ = ('faceit_points', 'rank')
+
     def __init__(self,
                  faceit_points: int = None,
                  rank: int = None,
@@ -131,6 +361,8 @@ class Prize(FaceitApiResponse):
 
 
 class Stream(FaceitApiResponse):
+    __slots__ = ('active', 'platform', 'source', 'title')
+
     def __init__(self,
                  active: bool = None,
                  platform: str = None,
@@ -145,6 +377,8 @@ class Stream(FaceitApiResponse):
 
 
 class SubstitutionConfiguration(FaceitApiResponse):
+    __slots__ = ('max_substitutes', 'max_substitutions')
+
     def __init__(self,
                  max_substitutes: int = None,
                  max_substitutions: int = None,
@@ -155,6 +389,15 @@ class SubstitutionConfiguration(FaceitApiResponse):
 
 
 class Championship(FaceitApiResponse):
+    __slots__ = (
+        'anticheat_required', 'avatar', 'background_image', 'championship_id', 'championship_start', 'checkin_clear',
+        'checkin_enabled', 'checkin_start', 'cover_image', 'current_subscriptions', 'description', 'faceit_url',
+        'featured', 'full', 'game_data', 'game_id', 'id', 'join_checks', 'name', 'organizer_data', 'organizer_id',
+        'prizes', 'region', 'rules_id', 'schedule', 'seeding_strategy', 'slots', 'status', 'stream',
+        'subscription_end', 'subscription_start', 'subscriptions_locked', 'substitution_configuration', 'total_groups',
+        'total_prizes', 'total_rounds', 'type', 'screening', '__weakref__',
+    )
+
     def __init__(self,
                  anticheat_required: bool = None,
                  avatar: str = None,
@@ -210,27 +453,26 @@ class Championship(FaceitApiResponse):
         self.faceit_url = faceit_url
         self.featured = featured
         self.full = full
-        self.game_data: Union[GameData, None] = None if game_data is None else GameData(**game_data)
+        self.game_data: Union[GameData, None] = _one(GameData, game_data)
         self.game_id = game_id
         self.id = id
-        self.join_checks: JoinChecks = None if join_checks is None else JoinChecks(**join_checks)
+        self.join_checks: JoinChecks = _one(JoinChecks, join_checks)
         self.name = name
-        self.organizer_data: Union[OrganizerData, None] = \
-            None if organizer_data is None else OrganizerData(**organizer_data)
+        self.organizer_data: Union[OrganizerData, None] = _one(OrganizerData, organizer_data)
         self.organizer_id = organizer_id
-        self.prizes: List[Prize] = [] if prizes is None else [Prize(**prize) for prize in prizes]
+        self.prizes: List[Prize] = [] if prizes is None else _many(Prize, prizes)
         self.region = region
         self.rules_id = rules_id
         self.schedule = {} if schedule is None else schedule
         self.seeding_strategy = seeding_strategy
         self.slots = slots
         self.status = status
-        self.stream: Stream = None if stream is None else Stream(**stream)
+        self.stream: Stream = _one(Stream, stream)
         self.subscription_end = subscription_end
         self.subscription_start = subscription_start
         self.subscriptions_locked = subscriptions_locked
-        self.substitution_configuration: SubstitutionConfiguration = None if substitution_configuration is None else \
-            SubstitutionConfiguration(**substitution_configuration)
+        self.substitution_configuration: SubstitutionConfiguration = \
+            _one(SubstitutionConfiguration, substitution_configuration)
         self.total_groups = total_groups
         self.total_prizes = total_prizes
         self.total_rounds = total_rounds
@@ -242,6 +484,8 @@ T = TypeVar("T")
 
 
 class Collection(FaceitApiResponse, Generic[T]):
+    __slots__ = ('end', 'items', 'start')
+
     def __init__(self,
                  end: int = None,
                  items: List[T] = None,
@@ -252,8 +496,27 @@ class Collection(FaceitApiResponse, Generic[T]):
         self.items: List[T] = [] if items is None else items
         self.start = start
 
+    @classmethod
+    def from_dict(cls: type[R], data: Dict[str, Any], item_class: type = None) -> R:
+        """Create the collection from its json, see :func:`.registry.from_dict`
+
+        :param data: The json of the collection, e.g. from :meth:`to_dict`
+        :type data: Dict[str, Any]
+        :param item_class: The model of the items, e.g. :class:`.Match`, the items are created as they are given if
+            not specified
+        :type item_class: type, optional
+        :return: The collection
+        :rtype: :class:`.Collection`
+        """
+        from .registry import from_dict
+        if item_class is not None and data.get('items'):
+            data = {**data, 'items': [from_dict(item_class, x) for x in data['items']]}
+        return from_dict(cls, data)
+
 
 class RankCollection(Collection, Generic[T]):
+    __slots__ = ('position',)
+
     def __init__(self,
                  end: int = None,
                  items: List[T] = None,
@@ -265,6 +528,8 @@ class RankCollection(Collection, Generic[T]):
 
 
 class ChampionshipRankingCollection(Collection, Generic[T]):
+    __slots__ = ('leaderboard',)
+
     def __init__(self,
                  end: int = None,
                  items: List[T] = None,
@@ -272,10 +537,12 @@ class ChampionshipRankingCollection(Collection, Generic[T]):
                  leaderboard: dict = None,
                  **kwargs):
         super().__init__(end, items, start, **kwargs)
-        self.leaderboard: Leaderboard = Leaderboard(**leaderboard)
+        self.leaderboard: Leaderboard = _one(Leaderboard, leaderboard)
 
 
 class FromToCollection(Collection, Generic[T]):
+    __slots__ = ('from_', 'to')
+
     def __init__(self,
                  end: int = None,
                  items: list = None,
@@ -289,6 +556,8 @@ class FromToCollection(Collection, Generic[T]):
 
 
 class Bounds(FaceitApiResponse):
+    __slots__ = ('left', 'right')
+
     def __init__(self,
                  left: int = None,
                  right: int = None,
@@ -299,6 +568,8 @@ class Bounds(FaceitApiResponse):
 
 
 class Placement(FaceitApiResponse):
+    __slots__ = ('id', 'name', 'type')
+
     def __init__(self,
                  id: str = None,
                  name: str = None,
@@ -311,16 +582,20 @@ class Placement(FaceitApiResponse):
 
 
 class Result(FaceitApiResponse):
+    __slots__ = ('bounds', 'placements')
+
     def __init__(self,
                  bounds: dict = None,
                  placements: list = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.bounds: Bounds = None if bounds is None else Bounds(**bounds)
-        self.placements: List[Placement] = [] if placements is None else [Placement(**x) for x in placements]
+        self.bounds: Bounds = _one(Bounds, bounds)
+        self.placements: List[Placement] = [] if placements is None else _many(Placement, placements)
 
 
 class Results(FaceitApiResponse):
+    __slots__ = ('score', 'winner')
+
     def __init__(self,
                  score: dict = None,
                  winner: str = None,
@@ -331,6 +606,13 @@ class Results(FaceitApiResponse):
 
 
 class Match(FaceitApiResponse):
+    __slots__ = (
+        'best_of', 'broadcast_start_time', 'broadcast_start_time_label', 'calculate_elo', 'chat_room_id',
+        'competition_id', 'competition_name', 'competition_type', 'configured_at', 'demo_url', 'faceit_url',
+        'finished_at', 'game', 'group', 'match_id', 'organizer_id', 'region', 'results', 'round', 'scheduled_at',
+        'started_at', 'status', 'teams', 'version', 'voting', '__weakref__',
+    )
+
     def __init__(self,
                  best_of: int = None,
                  calculate_elo: bool = None,
@@ -376,7 +658,7 @@ class Match(FaceitApiResponse):
         self.match_id = match_id
         self.organizer_id = organizer_id
         self.region = region
-        self.results: Results = None if results is None else Results(**results)
+        self.results: Results = _one(Results, results)
         self.round = round
         self.scheduled_at = scheduled_at
         self.started_at = started_at
@@ -387,6 +669,8 @@ class Match(FaceitApiResponse):
 
 
 class Member(FaceitApiResponse):
+    __slots__ = ('avatar', 'faceit_url', 'nickname', 'roles', 'user_id')
+
     def __init__(self,
                  avatar: str = None,
                  faceit_url: str = None,
@@ -403,6 +687,10 @@ class Member(FaceitApiResponse):
 
 
 class TeamMember(FaceitApiResponse):
+    __slots__ = (
+        'avatar', 'country', 'faceit_url', 'membership_type', 'memberships', 'nickname', 'skill_level', 'user_id',
+    )
+
     def __init__(self,
                  avatar: str = None,
                  country: str = None,
@@ -425,6 +713,11 @@ class TeamMember(FaceitApiResponse):
 
 
 class Team(FaceitApiResponse):
+    __slots__ = (
+        'avatar', 'chat_room_id', 'cover_image', 'description', 'facebook', 'faceit_url', 'game', 'leader', 'members',
+        'name', 'nickname', 'team_id', 'team_type', 'twitter', 'website', 'youtube', '__weakref__',
+    )
+
     def __init__(self,
                  avatar: str = None,
                  chat_room_id: str = None,
@@ -452,7 +745,7 @@ class Team(FaceitApiResponse):
         self.faceit_url = faceit_url
         self.game = game
         self.leader = leader
-        self.members: List[TeamMember] = [] if members is None else [TeamMember(**x) for x in members]
+        self.members: List[TeamMember] = [] if members is None else _many(TeamMember, members)
         self.name = name
         self.nickname = nickname
         self.team_id = team_id
@@ -463,6 +756,8 @@ class Team(FaceitApiResponse):
 
 
 class Subscription(FaceitApiResponse):
+    __slots__ = ('coach', 'coleader', 'group', 'leader', 'roster', 'status', 'substitutes', 'team')
+
     def __init__(self,
                  coach: str = None,
                  coleader: str = None,
@@ -481,10 +776,16 @@ class Subscription(FaceitApiResponse):
         self.roster = [] if roster is None else roster
         self.status = status
         self.substitutes = [] if substitutes is None else substitutes
-        self.team: Team = None if team is None else Team(**team)
+        self.team: Team = _one(Team, team)
 
 
 class Hub(FaceitApiResponse):
+    __slots__ = (
+        'avatar', 'background_image', 'chat_room_id', 'cover_image', 'description', 'faceit_url', 'game_data',
+        'game_id', 'hub_id', 'join_permission', 'max_skill_level', 'min_skill_level', 'name', 'organizer_data',
+        'organizer_id', 'players_joined', 'region', 'rule_id', '__weakref__',
+    )
+
     def __init__(self,
                  avatar: str = None,
                  faceit_url: str = None,
@@ -512,15 +813,14 @@ class Hub(FaceitApiResponse):
         self.cover_image = cover_image
         self.description = description
         self.faceit_url = faceit_url
-        self.game_data: Union[GameData, None] = None if game_data is None else GameData(**game_data)
+        self.game_data: Union[GameData, None] = _one(GameData, game_data)
         self.game_id = game_id
         self.hub_id = hub_id
         self.join_permission = join_permission
         self.max_skill_level = max_skill_level
         self.min_skill_level = min_skill_level
         self.name = name
-        self.organizer_data: Union[OrganizerData, None] \
-            = None if organizer_data is None else OrganizerData(**organizer_data)
+        self.organizer_data: Union[OrganizerData, None] = _one(OrganizerData, organizer_data)
         self.organizer_id = organizer_id
         self.players_joined = players_joined
         self.region = region
@@ -528,6 +828,8 @@ class Hub(FaceitApiResponse):
 
 
 class Role(FaceitApiResponse):
+    __slots__ = ('color', 'name', 'ranking', 'role_id', 'visible_on_chat')
+
     def __init__(self,
                  color: str = None,
                  name: str = None,
@@ -544,6 +846,8 @@ class Role(FaceitApiResponse):
 
 
 class Rule(FaceitApiResponse):
+    __slots__ = ('body', 'game', 'name', 'organizer', 'rule_id')
+
     def __init__(self,
                  body: str = None,
                  game: str = None,
@@ -560,16 +864,20 @@ class Rule(FaceitApiResponse):
 
 
 class GameStats(FaceitApiResponse):
+    __slots__ = ('game_id', 'players')
+
     def __init__(self,
                  game_id: str = None,
                  players: list = None,
                  **kwargs):
         super().__init__(**kwargs)
         self.game_id = game_id
-        self.players: List[GamePlayerStats] = None if players is None else [GamePlayerStats(**p) for p in players]
+        self.players: List[GamePlayerStats] = None if players is None else _many(GamePlayerStats, players)
 
 
 class GamePlayerStats(FaceitApiResponse):
+    __slots__ = ('nickname', 'player_id', 'stats')
+
     def __init__(self,
                  nickname: str = None,
                  player_id: str = None,
@@ -582,6 +890,8 @@ class GamePlayerStats(FaceitApiResponse):
 
 
 class PlayerStats(FaceitApiResponse):
+    __slots__ = ('nickname', 'player_id', 'player_stats')
+
     def __init__(self,
                  nickname: str = None,
                  player_id: str = None,
@@ -594,6 +904,13 @@ class PlayerStats(FaceitApiResponse):
 
 
 class Leaderboard(FaceitApiResponse):
+    __slots__ = (
+        'competition_id', 'competition_type', 'end_date', 'game_id', 'group', 'leaderboard_id', 'leaderboard_mode',
+        'leaderboard_name', 'leaderboard_type', 'min_matches', 'points_per_draw', 'points_per_loss', 'points_per_win',
+        'points_type', 'ranking_boost', 'ranking_type', 'region', 'round', 'season', 'start_date', 'starting_points',
+        'status',
+    )
+
     def __init__(self,
                  competition_id: str = None,
                  competition_type: str = None,
@@ -644,6 +961,8 @@ class Leaderboard(FaceitApiResponse):
 
 
 class Ranking(FaceitApiResponse):
+    __slots__ = ('current_streak', 'draw', 'lost', 'played', 'player', 'points', 'position', 'win_rate', 'won')
+
     def __init__(self,
                  current_streak: int = None,
                  draw: int = None,
@@ -660,7 +979,7 @@ class Ranking(FaceitApiResponse):
         self.draw = draw
         self.lost = lost
         self.played = played
-        self.player: TeamMember = None if player is None else TeamMember(**player)
+        self.player: TeamMember = _one(TeamMember, player)
         self.points = points
         self.position = position
         self.win_rate = win_rate
@@ -668,6 +987,8 @@ class Ranking(FaceitApiResponse):
 
 
 class TeamStats(FaceitApiResponse):
+    __slots__ = ('players', 'premade', 'team_id', 'team_stats')
+
     def __init__(self,
                  players: list,
                  premade: dict,
@@ -682,6 +1003,11 @@ class TeamStats(FaceitApiResponse):
 
 
 class RoundStats(FaceitApiResponse):
+    __slots__ = (
+        'best_of', 'competition_id', 'game_id', 'game_mode', 'match_id', 'match_round', 'played', 'round_stats',
+        'teams',
+    )
+
     def __init__(self,
                  best_of: dict,
                  competition_id: dict,
@@ -702,18 +1028,28 @@ class RoundStats(FaceitApiResponse):
         self.match_round = match_round
         self.played = played
         self.round_stats = round_stats
-        self.teams: List[TeamStats] = [TeamStats(**x) for x in teams]
+        self.teams: List[TeamStats] = _many(TeamStats, teams)
 
 
 class MatchStats(FaceitApiResponse):
+    __slots__ = ('rounds',)
+
     def __init__(self,
                  rounds: list,
                  **kwargs):
         super().__init__(**kwargs)
-        self.rounds: List[RoundStats] = [RoundStats(**x) for x in rounds]
+        self.rounds: List[RoundStats] = _many(RoundStats, rounds)
 
 
 class Tournament(FaceitApiResponse):
+    __slots__ = (
+        'anticheat_required', 'custom', 'faceit_url', 'featured_image', 'game_id', 'invite_type', 'match_type',
+        'max_skill', 'membership_type', 'min_skill', 'name', 'number_of_players', 'number_of_players_checkedin',
+        'number_of_players_joined', 'number_of_players_participants', 'organizer_id', 'prize_type', 'region',
+        'started_at', 'status', 'subscriptions_count', 'team_size', 'total_prize', 'tournament_id',
+        'whitelist_countries', '__weakref__',
+    )
+
     def __init__(self,
                  anticheat_required: bool = None,
                  custom: bool = None,
@@ -770,6 +1106,15 @@ class Tournament(FaceitApiResponse):
 
 
 class TournamentData(FaceitApiResponse):
+    __slots__ = (
+        'anticheat_required', 'best_of', 'calculate_elo', 'competition_id', 'cover_image', 'custom', 'description',
+        'faceit_url', 'featured_image', 'game_data', 'game_id', 'invite_type', 'match_type', 'max_skill',
+        'membership_type', 'min_skill', 'name', 'number_of_players', 'number_of_players_checkedin',
+        'number_of_players_joined', 'number_of_players_participants', 'organizer_data', 'organizer_id', 'prize_type',
+        'region', 'rounds', 'rule', 'started_at', 'status', 'substitutes_allowed', 'substitutions_allowed',
+        'team_size', 'total_prize', 'tournament_id', 'voting', 'whitelist_countries',
+    )
+
     def __init__(self,
                  anticheat_required: bool = None,
                  best_of: dict = None,
@@ -848,6 +1193,12 @@ class TournamentData(FaceitApiResponse):
 
 
 class Player(FaceitApiResponse):
+    __slots__ = (
+        'avatar', 'country', 'cover_featured_image', 'cover_image', 'faceit_url', 'friends_ids', 'games',
+        'infractions', 'membership_type', 'memberships', 'new_steam_id', 'nickname', 'platforms', 'player_id',
+        'settings', 'steam_id_64', 'steam_nickname', '__weakref__',
+    )
+
     def __init__(self,
                  avatar: str = None,
                  country: str = None,
@@ -888,6 +1239,12 @@ class Player(FaceitApiResponse):
 
 
 class PlayerMatch(FaceitApiResponse):
+    __slots__ = (
+        'competition_id', 'competition_name', 'competition_type', 'faceit_url', 'finished_at', 'game_id', 'game_mode',
+        'match_id', 'match_type', 'max_players', 'organizer_id', 'playing_players', 'region', 'results', 'started_at',
+        'status', 'teams', 'teams_size',
+    )
+
     def __init__(self,
                  competition_id: str = None,
                  competition_name: str = None,
@@ -922,7 +1279,7 @@ class PlayerMatch(FaceitApiResponse):
         self.organizer_id = organizer_id
         self.playing_players = [] if playing_players is None else playing_players
         self.region = region
-        self.results: Results = None if results is None else Results(**results)
+        self.results: Results = _one(Results, results)
         self.started_at = started_at
         self.status = status
         self.teams = {} if teams is None else teams
@@ -930,6 +1287,8 @@ class PlayerMatch(FaceitApiResponse):
 
 
 class PlayerGameStats(FaceitApiResponse):
+    __slots__ = ('game_id', 'lifetime', 'player_id', 'segments')
+
     def __init__(self,
                  game_id: str = None,
                  lifetime: dict = None,
@@ -944,6 +1303,8 @@ class PlayerGameStats(FaceitApiResponse):
 
 
 class TeamGameStats(FaceitApiResponse):
+    __slots__ = ('game_id', 'lifetime', 'segments', 'team_id')
+
     def __init__(self,
                  game_id: str = None,
                  lifetime: dict = None,
@@ -958,6 +1319,8 @@ class TeamGameStats(FaceitApiResponse):
 
 
 class Rank(FaceitApiResponse):
+    __slots__ = ('country', 'faceit_elo', 'game_skill_level', 'nickname', 'player_id', 'position')
+
     def __init__(self,
                  country: str = None,
                  faceit_elo: int = None,
@@ -976,6 +1339,12 @@ class Rank(FaceitApiResponse):
 
 
 class ChampionshipSearchResult(FaceitApiResponse):
+    __slots__ = (
+        'competition_id', 'competition_type', 'game', 'name', 'number_of_members', 'organizer_id', 'organizer_name',
+        'organizer_type', 'players_checkedin', 'players_joined', 'prize_type', 'region', 'slots', 'started_at',
+        'status', 'total_prize',
+    )
+
     def __init__(self,
                  competition_id: str = None,
                  competition_type: str = None,
@@ -1014,6 +1383,8 @@ class ChampionshipSearchResult(FaceitApiResponse):
 
 
 class OrganizerSearchResult(FaceitApiResponse):
+    __slots__ = ('active', 'avatar', 'countries', 'games', 'name', 'organizer_id', 'partner', 'regions')
+
     def __init__(self,
                  active: bool = None,
                  avatar: str = None,
@@ -1036,6 +1407,8 @@ class OrganizerSearchResult(FaceitApiResponse):
 
 
 class PlayerSearchResult(FaceitApiResponse):
+    __slots__ = ('avatar', 'country', 'games', 'nickname', 'player_id', 'status', 'verified')
+
     def __init__(self,
                  avatar: str = None,
                  country: str = None,
@@ -1048,7 +1421,7 @@ class PlayerSearchResult(FaceitApiResponse):
         super().__init__(**kwargs)
         self.avatar = avatar
         self.country = country
-        self.games: List[GameSearchResult] = [] if games is None else [GameSearchResult(**x) for x in games]
+        self.games: List[GameSearchResult] = [] if games is None else _many(GameSearchResult, games)
         self.nickname = nickname
         self.player_id = player_id
         self.status = status
@@ -1056,6 +1429,8 @@ class PlayerSearchResult(FaceitApiResponse):
 
 
 class GameSearchResult(FaceitApiResponse):
+    __slots__ = ('name', 'skill_level')
+
     def __init__(self,
                  name: str = None,
                  skill_level: str = None,
@@ -1066,6 +1441,8 @@ class GameSearchResult(FaceitApiResponse):
 
 
 class TeamSearchResult(FaceitApiResponse):
+    __slots__ = ('avatar', 'chat_room_id', 'faceit_url', 'game', 'name', 'team_id', 'verified')
+
     def __init__(self,
                  avatar: str = None,
                  chat_room_id: str = None,
@@ -1086,6 +1463,12 @@ class TeamSearchResult(FaceitApiResponse):
 
 
 class TournamentSearchResult(FaceitApiResponse):
+    __slots__ = (
+        'competition_id', 'competition_type', 'game', 'name', 'number_of_members', 'organizer_id', 'organizer_name',
+        'organizer_type', 'players_checkedin', 'players_joined', 'prize_type', 'region', 'slots', 'started_at',
+        'status', 'total_prize',
+    )
+
     def __init__(self,
                  competition_id: str = None,
                  competition_type: str = None,
@@ -1124,6 +1507,8 @@ class TournamentSearchResult(FaceitApiResponse):
 
 
 class Brackets(FaceitApiResponse):
+    __slots__ = ('game', 'matches', 'name', 'rounds', 'status')
+
     def __init__(self,
                  game: str = None,
                  matches: list = None,
@@ -1133,13 +1518,15 @@ class Brackets(FaceitApiResponse):
                  **kwargs):
         super().__init__(**kwargs)
         self.game = game
-        self.matches: List[BracketMatch] = [] if matches is None else [BracketMatch(**x) for x in matches]
+        self.matches: List[BracketMatch] = [] if matches is None else _many(BracketMatch, matches)
         self.name = name
-        self.rounds: List[Round] = [] if rounds is None else [Round(**x) for x in rounds]
+        self.rounds: List[Round] = [] if rounds is None else _many(Round, rounds)
         self.status = status
 
 
 class BracketMatch(FaceitApiResponse):
+    __slots__ = ('faceit_url', 'match_id', 'position', 'results', 'round', 'state', 'teams')
+
     def __init__(self,
                  faceit_url: str = None,
                  match_id: str = None,
@@ -1153,13 +1540,18 @@ class BracketMatch(FaceitApiResponse):
         self.faceit_url = faceit_url
         self.match_id = match_id
         self.position = position
-        self.results: Results = None if results is None else Results(**results)
+        self.results: Results = _one(Results, results)
         self.round = round
         self.state = state
         self.teams = {} if teams is None else teams
 
 
 class Round(FaceitApiResponse):
+    __slots__ = (
+        'best_of', 'label', 'matches', 'round', 'start_time', 'starts_asap', 'substitution_time',
+        'substitutions_allowed',
+    )
+
     def __init__(self,
                  best_of: int = None,
                  label: str = None,
@@ -1182,6 +1574,8 @@ class Round(FaceitApiResponse):
 
 
 class TournamentTeams(FaceitApiResponse):
+    __slots__ = ('checked_in', 'finished', 'joined', 'started')
+
     def __init__(self,
                  checked_in: list,
                  finished: list,
@@ -1189,13 +1583,15 @@ class TournamentTeams(FaceitApiResponse):
                  started: list,
                  **kwargs):
         super().__init__(**kwargs)
-        self.checked_in: List[TournamentTeam] = [] if checked_in is None else [TournamentTeam(**x) for x in checked_in]
-        self.finished: List[TournamentTeam] = [] if finished is None else [TournamentTeam(**x) for x in finished]
-        self.joined: List[TournamentTeam] = [] if joined is None else [TournamentTeam(**x) for x in joined]
-        self.started: List[TournamentTeam] = [] if started is None else [TournamentTeam(**x) for x in started]
+        self.checked_in: List[TournamentTeam] = [] if checked_in is None else _many(TournamentTeam, checked_in)
+        self.finished: List[TournamentTeam] = [] if finished is None else _many(TournamentTeam, finished)
+        self.joined: List[TournamentTeam] = [] if joined is None else _many(TournamentTeam, joined)
+        self.started: List[TournamentTeam] = [] if started is None else _many(TournamentTeam, started)
 
 
 class TournamentTeam(FaceitApiResponse):
+    __slots__ = ('nickname', 'skill_level', 'subs_done', 'team_id', 'team_leader', 'team_type')
+
     def __init__(self,
                  nickname: str = None,
                  skill_level: int = None,
@@ -0,0 +1,44 @@
+"""
+Decoders for the json bodies of the responses
+"""
+from typing import Any, Callable, Dict
+
+JsonDecoder = Callable[[bytes], Any]
+
+__all__ = ['JsonDecoder', 'DECODERS', 'default_decoder']
+
+
+def _decoders() -> Dict[str, JsonDecoder]:
+    # the decoders are looked up on first use, importing orjson or msgspec is not free
+    decoders: Dict[str, JsonDecoder] = {}
+    try:
+        import orjson
+        decoders['orjson'] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        decoders['msgspec'] = msgspec.json.decode
+    except ImportError:
+        pass
+    import json
+    decoders['json'] = json.loads
+    globals()['DECODERS'] = decoders
+    return decoders
+
+
+def __getattr__(name: str):
+    if name == 'DECODERS':
+        # The available decoders by name, fastest first
+        return _decoders()
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def default_decoder() -> JsonDecoder:
+    """The fastest available decoder: orjson or msgspec if installed, the json module of the standard library else
+
+    :return: Function decoding a json body
+    :rtype: Callable[[bytes], Any]
+    """
+    decoders = globals().get('DECODERS')
+    return next(iter((_decoders() if decoders is None else decoders).values()))
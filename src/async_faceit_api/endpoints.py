@@ -0,0 +1,36 @@
+"""
+Helpers to group the request urls of the data api into endpoint families
+"""
+
+# Every path segment that is not in this set is a parameter (an id, a game, a region, ...)
+_STATIC_SEGMENTS = frozenset({
+    'brackets', 'championships', 'games', 'general', 'groups', 'history', 'hubs', 'leaderboards', 'matches',
+    'members', 'organizers', 'parent', 'players', 'rankings', 'regions', 'results', 'roles', 'rules', 'search',
+    'seasons', 'stats', 'subscriptions', 'teams', 'tournaments'
+})
+
+
+def endpoint_of(path: str) -> str:
+    """Get the endpoint family of a request path, e.g. ``matches/1-abc/stats`` becomes ``matches/*/stats``
+
+    :param path: The path of the request relative to the api root, the query string is ignored
+    :type path: str
+    :return: The path with all parameter segments replaced by ``*``
+    :rtype: str
+    """
+    path = path.split('?', 1)[0]
+    return '/'.join(segment if segment in _STATIC_SEGMENTS else '*' for segment in path.split('/'))
+
+
+def canonical_url(url: str) -> str:
+    """Get a key for the url that is equal for equal requests, independent of the order of the query parameters
+
+    :param url: The url of the request
+    :type url: str
+    :return: The url with sorted query parameters
+    :rtype: str
+    """
+    path, _, query = url.partition('?')
+    if not query:
+        return path
+    return path + '?' + '&'.join(sorted(query.split('&')))
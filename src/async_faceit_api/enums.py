@@ -1,5 +1,7 @@
 from enum import Enum
 
+__all__ = ['Expansion', 'MatchType', 'Region', 'Country', 'Game']
+
 
 class Expansion(Enum):
     NONE = ''
@@ -22,258 +24,6 @@ class Region(Enum):
     SA = 'SA'
 
 
-class Country(Enum):
-    AFGHANISTAN = 'AF'
-    ALAND_ISLANDS = 'AX'
-    ALBANIA = 'AL'
-    ALGERIA = 'DZ'
-    AMERICAN_SAMOA = 'AS'
-    ANDORRA = 'AD'
-    ANGOLA = 'AO'
-    ANGUILLA = 'AI'
-    ANTARCTICA = 'AQ'
-    ANTIGUA_AND_BARBUDA = 'AG'
-    ARGENTINA = 'AR'
-    ARMENIA = 'AM'
-    ARUBA = 'AW'
-    AUSTRALIA = 'AU'
-    AUSTRIA = 'AT'
-    AZERBAIJAN = 'AZ'
-    BAHAMAS = 'BS'
-    BAHRAIN = 'BH'
-    BANGLADESH = 'BD'
-    BARBADOS = 'BB'
-    BELARUS = 'BY'
-    BELGIUM = 'BE'
-    BELIZE = 'BZ'
-    BENIN = 'BJ'
-    BERMUDA = 'BM'
-    BHUTAN = 'BT'
-    BOLIVIA = 'BO'
-    BONAIRE = 'BQ'
-    BOSNIA_AND_HERZEGOVINA = 'BA'
-    BOTSWANA = 'BW'
-    BOUVET_ISLAND = 'BV'
-    BRAZIL = 'BR'
-    BRITISH_INDIAN_OCEAN_TERRITORY = 'IO'
-    BRUNEI_DARUSSALAM = 'BN'
-    BULGARIA = 'BG'
-    BURKINA_FASO = 'BF'
-    BURUNDI = 'BI'
-    CAMBODIA = 'KH'
-    CAMEROON = 'CM'
-    CANADA = 'CA'
-    CABO_VERDE = 'CV'
-    CAYMAN_ISLANDS = 'KY'
-    CENTRAL_AFRICAN_REPUBLIC = 'CF'
-    CHAD = 'TD'
-    CHILE = 'CL'
-    CHINA = 'CN'
-    CHRISTMAS_ISLAND = 'CX'
-    COCOS_ISLANDS = 'CC'
-    COLOMBIA = 'CO'
-    COMOROS = 'KM'
-    CONGO = 'CG'
-    DEMOCRATIC_REPUBLIC_OF_THE_CONGO = 'CD'
-    COOK_ISLANDS = 'CK'
-    COSTA_RICA = 'CR'
-    COTE_D_IVOIRE = 'CI'
-    CROATIA = 'HR'
-    CUBA = 'CU'
-    CURACAO = 'CW'
-    CYPRUS = 'CY'
-    CZECH_REPUBLIC = 'CZ'
-    DENMARK = 'DK'
-    DJIBOUTI = 'DJ'
-    DOMINICA = 'DM'
-    DOMINICAN_REPUBLIC = 'DO'
-    ECUADOR = 'EC'
-    EGYPT = 'EG'
-    EL_SALVADOR = 'SV'
-    EQUATORIAL_GUINEA = 'GQ'
-    ERITREA = 'ER'
-    ESTONIA = 'EE'
-    ETHIOPIA = 'ET'
-    FALKLAND_ISLANDS = 'FK'
-    FAROE_ISLANDS = 'FO'
-    FIJI = 'FJ'
-    FINLAND = 'FI'
-    FRANCE = 'FR'
-    FRENCH_GUIANA = 'GF'
-    FRENCH_POLYNESIA = 'PF'
-    FRENCH_SOUTHERN_TERRITORIES = 'TF'
-    GABON = 'GA'
-    GAMBIA = 'GM'
-    GEORGIA = 'GE'
-    GERMANY = 'DE'
-    GHANA = 'GH'
-    GIBRALTAR = 'GI'
-    GREECE = 'GR'
-    GREENLAND = 'GL'
-    GRENADA = 'GD'
-    GUADELOUPE = 'GP'
-    GUAM = 'GU'
-    GUATEMALA = 'GT'
-    GUERNSEY = 'GG'
-    GUINEA = 'GN'
-    GUINEA_BISSAU = 'GW'
-    GUYANA = 'GY'
-    HAITI = 'HT'
-    HEARD_ISLAND_AND_MCDONALD_ISLANDS = 'HM'
-    HOLY_SEE = 'VA'
-    HONDURAS = 'HN'
-    HONG_KONG = 'HK'
-    HUNGARY = 'HU'
-    ICELAND = 'IS'
-    INDIA = 'IN'
-    INDONESIA = 'ID'
-    IRAN = 'IR'
-    IRAQ = 'IQ'
-    IRELAND = 'IE'
-    ISLE_OF_MAN = 'IM'
-    ISRAEL = 'IL'
-    ITALY = 'IT'
-    JAMAICA = 'JM'
-    JAPAN = 'JP'
-    JERSEY = 'JE'
-    JORDAN = 'JO'
-    KAZAKHSTAN = 'KZ'
-    KENYA = 'KE'
-    KIRIBATI = 'KI'
-    DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA = 'KP'
-    REPUBLIC_OF_KOREA = 'KR'
-    KUWAIT = 'KW'
-    KYRGYZSTAN = 'KG'
-    LAO_PEOPLES_DEMOCRATIC_REPUBLIC = 'LA'
-    LATVIA = 'LV'
-    LEBANON = 'LB'
-    LESOTHO = 'LS'
-    LIBERIA = 'LR'
-    LIBYA = 'LY'
-    LIECHTENSTEIN = 'LI'
-    LITHUANIA = 'LT'
-    LUXEMBOURG = 'LU'
-    MACAO = 'MO'
-    MACEDONIA = 'MK'
-    MADAGASCAR = 'MG'
-    MALAWI = 'MW'
-    MALAYSIA = 'MY'
-    MALDIVES = 'MV'
-    MALI = 'ML'
-    MALTA = 'MT'
-    MARSHALL_ISLANDS = 'MH'
-    MARTINIQUE = 'MQ'
-    MAURITANIA = 'MR'
-    MAURITIUS = 'MU'
-    MAYOTTE = 'YT'
-    MEXICO = 'MX'
-    MICRONESIA = 'FM'
-    MOLDOVA = 'MD'
-    MONACO = 'MC'
-    MONGOLIA = 'MN'
-    MONTENEGRO = 'ME'
-    MONTSERRAT = 'MS'
-    MOROCCO = 'MA'
-    MOZAMBIQUE = 'MZ'
-    MYANMAR = 'MM'
-    NAMIBIA = 'NA'
-    NAURU = 'NR'
-    NEPAL = 'NP'
-    NETHERLANDS = 'NL'
-    NEW_CALEDONIA = 'NC'
-    NEW_ZEALAND = 'NZ'
-    NICARAGUA = 'NI'
-    NIGER = 'NE'
-    NIGERIA = 'NG'
-    NIUE = 'NU'
-    NORFOLK_ISLAND = 'NF'
-    NORTHERN_MARIANA_ISLANDS = 'MP'
-    NORWAY = 'NO'
-    OMAN = 'OM'
-    PAKISTAN = 'PK'
-    PALAU = 'PW'
-    STATE_OF_PALESTINE = 'PS'
-    PANAMA = 'PA'
-    PAPUA_NEW_GUINEA = 'PG'
-    PARAGUAY = 'PY'
-    PERU = 'PE'
-    PHILIPPINES = 'PH'
-    PITCAIRN = 'PN'
-    POLAND = 'PL'
-    PORTUGAL = 'PT'
-    PUERTO_RICO = 'PR'
-    QATAR = 'QA'
-    REUNION = 'RE'
-    ROMANIA = 'RO'
-    RUSSIAN_FEDERATION = 'RU'
-    RWANDA = 'RW'
-    SAINT_BARTHELEMY = 'BL'
-    SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA = 'SH'
-    SAINT_KITTS_AND_NEVIS = 'KN'
-    SAINT_LUCIA = 'LC'
-    SAINT_MARTIN_FENCH = 'MF'
-    SAINT_PIERRE_AND_MIQUELON = 'PM'
-    SAINT_VINCENT_AND_THE_GRENADINES = 'VC'
-    SAMOA = 'WS'
-    SAN_MARINO = 'SM'
-    SAO_TOME_AND_PRINCIPE = 'ST'
-    SAUDI_ARABIA = 'SA'
-    SENEGAL = 'SN'
-    SERBIA = 'RS'
-    SEYCHELLES = 'SC'
-    SIERRA_LEONE = 'SL'
-    SINGAPORE = 'SG'
-    SINT_MAARTEN_DUTCH = 'SX'
-    SLOVAKIA = 'SK'
-    SLOVENIA = 'SI'
-    SOLOMON_ISLANDS = 'SB'
-    SOMALIA = 'SO'
-    SOUTH_AFRICA = 'ZA'
-    SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS = 'GS'
-    SOUTH_SUDAN = 'SS'
-    SPAIN = 'ES'
-    SRI_LANKA = 'LK'
-    SUDAN = 'SD'
-    SURINAME = 'SR'
-    SVALBARD_AND_JAN_MAYEN = 'SJ'
-    SWAZILAND = 'SZ'
-    SWEDEN = 'SE'
-    SWITZERLAND = 'CH'
-    SYRIAN_ARAB_REPUBLIC = 'SY'
-    TAIWAN = 'TW'
-    TAJIKISTAN = 'TJ'
-    TANZANIA = 'TZ'
-    THAILAND = 'TH'
-    TIMOR_LESTE = 'TL'
-    TOGO = 'TG'
-    TOKELAU = 'TK'
-    TONGA = 'TO'
-    TRINIDAD_AND_TOBAGO = 'TT'
-    TUNISIA = 'TN'
-    TURKEY = 'TR'
-    TURKMENISTAN = 'TM'
-    TURKS_AND_CAICOS_ISLANDS = 'TC'
-    TUVALU = 'TV'
-    UGANDA = 'UG'
-    UKRAINE = 'UA'
-    UNITED_ARAB_EMIRATES = 'AE'
-    UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND = 'GB'
-    UNITED_STATES_OF_AMERICA = 'US'
-    UNITED_STATES_MINOR_OUTLYING_ISLANDS = 'UM'
-    URUGUAY = 'UY'
-    UZBEKISTAN = 'UZ'
-    VANUATU = 'VU'
-    VENEZUELA = 'VE'
-    VIET_NAM = 'VN'
-    VIRGIN_ISLANDS_BRITISH = 'VG'
-    VIRGIN_ISLANDS_US = 'VI'
-    WALLIS_AND_FUTUNA = 'WF'
-    WESTERN_SAHARA = 'EH'
-    YEMEN = 'YE'
-    ZAMBIA = 'ZM'
-    ZIMBABWE = 'ZW'
-
-
 class Game(Enum):
     RL_XBOX_PC = 'rl_XBOX_PC'
     WOT_XBOX = 'wot_xbox'
@@ -350,3 +100,269 @@ class Game(Enum):
     PUBG_MOBILE = 'pubgmobile'
     ROCKET_LEAGUE = 'rocket_league'
     CS_GO = 'csgo'
+
+
+# the ~250 members of Country make up most of the import time of this module, it is created on first use
+_COUNTRIES = (
+    ('AFGHANISTAN', 'AF'),
+    ('ALAND_ISLANDS', 'AX'),
+    ('ALBANIA', 'AL'),
+    ('ALGERIA', 'DZ'),
+    ('AMERICAN_SAMOA', 'AS'),
+    ('ANDORRA', 'AD'),
+    ('ANGOLA', 'AO'),
+    ('ANGUILLA', 'AI'),
+    ('ANTARCTICA', 'AQ'),
+    ('ANTIGUA_AND_BARBUDA', 'AG'),
+    ('ARGENTINA', 'AR'),
+    ('ARMENIA', 'AM'),
+    ('ARUBA', 'AW'),
+    ('AUSTRALIA', 'AU'),
+    ('AUSTRIA', 'AT'),
+    ('AZERBAIJAN', 'AZ'),
+    ('BAHAMAS', 'BS'),
+    ('BAHRAIN', 'BH'),
+    ('BANGLADESH', 'BD'),
+    ('BARBADOS', 'BB'),
+    ('BELARUS', 'BY'),
+    ('BELGIUM', 'BE'),
+    ('BELIZE', 'BZ'),
+    ('BENIN', 'BJ'),
+    ('BERMUDA', 'BM'),
+    ('BHUTAN', 'BT'),
+    ('BOLIVIA', 'BO'),
+    ('BONAIRE', 'BQ'),
+    ('BOSNIA_AND_HERZEGOVINA', 'BA'),
+    ('BOTSWANA', 'BW'),
+    ('BOUVET_ISLAND', 'BV'),
+    ('BRAZIL', 'BR'),
+    ('BRITISH_INDIAN_OCEAN_TERRITORY', 'IO'),
+    ('BRUNEI_DARUSSALAM', 'BN'),
+    ('BULGARIA', 'BG'),
+    ('BURKINA_FASO', 'BF'),
+    ('BURUNDI', 'BI'),
+    ('CAMBODIA', 'KH'),
+    ('CAMEROON', 'CM'),
+    ('CANADA', 'CA'),
+    ('CABO_VERDE', 'CV'),
+    ('CAYMAN_ISLANDS', 'KY'),
+    ('CENTRAL_AFRICAN_REPUBLIC', 'CF'),
+    ('CHAD', 'TD'),
+    ('CHILE', 'CL'),
+    ('CHINA', 'CN'),
+    ('CHRISTMAS_ISLAND', 'CX'),
+    ('COCOS_ISLANDS', 'CC'),
+    ('COLOMBIA', 'CO'),
+    ('COMOROS', 'KM'),
+    ('CONGO', 'CG'),
+    ('DEMOCRATIC_REPUBLIC_OF_THE_CONGO', 'CD'),
+    ('COOK_ISLANDS', 'CK'),
+    ('COSTA_RICA', 'CR'),
+    ('COTE_D_IVOIRE', 'CI'),
+    ('CROATIA', 'HR'),
+    ('CUBA', 'CU'),
+    ('CURACAO', 'CW'),
+    ('CYPRUS', 'CY'),
+    ('CZECH_REPUBLIC', 'CZ'),
+    ('DENMARK', 'DK'),
+    ('DJIBOUTI', 'DJ'),
+    ('DOMINICA', 'DM'),
+    ('DOMINICAN_REPUBLIC', 'DO'),
+    ('ECUADOR', 'EC'),
+    ('EGYPT', 'EG'),
+    ('EL_SALVADOR', 'SV'),
+    ('EQUATORIAL_GUINEA', 'GQ'),
+    ('ERITREA', 'ER'),
+    ('ESTONIA', 'EE'),
+    ('ETHIOPIA', 'ET'),
+    ('FALKLAND_ISLANDS', 'FK'),
+    ('FAROE_ISLANDS', 'FO'),
+    ('FIJI', 'FJ'),
+    ('FINLAND', 'FI'),
+    ('FRANCE', 'FR'),
+    ('FRENCH_GUIANA', 'GF'),
+    ('FRENCH_POLYNESIA', 'PF'),
+    ('FRENCH_SOUTHERN_TERRITORIES', 'TF'),
+    ('GABON', 'GA'),
+    ('GAMBIA', 'GM'),
+    ('GEORGIA', 'GE'),
+    ('GERMANY', 'DE'),
+    ('GHANA', 'GH'),
+    ('GIBRALTAR', 'GI'),
+    ('GREECE', 'GR'),
+    ('GREENLAND', 'GL'),
+    ('GRENADA', 'GD'),
+    ('GUADELOUPE', 'GP'),
+    ('GUAM', 'GU'),
+    ('GUATEMALA', 'GT'),
+    ('GUERNSEY', 'GG'),
+    ('GUINEA', 'GN'),
+    ('GUINEA_BISSAU', 'GW'),
+    ('GUYANA', 'GY'),
+    ('HAITI', 'HT'),
+    ('HEARD_ISLAND_AND_MCDONALD_ISLANDS', 'HM'),
+    ('HOLY_SEE', 'VA'),
+    ('HONDURAS', 'HN'),
+    ('HONG_KONG', 'HK'),
+    ('HUNGARY', 'HU'),
+    ('ICELAND', 'IS'),
+    ('INDIA', 'IN'),
+    ('INDONESIA', 'ID'),
+    ('IRAN', 'IR'),
+    ('IRAQ', 'IQ'),
+    ('IRELAND', 'IE'),
+    ('ISLE_OF_MAN', 'IM'),
+    ('ISRAEL', 'IL'),
+    ('ITALY', 'IT'),
+    ('JAMAICA', 'JM'),
+    ('JAPAN', 'JP'),
+    ('JERSEY', 'JE'),
+    ('JORDAN', 'JO'),
+    ('KAZAKHSTAN', 'KZ'),
+    ('KENYA', 'KE'),
+    ('KIRIBATI', 'KI'),
+    ('DEMOCRATIC_PEOPLES_REPUBLIC_OF_KOREA', 'KP'),
+    ('REPUBLIC_OF_KOREA', 'KR'),
+    ('KUWAIT', 'KW'),
+    ('KYRGYZSTAN', 'KG'),
+    ('LAO_PEOPLES_DEMOCRATIC_REPUBLIC', 'LA'),
+    ('LATVIA', 'LV'),
+    ('LEBANON', 'LB'),
+    ('LESOTHO', 'LS'),
+    ('LIBERIA', 'LR'),
+    ('LIBYA', 'LY'),
+    ('LIECHTENSTEIN', 'LI'),
+    ('LITHUANIA', 'LT'),
+    ('LUXEMBOURG', 'LU'),
+    ('MACAO', 'MO'),
+    ('MACEDONIA', 'MK'),
+    ('MADAGASCAR', 'MG'),
+    ('MALAWI', 'MW'),
+    ('MALAYSIA', 'MY'),
+    ('MALDIVES', 'MV'),
+    ('MALI', 'ML'),
+    ('MALTA', 'MT'),
+    ('MARSHALL_ISLANDS', 'MH'),
+    ('MARTINIQUE', 'MQ'),
+    ('MAURITANIA', 'MR'),
+    ('MAURITIUS', 'MU'),
+    ('MAYOTTE', 'YT'),
+    ('MEXICO', 'MX'),
+    ('MICRONESIA', 'FM'),
+    ('MOLDOVA', 'MD'),
+    ('MONACO', 'MC'),
+    ('MONGOLIA', 'MN'),
+    ('MONTENEGRO', 'ME'),
+    ('MONTSERRAT', 'MS'),
+    ('MOROCCO', 'MA'),
+    ('MOZAMBIQUE', 'MZ'),
+    ('MYANMAR', 'MM'),
+    ('NAMIBIA', 'NA'),
+    ('NAURU', 'NR'),
+    ('NEPAL', 'NP'),
+    ('NETHERLANDS', 'NL'),
+    ('NEW_CALEDONIA', 'NC'),
+    ('NEW_ZEALAND', 'NZ'),
+    ('NICARAGUA', 'NI'),
+    ('NIGER', 'NE'),
+    ('NIGERIA', 'NG'),
+    ('NIUE', 'NU'),
+    ('NORFOLK_ISLAND', 'NF'),
+    ('NORTHERN_MARIANA_ISLANDS', 'MP'),
+    ('NORWAY', 'NO'),
+    ('OMAN', 'OM'),
+    ('PAKISTAN', 'PK'),
+    ('PALAU', 'PW'),
+    ('STATE_OF_PALESTINE', 'PS'),
+    ('PANAMA', 'PA'),
+    ('PAPUA_NEW_GUINEA', 'PG'),
+    ('PARAGUAY', 'PY'),
+    ('PERU', 'PE'),
+    ('PHILIPPINES', 'PH'),
+    ('PITCAIRN', 'PN'),
+    ('POLAND', 'PL'),
+    ('PORTUGAL', 'PT'),
+    ('PUERTO_RICO', 'PR'),
+    ('QATAR', 'QA'),
+    ('REUNION', 'RE'),
+    ('ROMANIA', 'RO'),
+    ('RUSSIAN_FEDERATION', 'RU'),
+    ('RWANDA', 'RW'),
+    ('SAINT_BARTHELEMY', 'BL'),
+    ('SAINT_HELENA_ASCENSION_AND_TRISTAN_DA_CUNHA', 'SH'),
+    ('SAINT_KITTS_AND_NEVIS', 'KN'),
+    ('SAINT_LUCIA', 'LC'),
+    ('SAINT_MARTIN_FENCH', 'MF'),
+    ('SAINT_PIERRE_AND_MIQUELON', 'PM'),
+    ('SAINT_VINCENT_AND_THE_GRENADINES', 'VC'),
+    ('SAMOA', 'WS'),
+    ('SAN_MARINO', 'SM'),
+    ('SAO_TOME_AND_PRINCIPE', 'ST'),
+    ('SAUDI_ARABIA', 'SA'),
+    ('SENEGAL', 'SN'),
+    ('SERBIA', 'RS'),
+    ('SEYCHELLES', 'SC'),
+    ('SIERRA_LEONE', 'SL'),
+    ('SINGAPORE', 'SG'),
+    ('SINT_MAARTEN_DUTCH', 'SX'),
+    ('SLOVAKIA', 'SK'),
+    ('SLOVENIA', 'SI'),
+    ('SOLOMON_ISLANDS', 'SB'),
+    ('SOMALIA', 'SO'),
+    ('SOUTH_AFRICA', 'ZA'),
+    ('SOUTH_GEORGIA_AND_THE_SOUTH_SANDWICH_ISLANDS', 'GS'),
+    ('SOUTH_SUDAN', 'SS'),
+    ('SPAIN', 'ES'),
+    ('SRI_LANKA', 'LK'),
+    ('SUDAN', 'SD'),
+    ('SURINAME', 'SR'),
+    ('SVALBARD_AND_JAN_MAYEN', 'SJ'),
+    ('SWAZILAND', 'SZ'),
+    ('SWEDEN', 'SE'),
+    ('SWITZERLAND', 'CH'),
+    ('SYRIAN_ARAB_REPUBLIC', 'SY'),
+    ('TAIWAN', 'TW'),
+    ('TAJIKISTAN', 'TJ'),
+    ('TANZANIA', 'TZ'),
+    ('THAILAND', 'TH'),
+    ('TIMOR_LESTE', 'TL'),
+    ('TOGO', 'TG'),
+    ('TOKELAU', 'TK'),
+    ('TONGA', 'TO'),
+    ('TRINIDAD_AND_TOBAGO', 'TT'),
+    ('TUNISIA', 'TN'),
+    ('TURKEY', 'TR'),
+    ('TURKMENISTAN', 'TM'),
+    ('TURKS_AND_CAICOS_ISLANDS', 'TC'),
+    ('TUVALU', 'TV'),
+    ('UGANDA', 'UG'),
+    ('UKRAINE', 'UA'),
+    ('UNITED_ARAB_EMIRATES', 'AE'),
+    ('UNITED_KINGDOM_OF_GREAT_BRITAIN_AND_NORTHERN_IRELAND', 'GB'),
+    ('UNITED_STATES_OF_AMERICA', 'US'),
+    ('UNITED_STATES_MINOR_OUTLYING_ISLANDS', 'UM'),
+    ('URUGUAY', 'UY'),
+    ('UZBEKISTAN', 'UZ'),
+    ('VANUATU', 'VU'),
+    ('VENEZUELA', 'VE'),
+    ('VIET_NAM', 'VN'),
+    ('VIRGIN_ISLANDS_BRITISH', 'VG'),
+    ('VIRGIN_ISLANDS_US', 'VI'),
+    ('WALLIS_AND_FUTUNA', 'WF'),
+    ('WESTERN_SAHARA', 'EH'),
+    ('YEMEN', 'YE'),
+    ('ZAMBIA', 'ZM'),
+    ('ZIMBABWE', 'ZW'),
+)
+
+
+def __getattr__(name: str):
+    if name == 'Country':
+        global Country
+        Country = Enum('Country', _COUNTRIES, module=__name__, qualname='Country')
+        return Country
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
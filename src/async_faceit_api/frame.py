@@ -0,0 +1,216 @@
+"""
+Columnar frames of the player statistics of many matches
+"""
+from array import array
+from math import isnan, nan
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from .dataclasses import MatchStats
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+KEY_COLUMNS: Tuple[str, ...] = ('match_id', 'map', 'team', 'player_id')
+"""The columns identifying a row, the player of a team on one map of a match"""
+
+AGGREGATES = ('mean', 'sum', 'min', 'max')
+
+Column = Union[List[str], array]
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+class StatsFrame:
+    """
+    The player statistics of many matches in columns, one row per player and map.
+
+    The key columns ``match_id``, ``map``, ``team`` and ``player_id`` are lists of strings. Every numeric statistic,
+    e.g. ``Kills`` or ``K/R Ratio``, is a column of floats (``array('d')``), missing values are ``nan``. Whether a
+    statistic is numeric is decided once from its first value::
+
+        frame = StatsFrame.from_match_stats(await api.match_stats_many(match_ids))
+        per_player = frame.per_player()
+        per_player['K/D Ratio']
+
+    NumPy is used for the aggregations if it is installed.
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        """
+        :param columns: The columns by name, all of the same length
+        :type columns: Dict[str, Union[List[str], array]]
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'The columns differ in length: {sorted(lengths)}')
+        self.__columns = columns
+        self.__length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_match_stats(cls, stats: Iterable[MatchStats]) -> 'StatsFrame':
+        """Create the frame of the player statistics of matches
+
+        Responses that are not successful, e.g. :class:`.FaceitApiError`, are skipped.
+
+        :param stats: The statistics of the matches
+        :type stats: Iterable[:class:`.MatchStats`]
+        :return: The frame with one row per player and map
+        :rtype: :class:`.StatsFrame`
+        """
+        keys: Dict[str, List[str]] = {name: [] for name in KEY_COLUMNS}
+        match_ids, maps, teams, player_ids = keys.values()
+        columns: Dict[str, array] = {}
+        text = set()
+        rows = 0
+        for match_stats in stats:
+            if not match_stats:
+                continue
+            for round_stats in match_stats.rounds:
+                map_ = round_stats.round_stats.get('Map')
+                for team in round_stats.teams:
+                    for player in team.players:
+                        match_ids.append(round_stats.match_id)
+                        maps.append(map_)
+                        teams.append(team.team_id)
+                        player_ids.append(player.get('player_id'))
+                        rows += 1
+                        for name, value in player.get('player_stats', {}).items():
+                            column = columns.get(name)
+                            if column is None:
+                                if name in text or value in (None, ''):
+                                    continue
+                                if not _is_number(value):
+                                    text.add(name)
+                                    continue
+                                column = columns[name] = array('d', [nan]) * (rows - 1)
+                            try:
+                                column.append(float(value))
+                            except (TypeError, ValueError):
+                                column.append(nan)
+                        for column in columns.values():
+                            if len(column) < rows:
+                                column.append(nan)
+        return cls({**keys, **columns})
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(self, name: str) -> Column:
+        return self.__columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.__columns
+
+    def __repr__(self) -> str:
+        return f'StatsFrame({self.__length} rows, columns={list(self.__columns)})'
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of all columns"""
+        return list(self.__columns)
+
+    @property
+    def stats(self) -> List[str]:
+        """The names of the numeric columns"""
+        return [name for name, column in self.__columns.items() if isinstance(column, array)]
+
+    def to_numpy(self) -> Dict[str, 'numpy.ndarray']:
+        """Convert the columns to NumPy arrays, the numeric columns share their memory with the frame
+
+        :raises ImportError: If NumPy is not installed
+        :return: The arrays by column name
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        if numpy is None:
+            raise ImportError('to_numpy requires numpy')
+        return {name: numpy.frombuffer(column, dtype=numpy.float64) if isinstance(column, array)
+                else numpy.array(column, dtype=object) for name, column in self.__columns.items()}
+
+    def group_by(self, *keys: str, aggregate: str = 'mean') -> 'StatsFrame':
+        """Aggregate the numeric columns per group of rows with equal keys
+
+        Missing values are ignored. The groups are in the order of their first row, the column ``rows`` holds
+        the number of rows of each group. Grouping a grouped frame counts its rows again, it does not aggregate
+        their ``rows``.
+
+        :param keys: The names of the columns to group by, e.g. ``'player_id'``
+        :param aggregate: One of ``mean``, ``sum``, ``min`` and ``max``
+        :type aggregate: str, optional
+        :return: The frame with one row per group
+        :rtype: :class:`.StatsFrame`
+        """
+        if aggregate not in AGGREGATES:
+            raise ValueError(f'Unknown aggregate {aggregate!r}, expected one of {AGGREGATES}')
+        groups: Dict[Tuple, int] = {}
+        indices = array('q', (groups.setdefault(key, len(groups))
+                              for key in zip(*(self.__columns[name] for name in keys))))
+        result: Dict[str, Column] = {name: [key[i] for key in groups] for i, name in enumerate(keys)}
+        result['rows'] = array('d', self.__count(indices, len(groups)))
+        for name in self.stats:
+            if name == 'rows':
+                continue
+            result[name] = (self.__aggregate_numpy if numpy is not None else self.__aggregate)(
+                self.__columns[name], indices, len(groups), aggregate)
+        return StatsFrame(result)
+
+    def per_player(self, aggregate: str = 'mean') -> 'StatsFrame':
+        """Aggregate the numeric columns per player, see :meth:`group_by`
+
+        :param aggregate: One of ``mean``, ``sum``, ``min`` and ``max``
+        :type aggregate: str, optional
+        :return: The frame with one row per player
+        :rtype: :class:`.StatsFrame`
+        """
+        return self.group_by('player_id', aggregate=aggregate)
+
+    def per_map(self, aggregate: str = 'mean') -> 'StatsFrame':
+        """Aggregate the numeric columns per map, see :meth:`group_by`
+
+        :param aggregate: One of ``mean``, ``sum``, ``min`` and ``max``
+        :type aggregate: str, optional
+        :return: The frame with one row per map
+        :rtype: :class:`.StatsFrame`
+        """
+        return self.group_by('map', aggregate=aggregate)
+
+    @staticmethod
+    def __count(indices: Sequence[int], size: int) -> List[int]:
+        counts = [0] * size
+        for index in indices:
+            counts[index] += 1
+        return counts
+
+    @staticmethod
+    def __aggregate(column: array, indices: Sequence[int], size: int, aggregate: str) -> array:
+        values: List[List[float]] = [[] for _ in range(size)]
+        for index, value in zip(indices, column):
+            if not isnan(value):
+                values[index].append(value)
+        function = {'mean': lambda x: sum(x) / len(x), 'sum': sum, 'min': min, 'max': max}[aggregate]
+        return array('d', (function(group) if group else nan for group in values))
+
+    @staticmethod
+    def __aggregate_numpy(column: array, indices: Sequence[int], size: int, aggregate: str) -> array:
+        values = numpy.frombuffer(column, dtype=numpy.float64)
+        groups = numpy.frombuffer(indices, dtype=numpy.int64)
+        valid = ~numpy.isnan(values)
+        values, groups = values[valid], groups[valid]
+        counts = numpy.bincount(groups, minlength=size)
+        if aggregate in ('mean', 'sum'):
+            result = numpy.bincount(groups, weights=values, minlength=size)
+            if aggregate == 'mean':
+                with numpy.errstate(invalid='ignore', divide='ignore'):
+                    result = result / counts
+        else:
+            result = numpy.full(size, numpy.inf if aggregate == 'min' else -numpy.inf)
+            (numpy.minimum if aggregate == 'min' else numpy.maximum).at(result, groups, values)
+        result[counts == 0] = numpy.nan
+        return array('d', result.tobytes())
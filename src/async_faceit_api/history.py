@@ -0,0 +1,174 @@
+"""
+Crawling of the complete match history of a player
+"""
+import asyncio
+import threading
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Tuple, Union
+
+from .dataclasses import PlayerMatch
+
+_HOUR = 3600
+_DAY = 24 * _HOUR
+
+
+async def crawl_history(fetch_window: Callable[[int, int], Awaitable[List[PlayerMatch]]], since: int, until: int,
+                        concurrency: int = 4, window: int = 30 * _DAY, target: int = 100,
+                        min_window: int = _HOUR, max_window: int = 365 * _DAY) -> AsyncIterator[PlayerMatch]:
+    """Iterate over the matches of a time range, newest first, by splitting it into time windows
+
+    The windows are requested concurrently and the matches are yielded window by window, without duplicates.
+    The size of the next window adapts to the match density of the last finished one, so a window holds about
+    ``target`` matches and needs no deep offsets.
+
+    :param fetch_window: Retrieves all matches from one timestamp to another
+    :type fetch_window: Callable[[int, int], Awaitable[List[:class:`.PlayerMatch`]]]
+    :param since: The timestamp in sec of the lower bound
+    :type since: int
+    :param until: The timestamp in sec of the upper bound
+    :type until: int
+    :param concurrency: The maximum number of windows requested at once
+    :type concurrency: int, optional
+    :param window: Seconds of the first window
+    :type window: int, optional
+    :param target: The number of matches a window should hold
+    :type target: int, optional
+    :param min_window: Lower bound of the seconds of a window
+    :type min_window: int, optional
+    :param max_window: Upper bound of the seconds of a window
+    :type max_window: int, optional
+    :raises ValueError: If the concurrency is less than 1
+    :return: Iterator over the matches, newest first
+    :rtype: AsyncIterator[:class:`.PlayerMatch`]
+    """
+    if concurrency < 1:
+        # no window would ever be requested and the iterator would end without a match
+        raise ValueError(f'The concurrency has to be at least 1, got {concurrency}')
+    windows: Deque[Tuple[int, int, asyncio.Task]] = deque()
+    seen = set()
+    end = until
+    try:
+        while True:
+            while end > since and len(windows) < concurrency:
+                start = max(since, end - window)
+                windows.append((start, end, asyncio.ensure_future(fetch_window(start, end))))
+                # consecutive windows share their boundary second, duplicates are dropped below
+                end = start
+            if not windows:
+                break
+            start, stop, task = windows.popleft()
+            matches = await task
+            density = max(len(matches), 1) / max(stop - start, 1)
+            window = int(min(max_window, 4 * (stop - start), max(min_window, target / density)))
+            for match in sorted(matches, key=lambda m: m.started_at or 0, reverse=True):
+                if match.match_id not in seen:
+                    seen.add(match.match_id)
+                    yield match
+    finally:
+        for _, _, task in windows:
+            task.cancel()
+
+
+class Checkpoint:
+    """The newest finished match of a player that was synchronized"""
+    __slots__ = ('finished_at', 'match_id')
+
+    def __init__(self, finished_at: int, match_id: str):
+        self.finished_at = finished_at
+        self.match_id = match_id
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Checkpoint):
+            return NotImplemented
+        return self.finished_at == other.finished_at and self.match_id == other.match_id
+
+    def __repr__(self) -> str:
+        return f'Checkpoint(finished_at={self.finished_at}, match_id={self.match_id!r})'
+
+
+class CheckpointStore:
+    """
+    Base class of the stores keeping the :class:`.Checkpoint` of every synchronized player and game
+    """
+
+    async def get(self, player_id: str, game: str) -> Union[Checkpoint, None]:
+        """Get the checkpoint of a player
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: The id of the game
+        :type game: str
+        :return: The checkpoint or None if the player was never synchronized
+        :rtype: Union[:class:`.Checkpoint`, None]
+        """
+        raise NotImplementedError
+
+    async def set(self, player_id: str, game: str, checkpoint: Checkpoint):
+        """Save the checkpoint of a player
+
+        :param player_id: The id of the player
+        :type player_id: str
+        :param game: The id of the game
+        :type game: str
+        :param checkpoint: The new checkpoint
+        :type checkpoint: :class:`.Checkpoint`
+        """
+        raise NotImplementedError
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """
+    Keeps the checkpoints in memory, they are lost when the process ends
+    """
+
+    def __init__(self):
+        self.__checkpoints: Dict[Tuple[str, str], Checkpoint] = {}
+
+    async def get(self, player_id: str, game: str) -> Union[Checkpoint, None]:
+        return self.__checkpoints.get((player_id, game))
+
+    async def set(self, player_id: str, game: str, checkpoint: Checkpoint):
+        self.__checkpoints[(player_id, game)] = checkpoint
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Keeps the checkpoints in a local SQLite file
+    """
+
+    def __init__(self, path: str = 'faceit_checkpoints.sqlite'):
+        """
+        :param path: Path of the SQLite file
+        :type path: str, optional
+        """
+        self.path = path
+        self.__lock = threading.Lock()
+        import sqlite3
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute('CREATE TABLE IF NOT EXISTS checkpoints (player_id TEXT NOT NULL, '
+                                      'game TEXT NOT NULL, finished_at INTEGER NOT NULL, match_id TEXT NOT NULL, '
+                                      'PRIMARY KEY (player_id, game))')
+
+    def __get(self, player_id: str, game: str) -> Union[Checkpoint, None]:
+        with self.__lock:
+            row = self.__connection.execute('SELECT finished_at, match_id FROM checkpoints '
+                                            'WHERE player_id = ? AND game = ?', (player_id, game)).fetchone()
+        return None if row is None else Checkpoint(*row)
+
+    def __set(self, player_id: str, game: str, checkpoint: Checkpoint):
+        with self.__lock, self.__connection:
+            self.__connection.execute('INSERT OR REPLACE INTO checkpoints (player_id, game, finished_at, match_id) '
+                                      'VALUES (?, ?, ?, ?)',
+                                      (player_id, game, checkpoint.finished_at, checkpoint.match_id))
+
+    async def get(self, player_id: str, game: str) -> Union[Checkpoint, None]:
+        return await asyncio.to_thread(self.__get, player_id, game)
+
+    async def set(self, player_id: str, game: str, checkpoint: Checkpoint):
+        await asyncio.to_thread(self.__set, player_id, game, checkpoint)
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,105 @@
+"""
+Canonical response objects per id and interning of repeated strings
+"""
+import sys
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Type, TypeVar
+from weakref import WeakValueDictionary
+
+from .dataclasses import (Championship, FaceitApiResponse, GameData, Hub, Match, OrganizerData, Player, Team,
+                          Tournament)
+
+R = TypeVar("R", bound=FaceitApiResponse)
+
+ID_FIELDS: Dict[Type[FaceitApiResponse], str] = {
+    Championship: 'championship_id',
+    GameData: 'game_id',
+    Hub: 'hub_id',
+    Match: 'match_id',
+    OrganizerData: 'organizer_id',
+    Player: 'player_id',
+    Team: 'team_id',
+    Tournament: 'tournament_id',
+}
+"""The field identifying the responses of a model that have one canonical object"""
+
+INTERNED_FIELDS: FrozenSet[str] = frozenset({
+    'id', 'game', 'game_mode', 'region', 'status', 'state', 'type', 'nickname', 'country', 'membership_type',
+    'memberships', 'roles', 'competition_name', 'competition_type', 'match_type', 'playing_players', 'winner',
+    'Map', 'Region', 'Winner', 'Team',
+})
+"""Fields with enum-like or repeated string values, besides all fields ending with ``_id`` or ``_ids``"""
+
+
+def _interned(key: str) -> bool:
+    return key in INTERNED_FIELDS or key.endswith('_id') or key.endswith('_ids')
+
+
+class IdentityMap:
+    """
+    Resolves the responses of entities with the same id, e.g. :class:`.Player` or :class:`.Team`, to one canonical
+    object and interns id and enum-like strings, so big crawls keep every repeated value only once.
+
+    A response that is retrieved again updates the canonical object with its fields. The map holds the objects
+    weakly, they are released once they are not referenced anymore::
+
+        api = FaceitAPI(api_key, identity_map=IdentityMap())
+        assert await api.player_by_player_id(player_id) is await api.player_by_player_id(player_id)
+    """
+
+    def __init__(self):
+        self.__objects: Dict[type, WeakValueDictionary] = defaultdict(WeakValueDictionary)
+
+    def __len__(self) -> int:
+        return sum(len(objects) for objects in self.__objects.values())
+
+    @staticmethod
+    def intern(data: Any) -> Any:
+        """Intern the strings of the id and enum-like fields of decoded json in place
+
+        :param data: The decoded json
+        :type data: Any
+        :return: The decoded json
+        :rtype: Any
+        """
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, str):
+                    if _interned(key):
+                        data[key] = sys.intern(value)
+                elif isinstance(value, list) and value and isinstance(value[0], str):
+                    if _interned(key):
+                        data[key] = [sys.intern(x) if isinstance(x, str) else x for x in value]
+                elif isinstance(value, (dict, list)):
+                    IdentityMap.intern(value)
+        elif isinstance(data, list):
+            for value in data:
+                if isinstance(value, (dict, list)):
+                    IdentityMap.intern(value)
+        return data
+
+    def get(self, object_class: Type[R], data: dict, lazy: bool = False) -> R:
+        """Create the response of the decoded json or update and return the canonical object of its id
+
+        :param object_class: The model of the response
+        :type object_class: Type[:class:`.FaceitApiResponse`]
+        :param data: The decoded json of the response
+        :type data: dict
+        :param lazy: Create the response with :meth:`.FaceitApiResponse.lazy`
+        :type lazy: bool, optional
+        :return: The response
+        :rtype: :class:`.FaceitApiResponse`
+        """
+        from .registry import from_dict
+        self.intern(data)
+        field = ID_FIELDS.get(object_class)
+        key = None if field is None else data.get(field)
+        if key is None:
+            return object_class.lazy(data) if lazy else from_dict(object_class, data)
+        objects = self.__objects[object_class]
+        response = objects.get(key)
+        if response is None:
+            response = objects[key] = object_class.lazy(data) if lazy else from_dict(object_class, data)
+        else:
+            response._load(data, lazy)
+        return response
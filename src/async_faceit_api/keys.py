@@ -0,0 +1,131 @@
+"""
+Spreading the requests of :class:`.FaceitAPI` over several api keys
+"""
+import asyncio
+import time
+from typing import Iterable, Iterator, List, Mapping, Union
+
+from .ratelimit import RateLimiter, parse_retry_after
+
+
+class ApiKey:
+    """
+    An api key with its own rate limiter, cool-down and metrics.
+    """
+
+    def __init__(self, token: str, rate_limiter: RateLimiter = None, cooldown: float = 1.0):
+        """
+        :param token: The FACEIT api key
+        :type token: str
+        :param rate_limiter: Limiter of the requests made with this key
+        :type rate_limiter: :class:`.RateLimiter`, optional
+        :param cooldown: Seconds the key is not used after a 429 response without ``Retry-After`` header
+        :type cooldown: float, optional
+        """
+        self.authorization = f'Bearer {token}'
+        self.rate_limiter = rate_limiter
+        self.cooldown = cooldown
+        self.cooldown_until = 0.0
+        """Monotonic time until which the key is not used"""
+        self.requests = 0
+        """Requests sent with the key"""
+        self.throttled = 0
+        """Responses with status 429"""
+        self.in_flight = 0
+        """Requests waiting for the limiter of the key or for their response"""
+        self.remaining: Union[int, None] = None
+        """The last ``X-RateLimit-Remaining`` reported by the server"""
+
+    def __repr__(self) -> str:
+        # the key itself is never shown, only enough of it to tell the keys apart
+        return (f'ApiKey(...{self.authorization[-4:]}, requests={self.requests}, throttled={self.throttled}, '
+                f'in_flight={self.in_flight}, remaining={self.remaining})')
+
+    @property
+    def available(self) -> float:
+        """Estimate of the requests the key may send right now, from its limiter or else from the server"""
+        if self.rate_limiter is not None:
+            return self.rate_limiter.bucket.tokens
+        return 0.0 if self.remaining is None else float(self.remaining)
+
+    def update(self, endpoint: str, status: int, headers: Mapping[str, str]):
+        """Update the limiter, the metrics and the cool-down of the key with a response
+
+        :param endpoint: The endpoint family of the request
+        :type endpoint: str
+        :param status: The status code of the response
+        :type status: int
+        :param headers: The headers of the response
+        :type headers: Mapping[str, str]
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(endpoint, status, headers)
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            self.remaining = int(remaining)
+        if status == 429:
+            self.throttled += 1
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            self.cooldown_until = max(self.cooldown_until,
+                                      time.monotonic() + (self.cooldown if retry_after is None else retry_after))
+
+
+class KeyPool:
+    """
+    Hands out the least loaded of several api keys for every request.
+
+    Keys in their cool-down after a 429 response are skipped. Of the others, the key with the most requests
+    available by its limiter, or else by the ``X-RateLimit-Remaining`` of its last response, and the fewest requests
+    in flight is used. If all keys cool down, the request waits for the first one to be ready again::
+
+        api = FaceitAPI([key_1, key_2, key_3], rate_limiter=RateLimiter(rate=10))
+        for key in api.keys:
+            print(key)
+    """
+
+    def __init__(self, keys: Iterable[ApiKey]):
+        """
+        :param keys: The keys
+        :type keys: Iterable[:class:`.ApiKey`]
+        """
+        self.__keys: List[ApiKey] = list(keys)
+        if not self.__keys:
+            raise ValueError('The pool needs at least one api key')
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __iter__(self) -> Iterator[ApiKey]:
+        return iter(self.__keys)
+
+    def __getitem__(self, index: int) -> ApiKey:
+        return self.__keys[index]
+
+    async def acquire(self) -> ApiKey:
+        """Choose the key for a request, it counts as in flight until :meth:`release`
+
+        :return: The key
+        :rtype: :class:`.ApiKey`
+        """
+        if len(self.__keys) == 1:
+            key = self.__keys[0]
+        else:
+            while True:
+                now = time.monotonic()
+                ready = [key for key in self.__keys if key.cooldown_until <= now]
+                if ready:
+                    key = min(ready, key=lambda k: (k.in_flight - k.available, k.requests))
+                    break
+                await asyncio.sleep(min(key.cooldown_until for key in self.__keys) - now)
+        key.in_flight += 1
+        key.requests += 1
+        return key
+
+    @staticmethod
+    def release(key: ApiKey):
+        """Mark the request of a key as finished
+
+        :param key: The key returned by :meth:`acquire`
+        :type key: :class:`.ApiKey`
+        """
+        key.in_flight -= 1
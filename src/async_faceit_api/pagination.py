@@ -0,0 +1,131 @@
+"""
+Iteration over the pages of the offset paginated collection endpoints
+"""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from .dataclasses import Collection, FaceitApiException
+
+MAX_PAGE_SIZE: Dict[str, int] = {
+    'championships': 10,
+    'championship_matches': 100,
+    'championship_results': 100,
+    'championship_subscriptions': 10,
+    'games': 100,
+    'hub_matches': 100,
+    'hub_members': 50,
+    'hub_roles': 50,
+    'leaderboards_championship': 100,
+    'leaderboards_championship_groups': 100,
+    'leaderboards_hub': 100,
+    'leaderboards_hub_general': 100,
+    'leaderboards_hub_season': 100,
+    'leaderboard': 100,
+    'organizer_championships': 10,
+    'organizer_hubs': 50,
+    'organizer_tournaments': 50,
+    'player_history': 100,
+    'player_hubs': 50,
+    'player_tournaments': 50,
+    'ranking': 100,
+    'search_championships': 100,
+    'search_hubs': 100,
+    'search_organizers': 100,
+    'search_players': 100,
+    'search_teams': 100,
+    'search_tournaments': 100,
+    'team_tournaments': 50,
+    'tournaments': 100,
+    'tournament_matches': 100,
+}
+"""Largest ``limit`` the data api accepts per collection method of :class:`.FaceitAPI`"""
+
+
+async def paginate(fetch: Callable[[int, int], Awaitable[Collection]], page_size: int,
+                   offset: int = 0) -> AsyncIterator[Any]:
+    """Iterate over the items of all pages. The next page is requested while the current one is consumed
+
+    :param fetch: Requests the page for an offset and a limit
+    :type fetch: Callable[[int, int], Awaitable[:class:`.Collection`]]
+    :param page_size: The number of items per page
+    :type page_size: int
+    :param offset: The position of the first item
+    :type offset: int, optional
+    :raises FaceitApiException: If a page can not be retrieved
+    :return: Iterator over the items of all pages, it stops after the first page that is not full
+    :rtype: AsyncIterator[Any]
+    """
+    task = asyncio.ensure_future(fetch(offset, page_size))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+            if not page:
+                raise FaceitApiException(page)
+            if len(page.items) >= page_size:
+                offset += page_size
+                task = asyncio.ensure_future(fetch(offset, page_size))
+            for item in page.items:
+                yield item
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def fetch_pages(fetch: Callable[[int, int], Awaitable[Collection]], page_size: int, concurrency: int = 4,
+                      offset: int = 0, max_items: int = None) -> List[Any]:
+    """Request the pages concurrently and join their items in order
+
+    At most ``concurrency`` pages are requested at once. Once a page is not full, no further pages are requested
+    and requests for pages behind it are cancelled.
+
+    :param fetch: Requests the page for an offset and a limit
+    :type fetch: Callable[[int, int], Awaitable[:class:`.Collection`]]
+    :param page_size: The number of items per page
+    :type page_size: int
+    :param concurrency: The maximum number of pages requested at once
+    :type concurrency: int, optional
+    :param offset: The position of the first item
+    :type offset: int, optional
+    :param max_items: The maximum number of items to retrieve, all if not specified
+    :type max_items: int, optional
+    :raises ValueError: If the concurrency is less than 1
+    :raises FaceitApiException: If a page can not be retrieved
+    :return: The items of all pages
+    :rtype: List[Any]
+    """
+    if concurrency < 1:
+        raise ValueError(f'The concurrency has to be at least 1, got {concurrency}')
+    max_pages = None if max_items is None else -(-max_items // page_size)
+    pages: Dict[int, list] = {}
+    requests: Dict[asyncio.Task, int] = {}
+    last = max_pages - 1 if max_pages is not None else None
+    scheduled = 0
+    try:
+        while True:
+            while len(requests) < concurrency and (last is None or scheduled <= last):
+                requests[asyncio.ensure_future(fetch(offset + scheduled * page_size, page_size))] = scheduled
+                scheduled += 1
+            if not requests:
+                break
+            done, _ = await asyncio.wait(requests, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # a page before it in the same batch may have ended the collection already
+                index = requests.pop(task, None)
+                if index is None or last is not None and index > last:
+                    continue
+                page = task.result()
+                if not page:
+                    raise FaceitApiException(page)
+                pages[index] = page.items
+                if len(page.items) < page_size:
+                    last = index
+                    for pending, pending_index in list(requests.items()):
+                        if pending_index > last:
+                            pending.cancel()
+                            del requests[pending]
+    finally:
+        for pending in requests:
+            pending.cancel()
+    items = [item for index in sorted(pages) for item in pages[index]]
+    return items if max_items is None else items[:max_items]
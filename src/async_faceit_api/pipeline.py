@@ -0,0 +1,103 @@
+"""
+Streaming pipelines with bounded queues between their stages
+"""
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, List, Tuple
+
+_DONE = object()
+
+
+class Pipeline:
+    """
+    Streams the items of an async iterable through stages of async functions.
+
+    Every stage runs its own number of workers and passes its results through a bounded queue to the next stage,
+    so a slow stage holds back the stages in front of it and memory stays flat. The results are yielded as soon
+    as they are ready, in the order they finish::
+
+        async def with_stats(match):
+            return match, await api.match_stats(match.match_id)
+
+        async for match, stats in Pipeline(api.iter_player_history(player_id, Game.CS_GO)).map(with_stats, 8):
+            ...
+    """
+
+    def __init__(self, source: AsyncIterable[Any], buffer: int = 16):
+        """
+        :param source: The items to stream through the stages
+        :type source: AsyncIterable[Any]
+        :param buffer: The maximum number of items waiting between two stages
+        :type buffer: int, optional
+        """
+        self.__source = source
+        self.__buffer = buffer
+        self.__stages: List[Tuple[Callable[[Any], Awaitable[Any]], int]] = []
+
+    def map(self, function: Callable[[Any], Awaitable[Any]], concurrency: int = 4) -> 'Pipeline':
+        """Add a stage calling the function with every item
+
+        :param function: Creates the result of the stage for an item
+        :type function: Callable[[Any], Awaitable[Any]]
+        :param concurrency: The number of items processed at once by this stage
+        :type concurrency: int, optional
+        :raises ValueError: If the concurrency is less than 1
+        :return: The pipeline itself
+        :rtype: :class:`.Pipeline`
+        """
+        if concurrency < 1:
+            # the stage would start no worker and the pipeline would wait forever for its results
+            raise ValueError(f'The concurrency has to be at least 1, got {concurrency}')
+        self.__stages.append((function, concurrency))
+        return self
+
+    async def __feed(self, outbox: asyncio.Queue):
+        async for item in self.__source:
+            await outbox.put(item)
+        await outbox.put(_DONE)
+
+    @staticmethod
+    async def __work(function: Callable[[Any], Awaitable[Any]], inbox: asyncio.Queue, outbox: asyncio.Queue,
+                     running: List[int]):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                # hand the end over to the other workers of the stage, the last one passes it on
+                await inbox.put(_DONE)
+                running[0] -= 1
+                if running[0] == 0:
+                    await outbox.put(_DONE)
+                return
+            await outbox.put(await function(item))
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        queues = [asyncio.Queue(self.__buffer) for _ in range(len(self.__stages) + 1)]
+        failure = asyncio.get_running_loop().create_future()
+
+        def watch(task: asyncio.Task):
+            if not task.cancelled() and task.exception() is not None and not failure.done():
+                failure.set_exception(task.exception())
+
+        tasks = [asyncio.ensure_future(self.__feed(queues[0]))]
+        for (function, concurrency), inbox, outbox in zip(self.__stages, queues, queues[1:]):
+            running = [concurrency]
+            tasks += [asyncio.ensure_future(self.__work(function, inbox, outbox, running))
+                      for _ in range(concurrency)]
+        for task in tasks:
+            task.add_done_callback(watch)
+        try:
+            while True:
+                get = asyncio.ensure_future(queues[-1].get())
+                await asyncio.wait((get, failure), return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    get.cancel()
+                    failure.result()
+                item = get.result()
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            if failure.done() and not failure.cancelled():
+                # the exception was raised already, do not let asyncio log it as never retrieved
+                failure.exception()
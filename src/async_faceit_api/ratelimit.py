@@ -0,0 +1,170 @@
+"""
+Client side rate limiting of the requests made by :class:`.FaceitAPI`
+"""
+import asyncio
+import time
+from fnmatch import fnmatchcase
+from typing import Dict, Mapping, Tuple, Union
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """Parse a ``Retry-After`` header
+
+    :param value: The header value, either delay seconds or a http date
+    :type value: Union[str, None]
+    :return: Seconds to wait or None if the value is missing or invalid
+    :rtype: Union[float, None]
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Async token bucket. Callers are queued first come, first served until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        :param rate: Tokens added per second
+        :type rate: float
+        :param burst: Maximum number of tokens the bucket can hold. Defaults to one second worth of tokens
+        :type burst: int, optional
+        :raises ValueError: If the rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f'The rate has to be positive, got {rate}')
+        self.rate = rate
+        self.burst = max(1, round(rate)) if burst is None else burst
+        self.__tokens = float(self.burst)
+        self.__updated = time.monotonic()
+        self.__paused_until = 0.0
+        self.__lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available"""
+        self.__refill(time.monotonic())
+        return self.__tokens
+
+    def __refill(self, now: float):
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        # asyncio.Lock wakes its waiters in arrival order, which keeps the queue fair
+        async with self.__lock:
+            while True:
+                now = time.monotonic()
+                self.__refill(now)
+                wait = self.__paused_until - now
+                if wait <= 0:
+                    if self.__tokens >= 1:
+                        self.__tokens -= 1
+                        return
+                    wait = (1 - self.__tokens) / self.rate
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the given number of seconds"""
+        now = time.monotonic()
+        self.__refill(now)
+        self.__tokens = 0.0
+        self.__paused_until = max(self.__paused_until, now + seconds)
+
+    def limit_to(self, remaining: int):
+        """Never hold more tokens than the server reports as remaining"""
+        self.__refill(time.monotonic())
+        self.__tokens = min(self.__tokens, float(remaining))
+
+
+class RateLimiter:
+    """
+    Token bucket limiter for one api key with optional buckets per endpoint family.
+
+    Endpoint families are patterns on the endpoint path with ``*`` for parameters, e.g. ``matches/*/stats`` or
+    ``players/*``. A request takes a token of the first matching family and one of the key-wide bucket::
+
+        limiter = RateLimiter(rate=10, families={'matches/*/stats': 4, 'players/*': (5, 20)})
+        api = FaceitAPI(api_key, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float = 10, burst: int = None,
+                 families: Mapping[str, Union[float, Tuple[float, int]]] = None):
+        """
+        :param rate: Requests per second for the whole key
+        :type rate: float, optional
+        :param burst: Requests that may be sent at once for the whole key
+        :type burst: int, optional
+        :param families: Rate or (rate, burst) per endpoint family pattern
+        :type families: Mapping[str, Union[float, Tuple[float, int]]], optional
+        :raises ValueError: If a rate is not positive
+        """
+        self.rate = rate
+        self.burst = burst
+        self.families = {} if families is None else dict(families)
+        self.bucket = TokenBucket(rate, burst)
+        self.__family_buckets: Dict[str, TokenBucket] = {}
+        for pattern, limit in self.families.items():
+            rate_, burst_ = limit if isinstance(limit, tuple) else (limit, None)
+            self.__family_buckets[pattern] = TokenBucket(rate_, burst_)
+        self.__resolved: Dict[str, Union[TokenBucket, None]] = {}
+
+    def copy(self) -> 'RateLimiter':
+        """Create a limiter with the same configuration and a fresh state"""
+        return RateLimiter(self.rate, self.burst, self.families)
+
+    def family_bucket(self, endpoint: str) -> Union[TokenBucket, None]:
+        """Get the bucket of the first family matching the endpoint
+
+        :param endpoint: The endpoint family of the request, see :func:`.endpoint_of`
+        :type endpoint: str
+        :return: The bucket or None if no family matches
+        :rtype: Union[:class:`.TokenBucket`, None]
+        """
+        try:
+            return self.__resolved[endpoint]
+        except KeyError:
+            bucket = next((b for p, b in self.__family_buckets.items() if fnmatchcase(endpoint, p)), None)
+            self.__resolved[endpoint] = bucket
+            return bucket
+
+    async def acquire(self, endpoint: str):
+        """Wait until a request to the endpoint may be sent"""
+        bucket = self.family_bucket(endpoint)
+        if bucket is not None:
+            await bucket.acquire()
+        await self.bucket.acquire()
+
+    def update(self, endpoint: str, status: int, headers: Mapping[str, str]):
+        """Adjust the buckets to the rate limit headers of a response
+
+        :param endpoint: The endpoint family of the request
+        :type endpoint: str
+        :param status: The status code of the response
+        :type status: int
+        :param headers: The headers of the response
+        :type headers: Mapping[str, str]
+        """
+        bucket = self.family_bucket(endpoint) or self.bucket
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            bucket.limit_to(int(remaining))
+            if int(remaining) == 0:
+                reset = parse_retry_after(headers.get('X-RateLimit-Reset'))
+                if reset is not None:
+                    # the reset is sent either as seconds from now or as unix timestamp
+                    bucket.pause(reset - time.time() if reset > 1e9 else reset)
+        if status == 429:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            self.bucket.pause(1 / self.rate if retry_after is None else retry_after)
@@ -0,0 +1,158 @@
+"""
+Generated constructors creating the response models from decoded json
+"""
+import ast
+import inspect
+import textwrap
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from . import dataclasses
+from .dataclasses import FaceitApiResponse
+
+R = TypeVar("R", bound=FaceitApiResponse)
+
+Constructor = Callable[[dict], Any]
+
+_constructors: Dict[type, Constructor] = {}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Rewrite(ast.NodeTransformer):
+    """Rewrites the statements of an ``__init__`` into the body of a constructor"""
+
+    def __init__(self, builders: Dict[str, str]):
+        self.builders = builders
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id == 'self':
+            return ast.copy_location(ast.Name('_self', node.ctx), node)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if isinstance(node.func, ast.Name) and node.func.id in ('_one', '_many'):
+            model, value = node.args
+            if not isinstance(model, ast.Name) or not isinstance(value, ast.Name):
+                raise _Unsupported(ast.unparse(node))
+            builder = ast.Name(self.builder(model.id), ast.Load())
+            if node.func.id == '_one':
+                # None if value is None else builder(value)
+                return ast.IfExp(ast.Compare(value, [ast.Is()], [ast.Constant(None)]), ast.Constant(None),
+                                 ast.Call(builder, [value], []))
+            # [builder(_x) for _x in value]
+            return ast.ListComp(ast.Call(builder, [ast.Name('_x', ast.Load())], []),
+                                [ast.comprehension(ast.Name('_x', ast.Store()), value, [], 0)])
+        return self.generic_visit(node)
+
+    def builder(self, model: str) -> str:
+        return self.builders.setdefault(model, f'_build_{model}')
+
+
+def _statements(cls: type, rewrite: _Rewrite, parameters: Dict[str, Any], fields: List[Tuple[str, ast.expr]]):
+    init = cls.__dict__.get('__init__')
+    if init is None:
+        raise _Unsupported(f'{cls.__name__} has no __init__')
+    function = ast.parse(textwrap.dedent(inspect.getsource(init))).body[0]
+    for name, parameter in list(inspect.signature(init).parameters.items())[1:]:
+        if parameter.kind is parameter.VAR_KEYWORD:
+            continue
+        if parameter.kind is not parameter.POSITIONAL_OR_KEYWORD:
+            raise _Unsupported(f'{cls.__name__}.__init__ has a {parameter.kind} parameter')
+        parameters.setdefault(name, None if parameter.default is parameter.empty else parameter.default)
+    for statement in function.body:
+        if isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Call) \
+                and ast.unparse(statement.value.func) == 'super().__init__':
+            base = cls.__bases__[0]
+            if base is FaceitApiResponse:
+                fields.append(('_FaceitApiResponse__success',
+                               statement.value.args[0] if statement.value.args else ast.Constant(True)))
+            else:
+                base_parameters = list(inspect.signature(base.__init__).parameters)[1:]
+                if [ast.unparse(arg) for arg in statement.value.args] != base_parameters[:len(statement.value.args)]:
+                    raise _Unsupported(f'{cls.__name__} renames the arguments of {base.__name__}')
+                _statements(base, rewrite, parameters, fields)
+        elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            target = statement.targets[0] if isinstance(statement, ast.Assign) else statement.target
+            if not isinstance(target, ast.Attribute) or ast.unparse(target.value) != 'self':
+                raise _Unsupported(ast.unparse(statement))
+            fields.append((target.attr, rewrite.visit(statement.value)))
+        else:
+            raise _Unsupported(ast.unparse(statement))
+
+
+def _generate(cls: type) -> Constructor:
+    builders: Dict[str, str] = {}
+    parameters: Dict[str, Any] = {}
+    fields: List[Tuple[str, ast.expr]] = []
+    _statements(cls, _Rewrite(builders), parameters, fields)
+    lines = ['def from_dict(_d):',
+             '    _self = _new(_cls)',
+             '    _get = _d.get',
+             '    _self._raw = None',
+             '    _self._extra = None if _fields.issuperset(_d) else '
+             '{_k: _v for _k, _v in _d.items() if _k not in _fields}']
+    defaults = {}
+    reads = {}
+    for name, default in parameters.items():
+        if default is None:
+            reads[name] = f'_get({name!r})'
+        else:
+            defaults[f'_default_{name}'] = default
+            reads[name] = f'_get({name!r}, _default_{name})'
+    uses = Counter(node.id for _, value in fields for node in ast.walk(value) if isinstance(node, ast.Name))
+    # a value that is only copied to a field is read straight into it, the others are read into a variable first
+    copied = {value.id for _, value in fields if isinstance(value, ast.Name) and uses[value.id] == 1}
+    lines += [f'    {name} = {read}' for name, read in reads.items() if name not in copied and uses[name]]
+    for attribute, value in fields:
+        code = reads[value.id] if isinstance(value, ast.Name) and value.id in copied else ast.unparse(value)
+        lines.append(f'    _self.{attribute} = {code}')
+    lines.append('    return _self')
+    module = vars(inspect.getmodule(cls))
+    namespace = {**module, '_new': object.__new__, '_cls': cls, '_fields': frozenset(parameters), **defaults}
+    namespace.update({builder: constructor(module[model]) for model, builder in builders.items()})
+    exec(compile('\n'.join(lines), f'<from_dict {cls.__name__}>', 'exec'), namespace)
+    return namespace['from_dict']
+
+
+def constructor(cls: Type[R]) -> Callable[[dict], R]:
+    """The constructor creating a model from its decoded json, generated on first use
+
+    The constructor sets the same fields as ``cls(**data)``, without the calls of the ``__init__`` methods. Models
+    that are not defined in this package, e.g. subclasses of the models, are created with ``cls(**data)``.
+
+    :param cls: The model
+    :type cls: Type[:class:`.FaceitApiResponse`]
+    :return: Function creating the model from decoded json
+    :rtype: Callable[[dict], :class:`.FaceitApiResponse`]
+    """
+    function = _constructors.get(cls)
+    if function is None:
+        if cls.__module__ == dataclasses.__name__ and cls is not FaceitApiResponse:
+            try:
+                function = _generate(cls)
+            except (_Unsupported, OSError, TypeError):
+                pass
+        if function is None:
+            def function(data: dict) -> R:
+                return cls(**data)
+        _constructors[cls] = function
+    return function
+
+
+def from_dict(cls: Type[R], data: dict) -> R:
+    """Create a model from its decoded json with the generated constructor of the model
+
+    :param cls: The model
+    :type cls: Type[:class:`.FaceitApiResponse`]
+    :param data: The decoded json
+    :type data: dict
+    :return: The model
+    :rtype: :class:`.FaceitApiResponse`
+    """
+    function = _constructors.get(cls)
+    if function is None:
+        function = constructor(cls)
+    return function(data)
@@ -0,0 +1,75 @@
+"""
+Retrying of failed requests made by :class:`.FaceitAPI`
+"""
+import asyncio
+import random
+from collections import Counter
+from typing import Iterable, Mapping, Union
+
+from .ratelimit import parse_retry_after
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with capped exponential backoff and full jitter.
+
+    The n-th retry waits a random time between 0 and ``min(backoff_cap, backoff_base * 2 ** (n - 1))`` seconds,
+    unless the response carries a ``Retry-After`` header. Only idempotent methods are retried.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_cap: float = 30.0,
+                 statuses: Iterable[int] = (429, 500, 502, 503, 504), methods: Iterable[str] = ('GET', 'HEAD'),
+                 respect_retry_after: bool = True):
+        """
+        :param max_attempts: Maximum number of attempts per request, including the first one
+        :type max_attempts: int, optional
+        :param backoff_base: Upper bound of the first backoff in seconds
+        :type backoff_base: float, optional
+        :param backoff_cap: Upper bound of every backoff in seconds. Longer ``Retry-After`` delays are not retried
+        :type backoff_cap: float, optional
+        :param statuses: Response status codes that are retried
+        :type statuses: Iterable[int], optional
+        :param methods: Http methods that may be retried
+        :type methods: Iterable[str], optional
+        :param respect_retry_after: Wait as long as the ``Retry-After`` header asks for
+        :type respect_retry_after: bool, optional
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.retries: Counter = Counter()
+        """Number of retries per endpoint family"""
+
+    def backoff(self, method: str, attempt: int, status: int = None, headers: Mapping[str, str] = None,
+                exception: BaseException = None) -> Union[float, None]:
+        """Decide whether a failed attempt is retried
+
+        :param method: The http method of the request
+        :type method: str
+        :param attempt: The number of the failed attempt, starting at 1
+        :type attempt: int
+        :param status: The status code of the response, if there is one
+        :type status: int, optional
+        :param headers: The headers of the response, if there is one
+        :type headers: Mapping[str, str], optional
+        :param exception: The exception raised by the attempt, if any
+        :type exception: BaseException, optional
+        :return: Seconds to wait before the next attempt or None if the request is not retried
+        :rtype: Union[float, None]
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return None
+        if exception is not None:
+            from aiohttp import ClientConnectionError, ClientPayloadError
+            if not isinstance(exception, (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError)):
+                return None
+        elif status not in self.statuses:
+            return None
+        if self.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.backoff_cap else None
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
@@ -0,0 +1,62 @@
+"""
+Coalescing of identical requests that are in flight at the same time
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time and hands its result to every caller asking for the same key meanwhile.
+
+    The call runs in its own task, so a cancelled caller does not cancel the call for the others. The call is only
+    cancelled once every caller waiting for it is cancelled.
+    """
+
+    def __init__(self):
+        self.__calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+        """Number of callers that joined a call already in flight"""
+
+    def __len__(self) -> int:
+        return len(self.__calls)
+
+    def __forget(self, key: Hashable, call: _Call, _task: asyncio.Task):
+        if self.__calls.get(key) is call:
+            del self.__calls[key]
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the call in flight for the key or start a new one
+
+        :param key: The key identifying equal calls
+        :type key: Hashable
+        :param function: Creates the awaitable of a new call
+        :type function: Callable[[], Awaitable[Any]]
+        :return: The result of the call
+        :rtype: Any
+        """
+        call = self.__calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(function()))
+            self.__calls[key] = call
+            call.task.add_done_callback(lambda task: self.__forget(key, call, task))
+        else:
+            self.coalesced += 1
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # callers arriving after this start a new call instead of joining the cancelled one
+                if self.__calls.get(key) is call:
+                    del self.__calls[key]
+                call.task.cancel()
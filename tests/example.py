@@ -4,9 +4,9 @@ from src.async_faceit_api import FaceitAPI
 
 async def my_task():
     api_key = "..."
-    api = FaceitAPI(api_key)
-    players = await api.search_players("username")
-    print({player.nickname: player.player_id for player in players.items})
+    async with FaceitAPI(api_key) as api:
+        players = await api.search_players("username")
+        print({player.nickname: player.player_id for player in players.items})
 
 
 if __name__ == "__main__":
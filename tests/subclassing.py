@@ -46,14 +46,14 @@ class MyApi(FaceitAPI):
 
 
 async def my_task():
-    api = MyApi()
     player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
-    time = datetime.datetime.now()
-    print(await api.get_played_maps(player_id))
-    print(datetime.datetime.now() - time)
-    time = datetime.datetime.now()
-    print(await api.get_played_maps_parallel(player_id))
-    print(datetime.datetime.now() - time)
+    async with MyApi() as api:
+        time = datetime.datetime.now()
+        print(await api.get_played_maps(player_id))
+        print(datetime.datetime.now() - time)
+        time = datetime.datetime.now()
+        print(await api.get_played_maps_parallel(player_id))
+        print(datetime.datetime.now() - time)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,22 @@
 import os
 import asyncio
+import copy
+import time
+import pickle
+from array import array
 
+from benchmarks.mock_server import MockServer
 from src.async_faceit_api import FaceitAPI
 from dotenv import load_dotenv
+from src.async_faceit_api.cache import ResponseCache
+from src.async_faceit_api.concurrency import AdaptiveLimiter
+from src.async_faceit_api.dataclasses import Collection, FaceitApiError, Player, Rank, RawResponse
 from src.async_faceit_api.enums import Game, Region
+from src.async_faceit_api.frame import StatsFrame
+from src.async_faceit_api.history import MemoryCheckpointStore, SQLiteCheckpointStore
+from src.async_faceit_api.ratelimit import RateLimiter
+from src.async_faceit_api.retry import RetryPolicy
+from src.async_faceit_api.singleflight import SingleFlight
 
 load_dotenv()
 
@@ -165,22 +178,415 @@ async def test_tournament(api: FaceitAPI):
         print("error tournament_teams(tournament_id)")
 
 
+async def test_pagination(api: FaceitAPI):
+    hub_id = "bfbb0657-8694-4278-8007-a7dc58f544af"
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    if not [member async for member in api.iter_hub_members(hub_id)]:
+        print("error iter_hub_members(hub_id)")
+    if not [match async for match in api.iter_player_history(player_id, Game.CS_GO)]:
+        print("error iter_player_history(player_id, game)")
+
+
+async def test_singleflight():
+    flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    first = asyncio.ensure_future(flight.do('key', call))
+    await asyncio.sleep(0)
+    first.cancel()
+    try:
+        await first
+    except asyncio.CancelledError:
+        pass
+    # arrives after the only waiter was cancelled, before the cancelled call finished
+    try:
+        if await flight.do('key', call) != 2:
+            print("error do(key, call) after cancellation joined the cancelled call")
+    except asyncio.CancelledError:
+        print("error do(key, call) after cancellation raised CancelledError")
+
+
+async def test_stats_frame():
+    frame = StatsFrame({
+        'player_id': ['a', 'a', 'b', 'b', 'c'],
+        'map': ['de_dust2', 'de_dust2', 'de_dust2', 'de_inferno', 'de_inferno'],
+        'kills': array('d', [10, 20, 30, 40, 50]),
+    })
+    per_map = frame.group_by('player_id', 'map').per_map()
+    if list(per_map['map']) != ['de_dust2', 'de_inferno'] or list(per_map['rows']) != [2, 2]:
+        print("error group_by(player_id, map).per_map() rows")
+    if list(per_map['kills']) != [22.5, 45]:
+        print("error group_by(player_id, map).per_map() kills")
+
+
+async def test_rate_limiter():
+    try:
+        RateLimiter(rate=0)
+        print("error RateLimiter(rate=0) did not raise ValueError")
+    except ValueError:
+        pass
+    # at most 4 requests in every second, below the quota of 5 per key
+    async with MockServer(key_quota=5) as server:
+        async with FaceitAPI('key', base_url=server.base_url, rate_limiter=RateLimiter(rate=4, burst=1)) as api:
+            start = time.monotonic()
+            players = await asyncio.gather(*[api.player_by_player_id(str(i)) for i in range(8)])
+            if time.monotonic() - start < 1.5:
+                print("error rate_limiter did not space the requests")
+            if not all(players) or server.throttled:
+                print("error rate_limiter requests were throttled by the server")
+
+
+async def test_retry_policy():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    # an error with an empty body is returned as error, also by player_history which renames the from field
+    async with MockServer(failures=1) as server:
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            history = await api.player_history(player_id, Game.CS_GO)
+            if history or history.status_code != 503:
+                print("error player_history(player_id, game) with empty error body")
+    async with MockServer(failures=2) as server:
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+        async with FaceitAPI('key', base_url=server.base_url, retry_policy=policy) as api:
+            if not await api.player_history(player_id, Game.CS_GO):
+                print("error player_history(player_id, game) was not retried")
+            if policy.retries['players/*/history'] != 2:
+                print("error retry_policy.retries")
+    async with MockServer(failures=1, failure_status=429, failure_retry_after='0.3') as server:
+        async with FaceitAPI('key', base_url=server.base_url, retry_policy=RetryPolicy(backoff_base=0.01)) as api:
+            start = time.monotonic()
+            if not await api.match('1-match') or time.monotonic() - start < 0.3:
+                print("error match(match_id) did not wait for Retry-After")
+    async with MockServer(failures=1, failure_status=429, failure_retry_after='60') as server:
+        async with FaceitAPI('key', base_url=server.base_url, retry_policy=RetryPolicy(backoff_cap=1)) as api:
+            if (await api.match('1-match')).status_code != 429:
+                print("error match(match_id) retried a Retry-After above the backoff cap")
+
+
+async def test_shared_responses():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    async with MockServer(latency=0.05) as server:
+        async with FaceitAPI('key', base_url=server.base_url, raw=True, cache=ResponseCache()) as api:
+            first, second = await asyncio.gather(api.player_by_player_id(player_id),
+                                                 api.player_by_player_id(player_id))
+            if server.requests != 1:
+                print("error player_by_player_id(player_id) requests were not coalesced")
+            if first.data is second.data:
+                print("error coalesced callers share the same raw data")
+            first.data['nickname'] = 'MUTATED'
+            if (await api.player_by_player_id(player_id)).data['nickname'] == 'MUTATED':
+                print("error changing a raw response changed the cached response")
+        async with FaceitAPI('key', base_url=server.base_url, cache=ResponseCache()) as api:
+            first, second = await asyncio.gather(api.player_by_player_id(player_id),
+                                                 api.player_by_player_id(player_id))
+            if first.games is second.games:
+                print("error coalesced callers share the same nested dicts")
+            first.games.clear()
+            if not (await api.player_by_player_id(player_id)).games:
+                print("error changing a response changed the cached response")
+
+
+async def test_cache():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    async with MockServer() as server:
+        cache = ResponseCache(ttls={'players/*': 0.2})
+        async with FaceitAPI('key', base_url=server.base_url, cache=cache) as api:
+            await api.player_by_player_id(player_id)
+            if not await api.player_by_player_id(player_id) or server.requests != 1 or cache.stats.hits != 1:
+                print("error player_by_player_id(player_id) was not served from the cache")
+            await api.match('1-match')
+            await api.match('1-match')
+            if server.requests != 3:
+                print("error match(match_id) without ttl was cached")
+            await asyncio.sleep(0.25)
+            await api.player_by_player_id(player_id)
+            if server.requests != 4 or cache.stats.expirations != 1:
+                print("error player_by_player_id(player_id) was served after its ttl")
+
+
+async def test_revalidation():
+    hub_id = "74caad23-077b-4ef3-8b1d-c6a2254dfa75"
+    async with MockServer() as server:
+        cache = ResponseCache(ttls={'hubs/*': 0.05})
+        async with FaceitAPI('key', base_url=server.base_url, cache=cache) as api:
+            await api.hub(hub_id)
+            await asyncio.sleep(0.1)
+            hub = await api.hub(hub_id)
+            if server.requests != 2 or server.not_modified != 1 or cache.stats.revalidations != 1 \
+                    or cache.stats.not_modified != 1 or cache.stats.bytes_saved <= 0:
+                print("error hub(hub_id) was not revalidated with its ETag")
+            if not hub or hub.hub_id != hub_id:
+                print("error hub(hub_id) after 304 Not Modified")
+            if await api.hub(hub_id) is hub or server.requests != 2:
+                print("error hub(hub_id) was not served from the cache after 304 Not Modified")
+            server.hub_version += 1
+            await asyncio.sleep(0.1)
+            hub = await api.hub(hub_id)
+            if server.requests != 3 or server.not_modified != 1 or cache.stats.revalidations != 2 \
+                    or cache.stats.not_modified != 1 or not hub or hub.hub_id != hub_id:
+                print("error hub(hub_id) modified after its ETag")
+
+
+async def test_stale_while_revalidate():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    async with MockServer(latency=0.05) as server:
+        cache = ResponseCache()
+        async with FaceitAPI('key', base_url=server.base_url, cache=cache) as api:
+            api.stale_while_revalidate('players/*', soft_ttl=0.05, hard_ttl=0.5)
+            await api.player_by_player_id(player_id)
+            await asyncio.sleep(0.1)
+            start = time.perf_counter()
+            player = await api.player_by_player_id(player_id)
+            if time.perf_counter() - start >= 0.05 or server.requests != 1 or cache.stats.stale_hits != 1 \
+                    or not player or player.player_id != player_id:
+                print("error player_by_player_id(player_id) did not return the stale response at once")
+            await asyncio.sleep(0.1)
+            if server.requests != 2 or cache.stats.refreshes != 1:
+                print("error player_by_player_id(player_id) was not refreshed in the background")
+            await asyncio.sleep(0.6)
+            start = time.perf_counter()
+            await api.player_by_player_id(player_id)
+            if time.perf_counter() - start < 0.05 or server.requests != 3 or cache.stats.stale_hits != 1:
+                print("error player_by_player_id(player_id) returned a response older than the hard ttl")
+            try:
+                api.stale_while_revalidate('players/*', soft_ttl=10, hard_ttl=5)
+                print("error stale_while_revalidate(endpoint, soft_ttl=10, hard_ttl=5) did not raise ValueError")
+            except ValueError:
+                pass
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            try:
+                api.stale_while_revalidate('players/*', soft_ttl=5, hard_ttl=10)
+                print("error stale_while_revalidate(endpoint, soft_ttl, hard_ttl) without a cache did not raise")
+            except ValueError:
+                pass
+
+
+async def test_key_pool():
+    async with MockServer(key_quota=10) as server:
+        async with FaceitAPI(['key-0', 'key-1', 'key-2'], base_url=server.base_url, retry_policy=RetryPolicy()) as api:
+            matches = await asyncio.gather(*[api.match(f'1-{i}') for i in range(30)])
+            if not all(matches) or server.throttled != 0 or sorted(server.requests_per_key.values()) != [10, 10, 10]:
+                print("error match(match_id) with 3 keys was not spread over the keys")
+            # the quota of every key is used up, the requests wait for the cool-down of the keys after their 429
+            matches = await asyncio.gather(*[api.match(f'2-{i}') for i in range(30)])
+            if not all(matches):
+                print("error match(match_id) with 3 keys did not recover from 429 Too Many Requests")
+            if {f'Bearer key-{i}': key.requests for i, key in enumerate(api.keys)} != server.requests_per_key \
+                    or sum(key.throttled for key in api.keys) != server.throttled \
+                    or any(key.in_flight or key.remaining is None for key in api.keys):
+                print("error api.keys metrics")
+    try:
+        FaceitAPI([])
+        print("error FaceitAPI([]) did not raise ValueError")
+    except ValueError:
+        pass
+
+
+async def test_adaptive_limiter():
+    async with MockServer(latency=0.005) as server:
+        limiter = AdaptiveLimiter(initial=4, max_limit=64)
+        async with FaceitAPI('key', base_url=server.base_url, concurrency_limiter=limiter) as api:
+            matches = await asyncio.gather(*[api.match(f'1-{i}') for i in range(300)])
+            if not all(matches) or limiter.limit <= 4 or limiter.decreases != 0 or limiter.in_flight != 0:
+                print("error AdaptiveLimiter did not raise the limit while the responses were healthy")
+    async with MockServer(latency=0.005, capacity=8) as server:
+        limiter = AdaptiveLimiter(initial=8, max_limit=8)
+        async with FaceitAPI('key', base_url=server.base_url, concurrency_limiter=limiter) as api:
+            matches = await asyncio.gather(*[api.match(f'1-{i}') for i in range(100)])
+            if not all(matches) or server.throttled != 0:
+                print("error AdaptiveLimiter let more requests than its limit in flight")
+    async with MockServer(latency=0.01, capacity=8) as server:
+        limiter = AdaptiveLimiter(initial=32)
+        async with FaceitAPI('key', base_url=server.base_url, concurrency_limiter=limiter,
+                             retry_policy=RetryPolicy(max_attempts=10)) as api:
+            matches = await asyncio.gather(*[api.match(f'1-{i}') for i in range(300)])
+            if not all(matches) or limiter.limit >= 32 or limiter.decreases == 0 \
+                    or limiter.throttled != server.throttled:
+                print("error AdaptiveLimiter did not cut the limit on 429 Too Many Requests")
+
+
+async def test_raw():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    async with MockServer(collection_size=30, failures=1) as server:
+        async with FaceitAPI('key', base_url=server.base_url, raw=True) as api:
+            error = await api.player_by_player_id(player_id)
+            if error or type(error) is not FaceitApiError or error.status_code != 503:
+                print("error player_by_player_id(player_id) in raw mode did not return the error")
+            response = await api.player_by_player_id(player_id)
+            if type(response) is not RawResponse or response.status_code != 200 \
+                    or response.data['player_id'] != player_id:
+                print("error player_by_player_id(player_id) in raw mode")
+            ranking = await api.fetch_all_pages(api.ranking, Game.CS_GO, Region.EU)
+            if len(ranking) != 30 or type(ranking[0]) is not Rank:
+                print("error fetch_all_pages(ranking, game, region) in raw mode")
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            with api.raw_mode():
+                if type(await api.player_by_player_id(player_id)) is not RawResponse:
+                    print("error raw_mode() player_by_player_id(player_id)")
+                with api.raw_mode(False):
+                    if type(await api.player_by_player_id(player_id)) is not Player:
+                        print("error raw_mode(False) player_by_player_id(player_id)")
+            if type(await api.player_by_player_id(player_id)) is not Player:
+                print("error player_by_player_id(player_id) after raw_mode()")
+
+
+async def test_fetch_all_pages():
+    async with MockServer(collection_size=250) as server:
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            ranking = await api.fetch_all_pages(api.ranking, Game.CS_GO, Region.EU, concurrency=4)
+            if [rank.position for rank in ranking] != list(range(1, 251)):
+                print("error fetch_all_pages(ranking, game, region)")
+            try:
+                await api.fetch_all_pages(api.ranking, Game.CS_GO, Region.EU, concurrency=0)
+                print("error fetch_all_pages(ranking, game, region, concurrency=0) did not raise ValueError")
+            except ValueError:
+                pass
+
+
+async def test_player_full_history():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    since = int(time.time()) - 100 * 24 * 3600
+    async with MockServer(collection_size=250) as server:
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            matches = [match async for match in api.player_full_history(player_id, Game.CS_GO, since)]
+            if len({match.match_id for match in matches}) != 250:
+                print("error player_full_history(player_id, game, since) missed or repeated matches")
+            if [match.started_at for match in matches] != sorted((m.started_at for m in matches), reverse=True):
+                print("error player_full_history(player_id, game, since) is not newest first")
+            try:
+                [match async for match in api.player_full_history(player_id, Game.CS_GO, since, concurrency=0)]
+                print("error player_full_history(player_id, game, since, concurrency=0) did not raise ValueError")
+            except ValueError:
+                pass
+
+
+async def test_sync_player_history():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    for store in (MemoryCheckpointStore(), SQLiteCheckpointStore(':memory:')):
+        # the matches of the mock history last 2400 seconds, so a new match starts after the last one finished
+        async with MockServer(collection_size=250, match_interval=3000) as server:
+            async with FaceitAPI('key', base_url=server.base_url) as api:
+                since = int(time.time()) - 260 * 3000
+                if len(await api.sync_player_history(player_id, Game.CS_GO, store, since)) != 250:
+                    print("error sync_player_history(player_id, game, store, since) first synchronization")
+                if await api.sync_player_history(player_id, Game.CS_GO, store):
+                    print("error sync_player_history(player_id, game, store) returned synchronized matches")
+                server.collection_size += 1
+                server.last_match_at += server.match_interval
+                new_matches = await api.sync_player_history(player_id, Game.CS_GO, store)
+                if [match.match_id for match in new_matches] != ['1-251']:
+                    print("error sync_player_history(player_id, game, store) missed the new match")
+                checkpoint = await store.get(player_id, Game.CS_GO.value)
+                if checkpoint is None or checkpoint.match_id != '1-251':
+                    print("error sync_player_history(player_id, game, store) checkpoint")
+
+
+async def test_bulk():
+    match_ids = [f'1-match-{i}' for i in range(10)]
+    async with MockServer(latency=0.1, failures=1) as server:
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            start = time.monotonic()
+            matches = await api.matches_many(match_ids, concurrency=2)
+            if time.monotonic() - start < 0.5:
+                print("error matches_many(match_ids, concurrency=2) exceeded the concurrency")
+            if matches[0] or matches[0].status_code != 503 or [m.match_id for m in matches[1:]] != match_ids[1:]:
+                print("error matches_many(match_ids) partial results")
+            retrieved = {match_id async for match_id, _ in api.matches_as_completed(match_ids, concurrency=5)}
+            if retrieved != set(match_ids):
+                print("error matches_as_completed(match_ids)")
+            if any(stats or stats.status_code != 504 for stats in
+                   await api.match_stats_many(match_ids, concurrency=10, deadline=0.05)):
+                print("error match_stats_many(match_ids, deadline) did not time out")
+            try:
+                await api.players_many(['player'], concurrency=0)
+                print("error players_many(player_ids, concurrency=0) did not raise ValueError")
+            except ValueError:
+                pass
+
+
+async def test_pipeline():
+    player_id = "a5ae3596-697d-4f08-af16-4584a7c93ab2"
+    async with MockServer(collection_size=30) as server:
+        async with FaceitAPI('key', base_url=server.base_url) as api:
+            results = [result async for result in api.player_history_pipeline(player_id, Game.CS_GO)]
+            if len(results) != 30 or any(player_match.match_id != stats.rounds[0].match_id
+                                         for player_match, _, stats in results):
+                print("error player_history_pipeline(player_id, game)")
+            try:
+                api.player_history_pipeline(player_id, Game.CS_GO, match_concurrency=0)
+                print("error player_history_pipeline(player_id, game, match_concurrency=0) did not raise ValueError")
+            except ValueError:
+                pass
+
+
+async def test_lazy():
+    data = {"player_id": "p", "nickname": "before", "games": {"cs2": {"skill_level": 5}}}
+    player = Player.lazy(data)
+    player.nickname = "after"
+    if player.player_id != "p" or player.nickname != "after":
+        print("error Player.lazy(data) set before the first read")
+    player = Player.lazy(data)
+    if player.nickname != "before" or type(player) is not Player:
+        print("error Player.lazy(data)")
+    player = pickle.loads(pickle.dumps(Player.lazy(data)))
+    if player.nickname != "before" or player.games["cs2"]["skill_level"] != 5:
+        print("error pickle Player.lazy(data)")
+
+
+class NotedPlayer(Player):
+    pass
+
+
+async def test_serialization():
+    player = NotedPlayer(player_id="p", nickname="a", games={"cs2": {"skill_level": 5}})
+    player.note = ["b"]
+    for copied in (pickle.loads(pickle.dumps(player)), copy.copy(player), copy.deepcopy(player)):
+        if type(copied) is not NotedPlayer or copied.note != ["b"] or copied.to_dict() != player.to_dict():
+            print("error copying a subclass of Player with a __dict__")
+    collection = Collection(items=[player], start=0, end=1)
+    copied = Collection.from_dict(collection.to_dict(), NotedPlayer)
+    if type(copied.items[0]) is not NotedPlayer or copied.items[0].to_dict() != player.to_dict():
+        print("error Collection.from_dict(data, item_class)")
+
+
 async def test_task():
-    api = FaceitAPI(os.getenv('faceit_api_key'))
-
-    await asyncio.gather(
-        test_championship(api),
-        test_games(api),
-        test_hub(api),
-        test_leaderboards(api),
-        test_match(api),
-        test_organizer(api),
-        test_player(api),
-        test_ranking(api),
-        test_search(api),
-        test_teams(api),
-        test_tournament(api)
-    )
+    async with FaceitAPI(os.getenv('faceit_api_key')) as api:
+        await asyncio.gather(
+            test_championship(api),
+            test_games(api),
+            test_hub(api),
+            test_leaderboards(api),
+            test_match(api),
+            test_organizer(api),
+            test_player(api),
+            test_ranking(api),
+            test_search(api),
+            test_teams(api),
+            test_tournament(api),
+            test_pagination(api),
+            test_singleflight(),
+            test_stats_frame(),
+            test_rate_limiter(),
+            test_retry_policy(),
+            test_shared_responses(),
+            test_cache(),
+            test_revalidation(),
+            test_stale_while_revalidate(),
+            test_key_pool(),
+            test_adaptive_limiter(),
+            test_raw(),
+            test_fetch_all_pages(),
+            test_player_full_history(),
+            test_sync_player_history(),
+            test_bulk(),
+            test_pipeline(),
+            test_lazy(),
+            test_serialization()
+        )
 
 
 if __name__ == "__main__":